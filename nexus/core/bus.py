@@ -3,6 +3,7 @@ Asynchronous event bus (NexusBus) for the NEXUS system.
 
 This bus is the single communication channel across services. It provides:
 - publish(topic, message): non-blocking message enqueue per topic
+- publish_batch(topic, messages): enqueue several messages with one lookup
 - subscribe(topic, handler): register async handlers to consume messages
 - run_forever(): spawn a listener per topic and run them concurrently
 
@@ -21,6 +22,9 @@ from .models import Message
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of queued messages a listener dispatches per wakeup
+LISTENER_DRAIN_LIMIT = 64
+
 
 class NexusBus:
     """Asynchronous, non-blocking event bus with per-topic queues and subscribers."""
@@ -32,11 +36,33 @@ class NexusBus:
         self._subscribers: dict[str, list[Callable[[Message], Awaitable[None]]]] = {}
         logger.debug("NexusBus initialized with no topics/subscribers")
 
-    async def publish(self, topic: str, message: Message) -> None:
+    async def publish(
+        self, topic: str, message: Message, *, direct: bool = False
+    ) -> None:
         """Publish a message to a topic if the topic queue exists.
 
         This is non-blocking with respect to subscribers: it only enqueues.
+        Topic queues are unbounded, so the enqueue never suspends and callers
+        awaiting publish() do not wait on any downstream handler.
+
+        With direct=True the topic's handlers are scheduled immediately instead
+        of going through the topic queue and its listener, saving one event-loop
+        hop. Use it only for topics whose publishers always pass direct=True, so
+        messages on the topic keep their order.
         """
+        if direct:
+            handlers = self._subscribers.get(topic)
+            if not handlers:
+                logger.debug(
+                    "Dropping message for topic without subscribers: topic=%s run_id=%s msg_id=%s",
+                    topic,
+                    getattr(message, "run_id", None),
+                    getattr(message, "id", None),
+                )
+                return
+            self._schedule_handlers(topic, message, handlers)
+            return
+
         queue = self._queues.get(topic)
         if queue is None:
             logger.debug(
@@ -46,7 +72,7 @@ class NexusBus:
                 getattr(message, "id", None),
             )
             return
-        await queue.put(message)
+        queue.put_nowait(message)
         logger.info(
             "Published message: topic=%s run_id=%s msg_id=%s",
             topic,
@@ -54,6 +80,24 @@ class NexusBus:
             getattr(message, "id", None),
         )
 
+    async def publish_batch(self, topic: str, messages: list[Message]) -> None:
+        """Publish several messages to a topic in order with a single queue lookup.
+
+        Equivalent to calling publish() for each message, minus the per-message
+        queue lookup and log line.
+        """
+        queue = self._queues.get(topic)
+        if queue is None:
+            logger.debug(
+                "Dropping %d messages for topic without queue: topic=%s",
+                len(messages),
+                topic,
+            )
+            return
+        for message in messages:
+            queue.put_nowait(message)
+        logger.info("Published batch of %d messages: topic=%s", len(messages), topic)
+
     def subscribe(
         self, topic: str, handler: Callable[[Message], Awaitable[None]]
     ) -> None:
@@ -94,33 +138,54 @@ class NexusBus:
         await asyncio.gather(*tasks)
 
     async def _listener(self, topic: str, queue: asyncio.Queue) -> None:
-        """Continuously consume messages from a topic queue and fan-out to handlers."""
+        """Continuously consume messages from a topic queue and fan-out to handlers.
+
+        After each wakeup the listener drains up to LISTENER_DRAIN_LIMIT messages
+        that are already queued with get_nowait(), so a burst is dispatched in one
+        pass instead of one awaited get() per message.
+        """
         while True:
             message: Message = await queue.get()
-            try:
-                handlers = self._subscribers.get(topic, [])
-                logger.debug(
-                    "Message received on topic=%s run_id=%s msg_id=%s; dispatching to %d handlers",
-                    topic,
-                    getattr(message, "run_id", None),
-                    getattr(message, "id", None),
-                    len(handlers),
-                )
-                for handler in handlers:
-                    task: asyncio.Task[None] = asyncio.ensure_future(handler(message))
-
-                    # Attach a done callback to surface exceptions for observability
-                    def _done_cb(t: asyncio.Task, msg: Message = message) -> None:
-                        exc = t.exception()
-                        if exc is not None:
-                            logger.exception(
-                                "Subscriber handler raised on topic=%s run_id=%s msg_id=%s: %s",
-                                topic,
-                                getattr(msg, "run_id", None),
-                                getattr(msg, "id", None),
-                                exc,
-                            )
-
-                    task.add_done_callback(_done_cb)
-            finally:
-                queue.task_done()
+            self._dispatch(topic, queue, message)
+            drained = 1
+            while drained < LISTENER_DRAIN_LIMIT and not queue.empty():
+                self._dispatch(topic, queue, queue.get_nowait())
+                drained += 1
+
+    def _dispatch(self, topic: str, queue: asyncio.Queue, message: Message) -> None:
+        """Schedule every handler of topic for message and mark it done on queue."""
+        try:
+            self._schedule_handlers(topic, message, self._subscribers.get(topic, []))
+        finally:
+            queue.task_done()
+
+    def _schedule_handlers(
+        self,
+        topic: str,
+        message: Message,
+        handlers: list[Callable[[Message], Awaitable[None]]],
+    ) -> None:
+        """Run each handler for message in its own task, logging failures."""
+        logger.debug(
+            "Message received on topic=%s run_id=%s msg_id=%s; dispatching to %d handlers",
+            topic,
+            getattr(message, "run_id", None),
+            getattr(message, "id", None),
+            len(handlers),
+        )
+        for handler in handlers:
+            task: asyncio.Task[None] = asyncio.ensure_future(handler(message))
+
+            # Attach a done callback to surface exceptions for observability
+            def _done_cb(t: asyncio.Task, msg: Message = message) -> None:
+                exc = t.exception()
+                if exc is not None:
+                    logger.exception(
+                        "Subscriber handler raised on topic=%s run_id=%s msg_id=%s: %s",
+                        topic,
+                        getattr(msg, "run_id", None),
+                        getattr(msg, "id", None),
+                        exc,
+                    )
+
+            task.add_done_callback(_done_cb)
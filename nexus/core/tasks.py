@@ -0,0 +1,61 @@
+"""
+Tracked background tasks for timer-driven flushes.
+
+Services that flush buffers from loop timer callbacks cannot await the flush,
+so they start it as a task. The event loop only keeps weak references to
+tasks, so an unreferenced one can be garbage-collected before it finishes,
+and its failure would surface only as "Task exception was never retrieved".
+BackgroundTasks holds a reference to each task until it completes, logs any
+exception it raises, and lets the owning service wait for the ones still
+running at shutdown.
+"""
+
+import asyncio
+import logging
+from collections.abc import Coroutine
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+
+class BackgroundTasks:
+    """A set of running tasks that logs their failures and can be drained."""
+
+    def __init__(self) -> None:
+        self._tasks: set[asyncio.Task[Any]] = set()
+
+    def __len__(self) -> int:
+        return len(self._tasks)
+
+    def spawn(
+        self, coro: Coroutine[Any, Any, Any], description: str
+    ) -> asyncio.Task[Any]:
+        """Start coro as a task and hold it until it finishes.
+
+        Args:
+            coro: The coroutine to run
+            description: What the task does, used in the failure log
+        """
+        task = asyncio.ensure_future(coro)
+        self._tasks.add(task)
+
+        def _done_cb(t: asyncio.Task[Any]) -> None:
+            self._tasks.discard(t)
+            if t.cancelled():
+                return
+            exc = t.exception()
+            if exc is not None:
+                logger.error(
+                    "Background task failed: %s: %s",
+                    description,
+                    exc,
+                    exc_info=exc,
+                )
+
+        task.add_done_callback(_done_cb)
+        return task
+
+    async def drain(self) -> None:
+        """Wait for every task still running, including ones they start."""
+        while self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
@@ -66,6 +66,13 @@ class Topics:
     Message content: {"event": str, "run_id": str, "payload": Dict}
     """
 
+    UI_EVENTS_BATCH = "ui.events.batch"
+    """
+    Published by the Orchestrator when UI event batching is enabled, carrying
+    several UI_EVENTS messages (possibly of different runs) in emission order.
+    Message content: List[Message] (each with UI_EVENTS content)
+    """
+
     # --- Command System Topics ---
     SYSTEM_COMMAND = "system.command"
     """
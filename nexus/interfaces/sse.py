@@ -25,6 +25,13 @@ from nexus.core.topics import Topics
 
 logger = logging.getLogger(__name__)
 
+# Pre-built SSE frame for text_chunk events; only run_id and chunk are encoded per
+# event. Matches json.dumps output for {"event", "run_id", "payload": {"chunk"}}.
+TEXT_CHUNK_SSE_FRAME = (
+    'event: text_chunk\ndata: {"event": "text_chunk", "run_id": %s, '
+    '"payload": {"chunk": %s}}\n\n'
+)
+
 
 class SSEInterface:
     """
@@ -67,8 +74,11 @@ class SSEInterface:
     def subscribe_to_bus(self) -> None:
         """Subscribe to relevant bus topics for UI event routing."""
         self.bus.subscribe(Topics.UI_EVENTS, self.handle_ui_event)
+        self.bus.subscribe(Topics.UI_EVENTS_BATCH, self.handle_ui_event_batch)
         self.bus.subscribe(Topics.COMMAND_RESULT, self.handle_command_result)
-        logger.info("SSEInterface subscribed to UI_EVENTS and COMMAND_RESULT")
+        logger.info(
+            "SSEInterface subscribed to UI_EVENTS, UI_EVENTS_BATCH and COMMAND_RESULT"
+        )
 
     async def handle_ui_event(self, message: Message) -> None:
         """
@@ -95,6 +105,16 @@ class SSEInterface:
         except Exception as e:
             logger.error(f"SSE: Error handling UI event: {e}")
 
+    async def handle_ui_event_batch(self, message: Message) -> None:
+        """
+        Handle a batch of UI events, routing each in order.
+
+        Args:
+            message: Message whose content is a list of UI event Messages
+        """
+        for ui_event in message.content:
+            await self.handle_ui_event(ui_event)
+
     async def handle_command_result(self, message: Message) -> None:
         """
         Handle command results and route them to the appropriate SSE stream.
@@ -278,6 +298,21 @@ class SSEInterface:
         Returns:
             Formatted SSE event string
         """
+        # Fast path for streamed text chunks: skip serializing the constant shell
+        if event_type == "text_chunk" and isinstance(data, dict) and len(data) == 3:
+            payload = data.get("payload")
+            if (
+                data.get("event") == "text_chunk"
+                and "run_id" in data
+                and isinstance(payload, dict)
+                and len(payload) == 1
+                and isinstance(payload.get("chunk"), str)
+            ):
+                return TEXT_CHUNK_SSE_FRAME % (
+                    json.dumps(data["run_id"]),
+                    json.dumps(payload["chunk"]),
+                )
+
         json_data = json.dumps(data) if not isinstance(data, str) else data
         return f"event: {event_type}\ndata: {json_data}\n\n"
 
@@ -8,6 +8,7 @@ long-lived tasks concurrently.
 import asyncio
 import logging
 import os
+from concurrent.futures import ThreadPoolExecutor
 
 from dotenv import load_dotenv
 from fastapi import FastAPI, HTTPException
@@ -24,8 +25,11 @@ from nexus.services.identity import IdentityService
 from nexus.services.llm.service import LLMService
 from nexus.services.memory_learning import MemoryLearningService
 from nexus.services.orchestrator import OrchestratorService
-from nexus.services.persistence import PersistenceService
-from nexus.services.tool_executor import ToolExecutorService
+from nexus.services.persistence import (
+    DEFAULT_PERSISTENCE_LINGER_MS,
+    PersistenceService,
+)
+from nexus.services.tool_executor import DEFAULT_TOOL_POOL_SIZE, ToolExecutorService
 from nexus.tools.registry import ToolRegistry
 
 
@@ -85,6 +89,17 @@ async def main() -> None:
     tool_registry.discover_and_register("nexus.tools.definition")
     logger.info("Tools auto-discovery and registration completed")
 
+    # Sync tools run on a dedicated pool rather than the loop's default
+    # executor; tools are registered and bound to it, so no changes after this
+    tool_pool = ThreadPoolExecutor(
+        max_workers=config_service.get_int(
+            "system.tool_pool_size", DEFAULT_TOOL_POOL_SIZE
+        ),
+        thread_name_prefix="nexus-tool",
+    )
+    tool_registry.set_executor(tool_pool)
+    tool_registry.freeze()
+
     # 6) Instantiate services and interfaces with proper dependency injection
     # Order matters: dependencies must be created before dependents
 
@@ -93,7 +108,16 @@ async def main() -> None:
 
     # Persistence service depends on database service only
     # (Identity gating is handled by OrchestratorService)
-    persistence_service = PersistenceService(database_service)
+    persistence_service = PersistenceService(
+        database_service,
+        linger=config_service.get_int(
+            "system.persistence_linger_ms", DEFAULT_PERSISTENCE_LINGER_MS
+        )
+        / 1000,
+        hot_path_silent=config_service.get_bool(
+            "system.persistence_hot_path_silent", False
+        ),
+    )
 
     # Other services
     llm_service = LLMService(bus, config_service)
@@ -253,6 +277,14 @@ async def main() -> None:
         await asyncio.gather(bus_task, server.serve())
     except asyncio.CancelledError:
         logger.info("Shutdown requested; cancelling tasks...")
+        # Finish the orchestrator's timer-started and buffered UI publishes,
+        # publish pending tool results and stop the tool worker threads, then
+        # write messages still waiting in the persistence batch; all run while
+        # the bus is still delivering
+        await orchestrator_service.aclose()
+        await tool_executor_service.aclose()
+        tool_pool.shutdown(wait=False, cancel_futures=True)
+        await persistence_service.flush()
         bus_task.cancel()
         await server.shutdown()
         # Best-effort wait for cancellations
@@ -261,4 +293,11 @@ async def main() -> None:
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    # Run on uvloop when available (installed with uvicorn[standard] on
+    # non-Windows platforms); it cuts event-loop overhead for the bus handlers
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(main())
+    else:
+        uvloop.run(main())
@@ -66,6 +66,9 @@ class ContextBuilder:
         self.config_service = config_service
         self.persistence_service = persistence_service
         self.prompt_manager = PromptManager(config_service)
+        # (tool definitions, formatted [CAPABILITIES]) of the last build; the
+        # tool set only changes when the registry does, unlike history
+        self._capabilities_cache: tuple[list[dict[str, Any]], str] | None = None
         logger.info("ContextBuilder initialized")
 
     def subscribe_to_bus(self) -> None:
@@ -133,7 +136,11 @@ class ContextBuilder:
                 content={"status": "success", "messages": messages, "tools": tools},
             )
 
-            await self.bus.publish(Topics.CONTEXT_BUILD_RESPONSE, response_message)
+            # ContextBuilder is the only publisher of this topic, so direct
+            # dispatch hands the context to the orchestrator without a queue hop
+            await self.bus.publish(
+                Topics.CONTEXT_BUILD_RESPONSE, response_message, direct=True
+            )
             logger.info(f"Published context build response for run_id={run.id}")
 
         except Exception as e:
@@ -181,11 +188,11 @@ class ContextBuilder:
         # Build each section
         messages = [
             {"role": "system", "content": self.prompt_manager.get_core_identity()},
+            {"role": "user", "content": self._get_capabilities_prompt(tools)},
             {
                 "role": "user",
-                "content": self.prompt_manager.get_capabilities_prompt(tools),
+                "content": MemoryFormatter.format_shared_memory(history),
             },
-            {"role": "user", "content": MemoryFormatter.format_shared_memory(history)},
             {
                 "role": "user",
                 "content": FriendsInfoFormatter.format_friends_info(user_profile),
@@ -205,6 +212,20 @@ class ContextBuilder:
         )
         return messages
 
+    def _get_capabilities_prompt(self, tools: list[dict[str, Any]]) -> str:
+        """
+        Return the [CAPABILITIES] block, reformatting only when the tools change.
+
+        The registry hands out the same definition objects until a tool is
+        (un)registered, so the list comparison is usually identity checks.
+        """
+        cached = self._capabilities_cache
+        if cached is not None and cached[0] == tools:
+            return cached[1]
+        prompt = self.prompt_manager.get_capabilities_prompt(tools)
+        self._capabilities_cache = (tools, prompt)
+        return prompt
+
     async def _get_history(
         self, owner_key: str, current_run_id: str = ""
     ) -> list[dict[str, Any]]:
@@ -267,4 +288,6 @@ class ContextBuilder:
             role=Role.SYSTEM,
             content={"status": "error", "messages": [], "tools": []},
         )
-        await self.bus.publish(Topics.CONTEXT_BUILD_RESPONSE, error_message)
+        await self.bus.publish(
+            Topics.CONTEXT_BUILD_RESPONSE, error_message, direct=True
+        )
@@ -57,6 +57,25 @@ class DatabaseProvider(ABC):
         """
         pass
 
+    def insert_messages(self, messages: list[Message]) -> bool:
+        """Insert several messages into the database.
+
+        Providers with a native bulk insert should override this; the default
+        inserts the messages one by one.
+
+        Args:
+            messages: The Message objects to be persisted
+
+        Returns:
+            bool: True if every insertion was successful, False otherwise
+
+        Note:
+            This is a synchronous method. The calling service should wrap
+            this in asyncio.to_thread() for async execution.
+        """
+        results = [self.insert_message(message) for message in messages]
+        return all(results)
+
     @abstractmethod
     def get_messages_by_owner_key(
         self, owner_key: str, limit: int = 20
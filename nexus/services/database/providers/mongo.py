@@ -132,6 +132,41 @@ class MongoProvider(DatabaseProvider):
         except Exception as e:
             return self._handle_unexpected_error("message insertion", e)
 
+    def insert_messages(self, messages: list[Message]) -> bool:
+        """Insert several messages into the MongoDB messages collection at once.
+
+        Args:
+            messages: The Message objects to be persisted
+
+        Returns:
+            bool: True if all messages were inserted, False otherwise
+        """
+        if self.messages_collection is None:
+            logger.error("MongoDB not connected. Cannot insert messages.")
+            return False
+        if not messages:
+            return True
+
+        try:
+            # model_dump keeps timestamps as datetime, which MongoDB stores natively
+            result = self.messages_collection.insert_many(
+                [message.model_dump() for message in messages], ordered=False
+            )
+
+            if len(result.inserted_ids) == len(messages):
+                logger.info(f"Inserted {len(messages)} messages in one batch")
+                return True
+            else:
+                logger.error(
+                    f"Inserted {len(result.inserted_ids)} of {len(messages)} messages"
+                )
+                return False
+
+        except OperationFailure as e:
+            return self._handle_operation_failure("bulk message insertion", e)
+        except Exception as e:
+            return self._handle_unexpected_error("bulk message insertion", e)
+
     def get_messages_by_owner_key(
         self, owner_key: str, limit: int = 20
     ) -> list[dict[str, Any]]:
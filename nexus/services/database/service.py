@@ -148,6 +148,28 @@ class DatabaseService:
             logger.error(f"Error during async message insertion: {e}")
             return False
 
+    async def insert_messages_async(self, messages: list[Message]) -> bool:
+        """Asynchronously insert several messages with a single database call.
+
+        Args:
+            messages: The message objects to insert
+
+        Returns:
+            bool: True if all insertions were successful, False otherwise
+        """
+        if not self.is_connected() or not self.provider:
+            logger.error("Database not connected. Cannot insert messages.")
+            return False
+
+        try:
+            # Use asyncio.to_thread to run the sync database operation
+            result = await asyncio.to_thread(self.provider.insert_messages, messages)
+            return result
+
+        except Exception as e:
+            logger.error(f"Error during async bulk message insertion: {e}")
+            return False
+
     async def get_history_by_owner_key(
         self, owner_key: str, limit: int = 20
     ) -> list[dict[str, Any]]:
@@ -27,7 +27,10 @@ into Run metadata for registered members.
 """
 
 import asyncio
+import copy
 import logging
+import time
+from collections import OrderedDict
 from datetime import UTC, datetime
 from typing import Any
 
@@ -35,6 +38,12 @@ from nexus.services.database.service import DatabaseService
 
 logger = logging.getLogger(__name__)
 
+# Seconds an identity lookup is served from the in-process cache. Writes made
+# through this service invalidate the entry immediately.
+IDENTITY_CACHE_TTL = 60.0
+# Most identities kept in that cache; the least recently used are evicted
+IDENTITY_CACHE_SIZE = 1024
+
 # Note: Prompt modules are now dynamically read from config.
 # In v2 architecture, only 'friends_profile' is stored in config.
 # CORE_IDENTITY and other context blocks are generated by ContextBuilder.
@@ -54,8 +63,16 @@ class IdentityService:
             db_service: DatabaseService instance for identity persistence
         """
         self.db_service = db_service
+        # LRU of public_key -> (fetched_at, identity) for repeated gatekeeper lookups
+        self._identity_cache: OrderedDict[str, tuple[float, dict[str, Any]]] = (
+            OrderedDict()
+        )
         logger.info("IdentityService initialized")
 
+    def _invalidate_identity(self, public_key: str) -> None:
+        """Drop a cached identity after it has been written."""
+        self._identity_cache.pop(public_key, None)
+
     async def get_identity(self, public_key: str) -> dict[str, Any] | None:
         """Retrieve an identity by its public key.
 
@@ -67,6 +84,15 @@ class IdentityService:
         """
         logger.debug(f"Retrieving identity for public_key={public_key}")
 
+        # Serve repeated lookups (one per run) from the cache while fresh.
+        # Callers get a deep copy so nested overrides never alias the cache.
+        cached = self._identity_cache.get(public_key)
+        if cached is not None:
+            if time.monotonic() - cached[0] < IDENTITY_CACHE_TTL:
+                self._identity_cache.move_to_end(public_key)
+                return copy.deepcopy(cached[1])
+            del self._identity_cache[public_key]
+
         if not self.db_service.provider:
             logger.error("Database provider not initialized")
             return None
@@ -76,12 +102,19 @@ class IdentityService:
             self.db_service.provider.find_identity_by_public_key, public_key
         )
 
-        if identity:
-            logger.info(f"Identity found for public_key={public_key}")
-        else:
+        if not identity:
+            # Misses are not cached: visitors probing arbitrary keys would
+            # otherwise fill the cache
             logger.debug(f"No identity found for public_key={public_key}")
+            return None
+
+        logger.info(f"Identity found for public_key={public_key}")
+        self._identity_cache[public_key] = (time.monotonic(), identity)
+        self._identity_cache.move_to_end(public_key)
+        while len(self._identity_cache) > IDENTITY_CACHE_SIZE:
+            self._identity_cache.popitem(last=False)
 
-        return identity
+        return copy.deepcopy(identity)
 
     async def create_identity(
         self, public_key: str, metadata: dict[str, Any] | None = None
@@ -114,6 +147,7 @@ class IdentityService:
         success = await asyncio.to_thread(
             self.db_service.provider.create_identity, identity_data
         )
+        self._invalidate_identity(public_key)
 
         if success:
             logger.info(f"Successfully created identity for public_key={public_key}")
@@ -222,6 +256,7 @@ class IdentityService:
             "config_overrides",
             config_overrides,
         )
+        self._invalidate_identity(public_key)
 
         if success:
             logger.info(
@@ -258,6 +293,7 @@ class IdentityService:
             "prompt_overrides",
             prompt_overrides,
         )
+        self._invalidate_identity(public_key)
 
         if success:
             logger.info(
@@ -402,6 +438,7 @@ class IdentityService:
         success = await asyncio.to_thread(
             self.db_service.provider.delete_identity, public_key
         )
+        self._invalidate_identity(public_key)
 
         if success:
             logger.info(f"Successfully deleted identity for public_key={public_key}")
@@ -17,7 +17,8 @@ Key responsibilities:
 - Safety valve enforcement: Limits tool calling iterations (configurable max_tool_iterations)
   to prevent infinite loops
 - History management: Maintains run history with AI messages and tool results for
-  multi-turn tool interactions
+  multi-turn tool interactions; follow-up LLM calls extend the first call's full
+  context (system prompt, memory, moment) with each finished tool turn
 - Event forwarding: Relays streaming events (text_chunk, tool_call_started) from
   LLM_RESULTS to UI_EVENTS to preserve ordering through a single UI gateway
 
@@ -27,47 +28,170 @@ LLM_REQUESTS → LLM_RESULTS → (tool calls?) → TOOLS_REQUESTS → TOOLS_RESU
 LLM_REQUESTS (loop) → UI_EVENTS (run_finished)
 """
 
+import asyncio
 import json
 import logging
 import os
-from typing import Any
+from collections import deque
+from typing import Any, Final
 
 from nexus.core.bus import NexusBus
 from nexus.core.models import Message, Role, Run, RunStatus
+from nexus.core.tasks import BackgroundTasks
 from nexus.core.topics import Topics
 from nexus.services.config import ConfigService
 
 logger = logging.getLogger(__name__)
 
 # Constants for UI event standardization
-UI_EVENT_TEXT_CHUNK = "text_chunk"
-UI_EVENT_RUN_STARTED = "run_started"
-UI_EVENT_RUN_FINISHED = "run_finished"
-UI_EVENT_TOOL_CALL_STARTED = "tool_call_started"
-UI_EVENT_TOOL_CALL_FINISHED = "tool_call_finished"
-CONTEXT_STATUS_SUCCESS = "success"
+UI_EVENT_TEXT_CHUNK: Final = "text_chunk"
+UI_EVENT_RUN_STARTED: Final = "run_started"
+UI_EVENT_RUN_FINISHED: Final = "run_finished"
+UI_EVENT_TOOL_CALL_STARTED: Final = "tool_call_started"
+UI_EVENT_TOOL_CALL_FINISHED: Final = "tool_call_finished"
+UI_EVENT_ERROR: Final = "error"
+CONTEXT_STATUS_SUCCESS: Final = "success"
 
 # Constants for LLM message roles
-LLM_ROLE_ASSISTANT = "assistant"
-LLM_ROLE_TOOL = "tool"
-LLM_ROLE_USER = "user"
+LLM_ROLE_ASSISTANT: Final = "assistant"
+LLM_ROLE_TOOL: Final = "tool"
+LLM_ROLE_USER: Final = "user"
+
+# Coalescing of streamed text_chunk events: a burst is flushed as one UI event
+# once TEXT_CHUNK_BATCH_SIZE chunks are buffered or the window elapses
+TEXT_CHUNK_BATCH_WINDOW: Final = 0.004  # seconds
+TEXT_CHUNK_BATCH_SIZE: Final = 8
+
+# UI event batching: events linger up to system.ui_event_linger_us (0 disables)
+# and are published together on UI_EVENTS_BATCH, early once the batch is full
+DEFAULT_UI_EVENT_LINGER_US: Final = 0
+UI_EVENT_BATCH_SIZE: Final = 64
+
+# Tool results estimated above this JSON size are serialized off the event loop
+TOOL_RESULT_OFFLOAD_THRESHOLD: Final = 16_384  # bytes
+
+# Default cap on tracked runs; the oldest admitted runs are evicted beyond it
+DEFAULT_MAX_ACTIVE_RUNS: Final = 10_000
+
+# Enum members bound once at import: attribute access on an Enum class goes
+# through a descriptor, which shows up on handlers invoked per message
+_ROLE_AI: Final = Role.AI
+_ROLE_HUMAN: Final = Role.HUMAN
+_ROLE_SYSTEM: Final = Role.SYSTEM
+_ROLE_TOOL: Final = Role.TOOL
+_STATUS_AWAITING_LLM_DECISION: Final = RunStatus.AWAITING_LLM_DECISION
+_STATUS_AWAITING_TOOL_RESULT: Final = RunStatus.AWAITING_TOOL_RESULT
+_STATUS_BUILDING_CONTEXT: Final = RunStatus.BUILDING_CONTEXT
+_STATUS_COMPLETED: Final = RunStatus.COMPLETED
+_STATUS_FAILED: Final = RunStatus.FAILED
+_STATUS_TIMED_OUT: Final = RunStatus.TIMED_OUT
+
+
+def _serialize_content(value: Any) -> str:
+    """Serialize non-string message content to a JSON string (str() as last resort)."""
+    try:
+        return json.dumps(value, ensure_ascii=False)
+    except Exception:
+        return str(value)
+
+
+def _estimate_json_size(value: Any, limit: int) -> int:
+    """Cheaply estimate the JSON size of value, stopping once limit is exceeded."""
+    size = 0
+    stack = [value]
+    while stack and size <= limit:
+        item = stack.pop()
+        if isinstance(item, str | bytes):
+            size += len(item) + 2
+        elif isinstance(item, dict):
+            size += 2
+            for key, val in item.items():
+                size += len(key) + 4 if isinstance(key, str) else 8
+                stack.append(val)
+        elif isinstance(item, list | tuple):
+            size += 2 + len(item)
+            stack.extend(item)
+        else:
+            size += 8
+    return size
 
 
 class OrchestratorService:
     def __init__(
-        self, bus: NexusBus, config_service: ConfigService, identity_service=None
+        self,
+        bus: NexusBus,
+        config_service: ConfigService,
+        identity_service: Any = None,
     ):
         self.bus = bus
         self.config_service = config_service
         self.identity_service = identity_service
         # Track active runs by run_id
         self.active_runs: dict[str, Run] = {}
+        # Admission order of run_ids, used to evict runs that never reach a terminal state
+        self._run_admissions: deque[str] = deque()
+        self.max_active_runs = config_service.get_int(
+            "system.max_active_runs", DEFAULT_MAX_ACTIVE_RUNS
+        )
+        # Per-run text_chunk micro-batches and their pending flush timers
+        self._chunk_buffers: dict[str, list[str]] = {}
+        self._chunk_flush_handles: dict[str, asyncio.TimerHandle] = {}
+        # Publishes started from flush timers, held until they finish
+        self._background = BackgroundTasks()
+        # Outstanding tool results per run awaiting the follow-up LLM call
+        self._pending_tool_calls: dict[str, int] = {}
         # Get max tool iterations from config
         self.max_tool_iterations = config_service.get_int(
             "system.max_tool_iterations", 5
         )
+        # Role -> converter used by _convert_history_to_llm_messages
+        self._history_converters = {
+            _ROLE_HUMAN: self._human_message_to_llm,
+            _ROLE_AI: self._ai_message_to_llm,
+            _ROLE_TOOL: self._tool_message_to_llm,
+        }
+        # Buffered UI events awaiting a batched publish
+        self._ui_buffer: list[Message] = []
+        self._ui_flush_handle: asyncio.TimerHandle | None = None
+        self.ui_event_linger = (
+            config_service.get_int(
+                "system.ui_event_linger_us", DEFAULT_UI_EVENT_LINGER_US
+            )
+            / 1_000_000
+        )
         logger.info("OrchestratorService initialized")
 
+    def _admit_run(self, run: Run) -> None:
+        """Track run as active, evicting the oldest runs beyond max_active_runs.
+
+        Runs that stall (e.g. a tool result that never arrives) are never removed
+        by the normal flow; bounding the registry keeps such leaks from growing
+        without limit in long-running deployments.
+        """
+        self.active_runs[run.id] = run
+        self._run_admissions.append(run.id)
+
+        while len(self.active_runs) > self.max_active_runs and self._run_admissions:
+            run_id = self._run_admissions.popleft()
+            if self.active_runs.pop(run_id, None) is None:
+                continue
+            self._pending_tool_calls.pop(run_id, None)
+            self._chunk_buffers.pop(run_id, None)
+            handle = self._chunk_flush_handles.pop(run_id, None)
+            if handle is not None:
+                handle.cancel()
+            logger.warning(
+                "Evicted stale run_id=%s (max_active_runs=%d)",
+                run_id,
+                self.max_active_runs,
+            )
+
+        # Forget admissions of runs that already finished so the FIFO stays bounded
+        if len(self._run_admissions) > 2 * self.max_active_runs:
+            self._run_admissions = deque(
+                run_id for run_id in self._run_admissions if run_id in self.active_runs
+            )
+
     def _extract_user_input_from_run(self, run: Run) -> str:
         """Extract user input from the first message in run history."""
         if run.history and isinstance(run.history[0].content, str):
@@ -76,127 +200,328 @@ class OrchestratorService:
 
     def _parse_tool_arguments(self, raw_args: Any) -> dict[str, Any]:
         """Parse tool arguments, handling both string and dict formats."""
-        if isinstance(raw_args, str):
-            try:
-                result = json.loads(raw_args)
-                return result if isinstance(result, dict) else {}
-            except json.JSONDecodeError:
-                logger.error(f"Failed to parse tool arguments as JSON: {raw_args}")
-                return {}
-        return raw_args if isinstance(raw_args, dict) else {}
+        if isinstance(raw_args, dict):
+            return raw_args
+        if not isinstance(raw_args, str):
+            return {}
+        try:
+            result = json.loads(raw_args)
+        except json.JSONDecodeError:
+            logger.error(f"Failed to parse tool arguments as JSON: {raw_args}")
+            return {}
+        return result if isinstance(result, dict) else {}
+
+    def _normalize_tool_calls(self, tool_calls: Any) -> list[dict[str, Any]]:
+        """Normalize tool_calls to the OpenAI-compatible schema.
+
+        Ensures every call has an id, a type and a JSON-string function.arguments.
+        """
+        normalized_tool_calls: list[dict[str, Any]] = []
+        for tc in tool_calls or []:
+            function_obj = tc.get("function", {}) if isinstance(tc, dict) else {}
+            args = function_obj.get("arguments")
+            # arguments must be a JSON string per OpenAI-compatible schema
+            if isinstance(args, dict | list):
+                try:
+                    args_str = json.dumps(args, ensure_ascii=False)
+                except Exception:
+                    args_str = json.dumps({"_raw": str(args)})
+            elif isinstance(args, str):
+                args_str = args
+            else:
+                args_str = json.dumps({})
+
+            normalized_tool_calls.append(
+                {
+                    "id": tc.get("id", "") if isinstance(tc, dict) else "",
+                    "type": tc.get("type", "function")
+                    if isinstance(tc, dict)
+                    else "function",
+                    "function": {
+                        "name": function_obj.get("name", ""),
+                        "arguments": args_str,
+                    },
+                }
+            )
+        return normalized_tool_calls
+
+    async def _serialize_tool_result(self, result: Any) -> str:
+        """Serialize a non-string tool result once, off the event loop if large.
+
+        Small payloads are serialized inline to avoid executor dispatch overhead;
+        large ones run in the default executor so other runs keep streaming.
+        """
+        if (
+            _estimate_json_size(result, TOOL_RESULT_OFFLOAD_THRESHOLD)
+            > TOOL_RESULT_OFFLOAD_THRESHOLD
+        ):
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(None, _serialize_content, result)
+        return _serialize_content(result)
+
+    def _order_tool_results(self, run: Run) -> None:
+        """Reorder the trailing TOOL messages in run history to match dispatch order.
+
+        Tool results arrive in completion order, which varies between runs. Sorting
+        them back into the order the LLM issued the calls keeps the follow-up prompt
+        byte-identical for identical turns, so provider-side prefix caching stays hit.
+        """
+        call_order = run.metadata.get("tool_call_order")
+        if not call_order:
+            return
+
+        # Tool results for the current turn follow the last AI message
+        start = len(run.history)
+        while start > 0 and run.history[start - 1].role == _ROLE_TOOL:
+            start -= 1
+        if len(run.history) - start < 2:
+            return
+
+        position = {call_id: index for index, call_id in enumerate(call_order)}
+        run.history[start:] = sorted(
+            run.history[start:],
+            key=lambda msg: position.get(msg.metadata.get("call_id"), len(position)),
+        )
+
+    def _ai_message_to_llm(self, hist_msg: Message) -> dict[str, Any]:
+        """Convert an AI history message (with potential tool calls) to LLM format."""
+        # Coerce content to a string (empty string if None) per OpenAI-compatible schema
+        assistant_content = hist_msg.content
+        if not isinstance(assistant_content, str):
+            assistant_content = (
+                "" if assistant_content is None else str(assistant_content)
+            )
+        msg_dict: dict[str, Any] = {
+            "role": LLM_ROLE_ASSISTANT,
+            "content": assistant_content,
+        }
+        # Prefer tool_calls normalized at ingest; fall back for older history
+        if "tool_calls_normalized" in hist_msg.metadata:
+            msg_dict["tool_calls"] = hist_msg.metadata["tool_calls_normalized"]
+        elif "tool_calls" in hist_msg.metadata:
+            msg_dict["tool_calls"] = self._normalize_tool_calls(
+                hist_msg.metadata["tool_calls"]
+            )
+        return msg_dict
+
+    @staticmethod
+    def _human_message_to_llm(hist_msg: Message) -> dict[str, Any]:
+        """Convert a HUMAN history message to LLM format."""
+        return {"role": LLM_ROLE_USER, "content": hist_msg.content}
+
+    def _tool_message_to_llm(self, hist_msg: Message) -> dict[str, Any]:
+        """Convert a TOOL history message to LLM format."""
+        content_value = hist_msg.content
+        if not isinstance(content_value, str):
+            # Prefer the serialization made when the result arrived
+            content_value = hist_msg.metadata.get(
+                "content_serialized"
+            ) or _serialize_content(content_value)
+
+        # Per OpenAI-compatible schema for tool messages, include content and tool_call_id only
+        # Note: Some providers (e.g., Google's OpenAI-compatible endpoint) also require the tool 'name'
+        # to properly map to their native function_response schema. We include it when available.
+        return {
+            "role": LLM_ROLE_TOOL,
+            "content": content_value,
+            "tool_call_id": hist_msg.metadata.get("call_id", ""),
+            "name": hist_msg.metadata.get("tool_name", "unknown") or "unknown",
+        }
 
     def _convert_history_to_llm_messages(self, run: Run) -> list[dict[str, Any]]:
         """Convert run history to LLM-compatible message format."""
-        messages = []
+        # Dispatch on role by hash lookup; chained Role comparisons dominated
+        # the loop on long agentic histories
+        converters = self._history_converters
+        messages: list[dict[str, Any]] = []
+        append = messages.append
         for hist_msg in run.history:
-            if hist_msg.role == Role.AI:
-                # AI message with potential tool calls
-                # Coerce content to a string (empty string if None) per OpenAI-compatible schema
-                assistant_content = hist_msg.content
-                if not isinstance(assistant_content, str):
-                    assistant_content = (
-                        "" if assistant_content is None else str(assistant_content)
-                    )
-                msg_dict: dict[str, Any] = {
-                    "role": LLM_ROLE_ASSISTANT,
-                    "content": assistant_content,
-                }
-                # Normalize tool_calls schema: ensure function.arguments is a JSON string
-                if "tool_calls" in hist_msg.metadata:
-                    normalized_tool_calls: list[dict[str, Any]] = []
-                    for tc in hist_msg.metadata["tool_calls"] or []:
-                        function_obj = (
-                            tc.get("function", {}) if isinstance(tc, dict) else {}
-                        )
-                        args = function_obj.get("arguments")
-                        # arguments must be a JSON string per OpenAI-compatible schema
-                        if isinstance(args, dict | list):
-                            try:
-                                args_str = json.dumps(args, ensure_ascii=False)
-                            except Exception:
-                                args_str = json.dumps({"_raw": str(args)})
-                        elif isinstance(args, str):
-                            args_str = args
-                        else:
-                            args_str = json.dumps({})
-
-                        normalized_tool_calls.append(
-                            {
-                                "id": tc.get("id", "") if isinstance(tc, dict) else "",
-                                "type": tc.get("type", "function")
-                                if isinstance(tc, dict)
-                                else "function",
-                                "function": {
-                                    "name": function_obj.get("name", ""),
-                                    "arguments": args_str,
-                                },
-                            }
-                        )
-                    msg_dict["tool_calls"] = normalized_tool_calls
-                messages.append(msg_dict)
-            elif hist_msg.role == Role.TOOL:
-                # Tool result message
-                content_value = hist_msg.content
-                if not isinstance(content_value, str):
-                    try:
-                        content_value = json.dumps(content_value, ensure_ascii=False)
-                    except Exception:
-                        content_value = str(content_value)
-
-                # Per OpenAI-compatible schema for tool messages, include content and tool_call_id only
-                # Note: Some providers (e.g., Google's OpenAI-compatible endpoint) also require the tool 'name'
-                # to properly map to their native function_response schema. We include it when available.
-                messages.append(
-                    {
-                        "role": LLM_ROLE_TOOL,
-                        "content": content_value,
-                        "tool_call_id": hist_msg.metadata.get("call_id", ""),
-                        "name": hist_msg.metadata.get("tool_name", "unknown")
-                        or "unknown",
-                    }
-                )
-            elif hist_msg.role == Role.HUMAN:
-                # User message
-                messages.append({"role": LLM_ROLE_USER, "content": hist_msg.content})
+            converter = converters.get(hist_msg.role)
+            if converter is not None:
+                append(converter(hist_msg))
         return messages
 
-    def _create_standardized_ui_event(
-        self, run_id: str, owner_key: str, content: str
-    ) -> Message:
-        """Create a standardized UI event message."""
-        return Message(
-            run_id=run_id,
-            owner_key=owner_key,
-            role=Role.AI,
-            content={
-                "event": UI_EVENT_TEXT_CHUNK,
-                "run_id": run_id,
-                "payload": {"chunk": content},
-            },
+    def _build_followup_messages(self, run: Run) -> list[dict[str, Any]]:
+        """Build the follow-up LLM messages once all tool results of a turn are in.
+
+        Follow-ups reuse the complete context of the first LLM call (system
+        prompt, memory, moment block and conversation) kept on
+        run.metadata["llm_messages"], and append each finished turn's AI message
+        and TOOL results to it. Every request of a run therefore shares the
+        same prefix, and earlier tool turns are never dropped.
+
+        A run that never went through context building has no such list; it is
+        seeded once from the converted run history and extended the same way.
+        """
+        llm_messages = run.metadata.get("llm_messages")
+        if llm_messages is None:
+            logger.warning(
+                "No context messages for run_id=%s; seeding follow-up from history",
+                run.id,
+            )
+            run.metadata["llm_messages"] = self._convert_history_to_llm_messages(run)
+            return list(run.metadata["llm_messages"])
+
+        # The AI message of this turn was appended in handle_llm_result
+        start = len(run.history)
+        while start > 0 and run.history[start - 1].role == _ROLE_TOOL:
+            start -= 1
+        llm_messages.extend(
+            self._tool_message_to_llm(hist_msg) for hist_msg in run.history[start:]
         )
+        # Copy so the published request is not mutated by later turns
+        return list(llm_messages)
 
     def _create_ui_event(
-        self, run_id: str, owner_key: str, event_type: str, payload: dict
+        self,
+        run_id: str,
+        owner_key: str,
+        event_type: str,
+        payload: dict,
+        role: Role = Role.SYSTEM,
     ) -> Message:
         """
         Create a generic UI event message with specified event type and payload.
 
+        All UI events are built here so the content shell is assembled in one
+        place and in a single allocation.
+
         Args:
             run_id: The run identifier
             owner_key: The owner's public key (user identity)
             event_type: The UI event type (e.g., 'run_started', 'tool_call_finished')
             payload: The event-specific payload data
+            role: The message role (SYSTEM for orchestrator-generated events)
 
         Returns:
             Message: A properly formatted UI event message
         """
-        return Message(
+        return Message.trusted(
             run_id=run_id,
             owner_key=owner_key,
-            role=Role.SYSTEM,
+            role=role,
             content={"event": event_type, "run_id": run_id, "payload": payload},
         )
 
+    async def _forward_text_chunk(
+        self, run_id: str, owner_key: str, content: dict[str, Any]
+    ) -> None:
+        """Forward a text_chunk event to UI, micro-batching bursts.
+
+        The first chunk of a burst is published immediately and opens a short
+        batching window. Chunks arriving while the window is open are buffered and
+        published together when the buffer fills or the window elapses; the window
+        closes once it elapses with nothing buffered.
+        """
+        if run_id not in self._chunk_flush_handles:
+            await self._publish_ui_event(
+                Message.trusted(
+                    run_id=run_id,
+                    owner_key=owner_key,
+                    role=_ROLE_SYSTEM,
+                    content=content,
+                ),
+            )
+            logger.debug(
+                "Forwarded streaming event 'text_chunk' for run_id=%s to UI", run_id
+            )
+            self._arm_chunk_window(run_id, owner_key)
+            return
+
+        buffer = self._chunk_buffers.setdefault(run_id, [])
+        buffer.append(content.get("payload", {}).get("chunk", ""))
+        if len(buffer) >= TEXT_CHUNK_BATCH_SIZE:
+            await self._publish_chunk_batch(run_id, owner_key)
+
+    def _arm_chunk_window(self, run_id: str, owner_key: str) -> None:
+        """Open (or extend) the batching window for run_id."""
+        self._chunk_flush_handles[run_id] = asyncio.get_running_loop().call_later(
+            TEXT_CHUNK_BATCH_WINDOW, self._on_chunk_window_elapsed, run_id, owner_key
+        )
+
+    def _on_chunk_window_elapsed(self, run_id: str, owner_key: str) -> None:
+        """Timer callback: publish buffered chunks, or close an idle window."""
+        if not self._chunk_buffers.get(run_id):
+            self._chunk_flush_handles.pop(run_id, None)
+            return
+        self._arm_chunk_window(run_id, owner_key)
+        self._background.spawn(
+            self._publish_chunk_batch(run_id, owner_key),
+            f"publish text chunks for run_id={run_id}",
+        )
+
+    async def _flush_chunks(self, run_id: str, owner_key: str) -> None:
+        """Close the batching window for run_id and publish any buffered chunks."""
+        handle = self._chunk_flush_handles.pop(run_id, None)
+        if handle is not None:
+            handle.cancel()
+        await self._publish_chunk_batch(run_id, owner_key)
+
+    async def _publish_chunk_batch(self, run_id: str, owner_key: str) -> None:
+        """Publish buffered text chunks for run_id as a single UI event."""
+        buffer = self._chunk_buffers.pop(run_id, None)
+        if not buffer:
+            return
+
+        await self._publish_ui_event(
+            self._create_ui_event(
+                run_id=run_id,
+                owner_key=owner_key,
+                event_type=UI_EVENT_TEXT_CHUNK,
+                payload={"chunk": "".join(buffer)},
+            ),
+        )
+        logger.debug(
+            "Forwarded %d coalesced text chunks for run_id=%s to UI",
+            len(buffer),
+            run_id,
+        )
+
+    async def _publish_ui_event(self, ui_event: Message) -> None:
+        """Publish a UI event, batching bursts when a linger window is configured."""
+        if self.ui_event_linger <= 0:
+            await self.bus.publish(Topics.UI_EVENTS, ui_event)
+            return
+
+        self._ui_buffer.append(ui_event)
+        if len(self._ui_buffer) >= UI_EVENT_BATCH_SIZE:
+            await self._flush_ui_events()
+        elif self._ui_flush_handle is None:
+            self._ui_flush_handle = asyncio.get_running_loop().call_later(
+                self.ui_event_linger, self._on_ui_linger_elapsed
+            )
+
+    def _on_ui_linger_elapsed(self) -> None:
+        """Timer callback: publish the UI events buffered during the linger window."""
+        self._ui_flush_handle = None
+        self._background.spawn(self._flush_ui_events(), "publish UI event batch")
+
+    async def _flush_ui_events(self) -> None:
+        """Publish all buffered UI events as one UI_EVENTS_BATCH message."""
+        if self._ui_flush_handle is not None:
+            self._ui_flush_handle.cancel()
+            self._ui_flush_handle = None
+        if not self._ui_buffer:
+            return
+
+        batch, self._ui_buffer = self._ui_buffer, []
+        await self.bus.publish(
+            Topics.UI_EVENTS_BATCH,
+            Message.trusted(
+                run_id=batch[0].run_id,
+                owner_key=batch[0].owner_key,
+                role=_ROLE_SYSTEM,
+                content=batch,
+            ),
+        )
+        logger.debug("Published batch of %d UI events", len(batch))
+
+    async def aclose(self) -> None:
+        """Wait for publishes started by flush timers, then publish buffered UI events."""
+        await self._background.drain()
+        await self._flush_ui_events()
+        logger.info("OrchestratorService closed")
+
     def subscribe_to_bus(self) -> None:
         """Subscribe to orchestration topics."""
         self.bus.subscribe(Topics.RUNS_NEW, self.handle_new_run)
@@ -212,111 +537,120 @@ class OrchestratorService:
         Args:
             message: Message containing Run object
         """
-        try:
-            logger.info(f"Handling new run for run_id={message.run_id}")
-
-            # Extract Run object directly from message content
-            run = message.content
-            if not isinstance(run, Run):
-                logger.error(f"Expected Run object in message content, got {type(run)}")
-                return
-
-            # === GATEKEEPER LOGIC: Identity Verification ===
-            # Check if user is registered (member) or unregistered (visitor)
-            if self.identity_service:
+        logger.debug("Handling new run for run_id=%s", message.run_id)
+
+        # Extract Run object directly from message content
+        run = message.content
+        if not isinstance(run, Run):
+            logger.error(f"Expected Run object in message content, got {type(run)}")
+            return
+
+        # === GATEKEEPER LOGIC: Identity Verification ===
+        # Check if user is registered (member) or unregistered (visitor)
+        if self.identity_service:
+            # Identity lookup is the only I/O boundary here; without it the run
+            # cannot be gated, so it is dropped
+            try:
                 identity = await self.identity_service.get_identity(run.owner_key)
+            except Exception as e:
+                logger.error(f"Identity lookup failed for run_id={run.id}: {e}")
+                return
 
-                if identity is None:
-                    # Visitor flow: Send guidance message and halt
-                    logger.info(
-                        f"Unregistered user (visitor) detected for owner_key={run.owner_key}, sending guidance"
-                    )
-
-                    guidance_message = self._create_ui_event(
-                        run_id=run.id,
-                        owner_key=run.owner_key,
-                        event_type=UI_EVENT_TEXT_CHUNK,
-                        payload={
-                            # Use standardized key expected by frontend protocol
-                            "chunk": "欢迎！您当前处于访客模式。要创建您的专属身份并启用个性化功能，请执行 `/identity` 指令。",
-                            "is_final": True,
-                            # Hint UI to render this as a system message
-                            "role": "SYSTEM",
-                        },
-                    )
-                    await self.bus.publish(Topics.UI_EVENTS, guidance_message)
-
-                    # Publish run_finished event to close the run
-                    run_finished_event = self._create_ui_event(
-                        run_id=run.id,
-                        owner_key=run.owner_key,
-                        event_type=UI_EVENT_RUN_FINISHED,
-                        payload={"status": "visitor_guidance_sent"},
-                    )
-                    await self.bus.publish(Topics.UI_EVENTS, run_finished_event)
-                    logger.info(
-                        f"Visitor guidance sent for run_id={run.id}, halting normal flow"
-                    )
-                    return
-
-                logger.info(
-                    f"Registered user (member) verified for owner_key={run.owner_key}"
+            if identity is None:
+                # Visitor flow: Send guidance message and halt
+                logger.debug(
+                    "Unregistered user (visitor) detected for owner_key=%s, sending guidance",
+                    run.owner_key,
                 )
 
-                # Build user_profile from identity (Contains all identity information)
-                # TODO: Refactor with unified RunContext object
-                #   Current approach passes user_profile through Run.metadata -> ContextService -> LLMService
-                #   Future: Create a RunContext object that encapsulates run, user_profile, and metadata
-                #   to simplify the data passing chain and reduce coupling.
-                # See docs/future_roadmap.md for more details.
-                user_profile = {
-                    "public_key": identity["public_key"],
-                    "config_overrides": identity.get("config_overrides", {}),
-                    "prompt_overrides": identity.get("prompt_overrides", {}),
-                    "created_at": identity.get("created_at"),
-                }
+                guidance_message = self._create_ui_event(
+                    run_id=run.id,
+                    owner_key=run.owner_key,
+                    event_type=UI_EVENT_TEXT_CHUNK,
+                    payload={
+                        # Use standardized key expected by frontend protocol
+                        "chunk": "欢迎！您当前处于访客模式。要创建您的专属身份并启用个性化功能，请执行 `/identity` 指令。",
+                        "is_final": True,
+                        # Hint UI to render this as a system message
+                        "role": "SYSTEM",
+                    },
+                )
+                await self._publish_ui_event(guidance_message)
 
-                # Inject user_profile into Run.metadata
-                if run.metadata is None:
-                    run.metadata = {}
-                run.metadata["user_profile"] = user_profile
+                # Publish run_finished event to close the run
+                run_finished_event = self._create_ui_event(
+                    run_id=run.id,
+                    owner_key=run.owner_key,
+                    event_type=UI_EVENT_RUN_FINISHED,
+                    payload={"status": "visitor_guidance_sent"},
+                )
+                await self._publish_ui_event(run_finished_event)
                 logger.info(
-                    f"Injected user_profile into Run.metadata for owner_key={run.owner_key}"
+                    "Visitor guidance sent for run_id=%s, halting normal flow",
+                    run.id,
                 )
+                return
 
-            # === MEMBER FLOW: Continue normal processing ===
-            # Publish run_started UI event
-            run_started_event = self._create_ui_event(
-                run_id=run.id,
-                owner_key=run.owner_key,
-                event_type=UI_EVENT_RUN_STARTED,
-                payload={
-                    "owner_key": run.owner_key,
-                    "user_input": self._extract_user_input_from_run(run),
-                },
+            logger.debug(
+                "Registered user (member) verified for owner_key=%s", run.owner_key
             )
-            await self.bus.publish(Topics.UI_EVENTS, run_started_event)
-            logger.info(f"Published run_started UI event for run_id={run.id}")
 
-            # Update run status to building context
-            run.status = RunStatus.BUILDING_CONTEXT
+            # Build user_profile from identity (Contains all identity information)
+            # TODO: Refactor with unified RunContext object
+            #   Current approach passes user_profile through Run.metadata -> ContextService -> LLMService
+            #   Future: Create a RunContext object that encapsulates run, user_profile, and metadata
+            #   to simplify the data passing chain and reduce coupling.
+            # See docs/future_roadmap.md for more details.
+            user_profile = {
+                "public_key": identity["public_key"],
+                "config_overrides": identity.get("config_overrides", {}),
+                "prompt_overrides": identity.get("prompt_overrides", {}),
+                "created_at": identity.get("created_at"),
+            }
+
+            # Inject user_profile into Run.metadata
+            if run.metadata is None:
+                run.metadata = {}
+            run.metadata["user_profile"] = user_profile
+            logger.debug(
+                "Injected user_profile into Run.metadata for owner_key=%s",
+                run.owner_key,
+            )
 
-            # Store the run
-            self.active_runs[run.id] = run
+        # === MEMBER FLOW: Continue normal processing ===
+        # Publish run_started UI event
+        run_started_event = self._create_ui_event(
+            run_id=run.id,
+            owner_key=run.owner_key,
+            event_type=UI_EVENT_RUN_STARTED,
+            payload={
+                "owner_key": run.owner_key,
+                "user_input": self._extract_user_input_from_run(run),
+            },
+        )
+        await self._publish_ui_event(run_started_event)
+        logger.debug("Published run_started UI event for run_id=%s", run.id)
 
-            # Request context building - pass Run object directly
-            context_request = Message(
-                run_id=run.id,
-                owner_key=run.owner_key,
-                role=Role.SYSTEM,
-                content=run,  # Pass the entire Run object with user_profile in metadata
-            )
+        # Update run status to building context
+        run.status = _STATUS_BUILDING_CONTEXT
+
+        # Store the run
+        self._admit_run(run)
 
-            await self.bus.publish(Topics.CONTEXT_BUILD_REQUEST, context_request)
-            logger.info(f"Published context build request for run_id={run.id}")
+        # Request context building - pass Run object directly
+        context_request = Message.trusted(
+            run_id=run.id,
+            owner_key=run.owner_key,
+            role=_ROLE_SYSTEM,
+            content=run,  # Pass the entire Run object with user_profile in metadata
+        )
 
-        except Exception as e:
-            logger.error(f"Error handling new run for run_id={message.run_id}: {e}")
+        # Orchestrator is the only publisher of this topic, so direct dispatch
+        # keeps ordering while skipping the bus queue hop
+        await self.bus.publish(
+            Topics.CONTEXT_BUILD_REQUEST, context_request, direct=True
+        )
+        logger.debug("Published context build request for run_id=%s", run.id)
 
     async def handle_context_ready(self, message: Message) -> None:
         """
@@ -325,53 +659,49 @@ class OrchestratorService:
         Args:
             message: Message containing context build results
         """
-        try:
-            run_id = message.run_id
-            logger.info(f"Handling context ready for run_id={run_id}")
-
-            run = self.active_runs.get(run_id)
-            if not run:
-                logger.error(f"No active run found for run_id={run_id}")
-                return
-
-            content = message.content
-            if content.get("status") != CONTEXT_STATUS_SUCCESS:
-                logger.error(f"Context build failed for run_id={run_id}")
-                run.status = RunStatus.FAILED
-                return
-
-            # Update run status
-            run.status = RunStatus.AWAITING_LLM_DECISION
-
-            # Get messages and tools from context
-            messages = content.get("messages", [])
-            tools = content.get("tools", [])
-
-            # Store tools in the run object
-            run.tools = tools
-
-            # Request LLM completion with user_profile for dynamic provider selection
-            # TODO: Refactor with unified RunContext - user_profile currently passed through message content
-            llm_request = Message(
-                run_id=run_id,
-                owner_key=run.owner_key,
-                role=Role.SYSTEM,
-                content={
-                    "messages": messages,
-                    "tools": tools,
-                    "user_profile": run.metadata.get(
-                        "user_profile", {}
-                    ),  # Pass user_profile for dynamic config
-                },
-            )
-
-            await self.bus.publish(Topics.LLM_REQUESTS, llm_request)
-            logger.info(f"Published LLM request for run_id={run_id}")
+        run_id = message.run_id
+        logger.debug("Handling context ready for run_id=%s", run_id)
+
+        run = self.active_runs.get(run_id)
+        if not run:
+            logger.error(f"No active run found for run_id={run_id}")
+            return
+
+        content = message.content
+        status = content.get("status") if isinstance(content, dict) else None
+        if status != CONTEXT_STATUS_SUCCESS:
+            logger.error(f"Context build failed for run_id={run_id}")
+            run.status = _STATUS_FAILED
+            self.active_runs.pop(run_id, None)
+            return
+
+        # Update run status
+        run.status = _STATUS_AWAITING_LLM_DECISION
+
+        # Get messages and tools from context
+        messages = content.get("messages", [])
+        tools = content.get("tools", [])
+
+        # Store tools in the run object
+        run.tools = tools
+        # Keep the prompt so follow-up requests only append the new turn
+        run.metadata["llm_messages"] = list(messages)
+
+        # Request LLM completion with user_profile for dynamic provider selection
+        # TODO: Refactor with unified RunContext - user_profile currently passed through message content
+        llm_request = message.forward(
+            {
+                "messages": messages,
+                "tools": tools,
+                "user_profile": run.metadata.get(
+                    "user_profile", {}
+                ),  # Pass user_profile for dynamic config
+            },
+            role=_ROLE_SYSTEM,
+        )
 
-        except Exception as e:
-            logger.error(
-                f"Error handling context ready for run_id={message.run_id}: {e}"
-            )
+        await self.bus.publish(Topics.LLM_REQUESTS, llm_request, direct=True)
+        logger.debug("Published LLM request for run_id=%s", run_id)
 
     async def handle_llm_result(self, message: Message) -> None:
         """
@@ -380,146 +710,155 @@ class OrchestratorService:
         Args:
             message: Message containing LLM results
         """
-        try:
-            run_id = message.run_id
-            logger.info(f"Handling LLM result for run_id={run_id}")
-
-            run = self.active_runs.get(run_id)
-            if not run:
-                logger.error(f"No active run found for run_id={run_id}")
-                return
-
-            content = message.content
-
-            # Forward interim streaming events (text_chunk, tool_call_started) to UI as-is
-            if isinstance(content, dict) and content.get("event") in {
-                UI_EVENT_TEXT_CHUNK,
+        run_id = message.run_id
+        logger.debug("Handling LLM result for run_id=%s", run_id)
+
+        run = self.active_runs.get(run_id)
+        if not run:
+            logger.error(f"No active run found for run_id={run_id}")
+            return
+
+        content = message.content
+        if not isinstance(content, dict):
+            logger.error(f"Invalid LLM result format: {type(content)}")
+            return
+        event = content.get("event")
+
+        # Coalesce bursts of text_chunk events before forwarding to UI
+        if event == UI_EVENT_TEXT_CHUNK:
+            await self._forward_text_chunk(run_id, run.owner_key, content)
+            return
+
+        # Any other event closes the current chunk batch to preserve ordering
+        await self._flush_chunks(run_id, run.owner_key)
+
+        # Forward interim streaming events (tool_call_started) to UI as-is
+        if event == UI_EVENT_TOOL_CALL_STARTED:
+            ui_event = message.forward(content, role=_ROLE_SYSTEM)
+            await self._publish_ui_event(ui_event)
+            logger.debug(
+                "Forwarded streaming event '%s' for run_id=%s to UI",
                 UI_EVENT_TOOL_CALL_STARTED,
-            }:
-                ui_event = Message(
-                    run_id=run_id,
-                    owner_key=run.owner_key,
-                    role=Role.SYSTEM,
-                    content=content,
-                )
-                await self.bus.publish(Topics.UI_EVENTS, ui_event)
-                logger.info(
-                    f"Forwarded streaming event '{content.get('event')}' for run_id={run_id} to UI"
-                )
-                return
+                run_id,
+            )
+            return
 
-            llm_content = content.get("content", "")
-            tool_calls = content.get("tool_calls")
+        llm_content = content.get("content", "")
+        tool_calls = content.get("tool_calls")
 
-            # Check if there are tool calls
-            if tool_calls:
-                logger.info(
-                    f"Tool calls detected for run_id={run_id}: {len(tool_calls)} calls"
-                )
+        # Check if there are tool calls
+        if tool_calls:
+            logger.debug(
+                "Tool calls detected for run_id=%s: %d calls",
+                run_id,
+                len(tool_calls),
+            )
 
-                # Safety valve: check iteration count
-                if run.iteration_count >= self.max_tool_iterations:
-                    logger.warning(
-                        f"Max tool iterations ({self.max_tool_iterations}) exceeded for run_id={run_id}"
-                    )
-                    run.status = RunStatus.TIMED_OUT
-
-                    # Send error message to UI
-                    error_event = Message(
-                        run_id=run_id,
-                        owner_key=run.owner_key,
-                        role=Role.SYSTEM,
-                        content={
-                            "event": "error",
-                            "run_id": run_id,
-                            "payload": {
-                                "message": f"Maximum tool iterations ({self.max_tool_iterations}) exceeded"
-                            },
-                        },
-                    )
-                    await self.bus.publish(Topics.UI_EVENTS, error_event)
-
-                    # Publish run_finished UI event for timed out run
-                    run_finished_event = self._create_ui_event(
-                        run_id=run_id,
-                        owner_key=run.owner_key,
-                        event_type=UI_EVENT_RUN_FINISHED,
-                        payload={"status": "timed_out"},
-                    )
-                    await self.bus.publish(Topics.UI_EVENTS, run_finished_event)
-                    logger.info(
-                        f"Published run_finished UI event for timed out run_id={run_id}"
-                    )
-
-                    # Remove timed out run
-                    del self.active_runs[run_id]
-                    return
-
-                # Record pending tool calls count for synchronization
-                run.metadata["pending_tool_calls"] = len(tool_calls)
-                logger.info(
-                    f"Set pending_tool_calls to {len(tool_calls)} for run_id={run_id}"
+            # Safety valve: check iteration count
+            if run.iteration_count >= self.max_tool_iterations:
+                logger.warning(
+                    f"Max tool iterations ({self.max_tool_iterations}) exceeded for run_id={run_id}"
                 )
+                run.status = _STATUS_TIMED_OUT
 
-                # Update run status and increment iteration count
-                run.status = RunStatus.AWAITING_TOOL_RESULT
-                run.iteration_count += 1
-
-                # Record AI intent: add the LLM message with tool_calls to history
-                ai_message = Message(
+                # Send error message to UI
+                error_event = self._create_ui_event(
                     run_id=run_id,
                     owner_key=run.owner_key,
-                    role=Role.AI,
-                    content=llm_content,
-                    metadata={"tool_calls": tool_calls},
+                    event_type=UI_EVENT_ERROR,
+                    payload={
+                        "message": f"Maximum tool iterations ({self.max_tool_iterations}) exceeded"
+                    },
                 )
-                run.history.append(ai_message)
-
-                # Note: LLMService already sent text_chunk events AND tool_call_started events during streaming
-                # No need to publish tool_call_started events here - they were already sent in real-time
-
-                # Publish tool requests
-                for tool_call in tool_calls:
-                    # Parse arguments using extracted method
-                    raw_args = tool_call.get("function", {}).get("arguments", {})
-                    parsed_args = self._parse_tool_arguments(raw_args)
-
-                    tool_request = Message(
-                        run_id=run_id,
-                        owner_key=run.owner_key,
-                        role=Role.SYSTEM,
-                        content={
-                            "name": tool_call.get("function", {}).get("name"),
-                            "args": parsed_args,
-                            "call_id": tool_call.get("id"),
-                        },
-                    )
-                    await self.bus.publish(Topics.TOOLS_REQUESTS, tool_request)
-                    logger.info(
-                        f"Published tool request for {tool_call.get('function', {}).get('name')} in run_id={run_id}"
-                    )
+                await self._publish_ui_event(error_event)
 
-            else:
-                # No tool calls, complete the run
-                run.status = RunStatus.COMPLETED
-
-                # Note: LLMService already sent text_chunk events for llm_content during streaming
-                # Just publish run_finished UI event
+                # Publish run_finished UI event for timed out run
                 run_finished_event = self._create_ui_event(
                     run_id=run_id,
                     owner_key=run.owner_key,
                     event_type=UI_EVENT_RUN_FINISHED,
-                    payload={"status": "completed"},
+                    payload={"status": "timed_out"},
+                )
+                await self._publish_ui_event(run_finished_event)
+                logger.debug(
+                    "Published run_finished UI event for timed out run_id=%s",
+                    run_id,
+                )
+
+                # Remove timed out run
+                self.active_runs.pop(run_id, None)
+                return
+
+            # Record pending tool calls count for synchronization
+            self._pending_tool_calls[run_id] = len(tool_calls)
+            # Remember dispatch order so results can be replayed deterministically
+            run.metadata["tool_call_order"] = [tc.get("id") for tc in tool_calls]
+            logger.debug(
+                "Set pending_tool_calls to %d for run_id=%s",
+                len(tool_calls),
+                run_id,
+            )
+
+            # Update run status and increment iteration count
+            run.status = _STATUS_AWAITING_TOOL_RESULT
+            run.iteration_count += 1
+
+            # Record AI intent: add the LLM message with tool_calls to history
+            ai_message = message.forward(
+                llm_content,
+                role=_ROLE_AI,
+                metadata={
+                    "tool_calls": tool_calls,
+                    # Normalized once here so follow-up conversions reuse it
+                    "tool_calls_normalized": self._normalize_tool_calls(tool_calls),
+                },
+            )
+            run.history.append(ai_message)
+            if "llm_messages" in run.metadata:
+                run.metadata["llm_messages"].append(self._ai_message_to_llm(ai_message))
+
+            # Note: LLMService already sent text_chunk events AND tool_call_started events during streaming
+            # No need to publish tool_call_started events here - they were already sent in real-time
+
+            # Publish tool requests
+            for tool_call in tool_calls:
+                # Parse arguments using extracted method
+                raw_args = tool_call.get("function", {}).get("arguments", {})
+                parsed_args = self._parse_tool_arguments(raw_args)
+
+                tool_request = message.forward(
+                    {
+                        "name": tool_call.get("function", {}).get("name"),
+                        "args": parsed_args,
+                        "call_id": tool_call.get("id"),
+                    },
+                    role=_ROLE_SYSTEM,
                 )
-                await self.bus.publish(Topics.UI_EVENTS, run_finished_event)
-                logger.info(f"Published run_finished UI event for run_id={run_id}")
+                await self.bus.publish(Topics.TOOLS_REQUESTS, tool_request)
+                logger.debug(
+                    "Published tool request for %s in run_id=%s",
+                    tool_request.content["name"],
+                    run_id,
+                )
+
+        else:
+            # No tool calls, complete the run
+            run.status = _STATUS_COMPLETED
 
-                # Remove completed run from active runs
-                del self.active_runs[run_id]
-                logger.info(f"Completed and removed run_id={run_id}")
+            # Note: LLMService already sent text_chunk events for llm_content during streaming
+            # Just publish run_finished UI event
+            run_finished_event = self._create_ui_event(
+                run_id=run_id,
+                owner_key=run.owner_key,
+                event_type=UI_EVENT_RUN_FINISHED,
+                payload={"status": "completed"},
+            )
+            await self._publish_ui_event(run_finished_event)
+            logger.debug("Published run_finished UI event for run_id=%s", run_id)
 
-        except Exception as e:
-            logger.error(f"Error handling LLM result for run_id={message.run_id}: {e}")
+            # Remove completed run from active runs
+            self.active_runs.pop(run_id, None)
+            logger.info("Completed and removed run_id=%s", run_id)
 
     async def handle_tool_result(self, message: Message) -> None:
         """
@@ -528,97 +867,113 @@ class OrchestratorService:
         Args:
             message: Message containing tool execution results
         """
-        try:
-            run_id = message.run_id
-            logger.info(f"Handling tool result for run_id={run_id}")
-
-            run = self.active_runs.get(run_id)
-            if not run:
-                logger.error(f"No active run found for run_id={run_id}")
-                return
-
-            content = message.content
-            tool_name = content.get("tool_name", "unknown")
-            tool_result = content.get("result", "")
-            tool_status = content.get("status", "unknown")
-            call_id = content.get("call_id", "")
+        run_id = message.run_id
+        logger.debug("Handling tool result for run_id=%s", run_id)
+
+        run = self.active_runs.get(run_id)
+        if not run:
+            logger.error(f"No active run found for run_id={run_id}")
+            return
+
+        content = message.content
+        if not isinstance(content, dict):
+            logger.error(f"Invalid tool result format: {type(content)}")
+            return
+        tool_name = content.get("tool_name", "unknown")
+        tool_result = content.get("result", "")
+        tool_status = content.get("status", "unknown")
+        call_id = content.get("call_id", "")
+
+        # Publish tool_call_finished UI event
+        tool_finished_event = self._create_ui_event(
+            run_id=run_id,
+            owner_key=run.owner_key,
+            event_type=UI_EVENT_TOOL_CALL_FINISHED,
+            payload={
+                "tool_name": tool_name,
+                "status": "success" if tool_status == "success" else "error",
+                "result": tool_result,
+            },
+        )
+        await self._publish_ui_event(tool_finished_event)
+        logger.debug(
+            "Published tool_call_finished UI event for %s in run_id=%s",
+            tool_name,
+            run_id,
+        )
 
-            # Publish tool_call_finished UI event
-            tool_finished_event = self._create_ui_event(
-                run_id=run_id,
-                owner_key=run.owner_key,
-                event_type=UI_EVENT_TOOL_CALL_FINISHED,
-                payload={
-                    "tool_name": tool_name,
-                    "status": "success" if tool_status == "success" else "error",
-                    "result": tool_result,
-                },
+        # Record tool result: add the tool message to history
+        tool_metadata = {
+            "tool_name": tool_name,
+            "status": tool_status,
+            "call_id": call_id,
+        }
+        if not isinstance(tool_result, str):
+            tool_metadata["content_serialized"] = await self._serialize_tool_result(
+                tool_result
             )
-            await self.bus.publish(Topics.UI_EVENTS, tool_finished_event)
-            logger.info(
-                f"Published tool_call_finished UI event for {tool_name} in run_id={run_id}"
-            )
-
-            # Record tool result: add the tool message to history
-            tool_message = Message(
-                run_id=run_id,
-                owner_key=run.owner_key,
-                role=Role.TOOL,
-                content=tool_result,
-                metadata={
-                    "tool_name": tool_name,
-                    "status": tool_status,
-                    "call_id": call_id,
-                },
+        tool_message = Message.trusted(
+            run_id=run_id,
+            owner_key=run.owner_key,
+            role=_ROLE_TOOL,
+            content=tool_result,
+            metadata=tool_metadata,
+        )
+        run.history.append(tool_message)
+
+        # Synchronization logic: decrement pending tool calls count.
+        # There is no await between the read and the write below, so under
+        # asyncio only one completion can observe the count reaching zero.
+        current_pending_count = self._pending_tool_calls.get(run_id, 0)
+        if current_pending_count > 0:
+            remaining_tool_calls = current_pending_count - 1
+            logger.debug(
+                "Decremented pending_tool_calls to %d for run_id=%s",
+                remaining_tool_calls,
+                run_id,
             )
-            run.history.append(tool_message)
 
-            # Synchronization logic: decrement pending tool calls count
-            current_pending_count = run.metadata.get("pending_tool_calls", 0)
-            if current_pending_count > 0:
-                run.metadata["pending_tool_calls"] = current_pending_count - 1
-                remaining_tool_calls = run.metadata["pending_tool_calls"]
-                logger.info(
-                    f"Decremented pending_tool_calls to {remaining_tool_calls} for run_id={run_id}"
+            # Only proceed to call LLM when all tools have completed
+            if remaining_tool_calls > 0:
+                self._pending_tool_calls[run_id] = remaining_tool_calls
+                logger.debug(
+                    "Waiting for %d more tool results for run_id=%s",
+                    remaining_tool_calls,
+                    run_id,
                 )
+                return
+            del self._pending_tool_calls[run_id]
 
-                # Only proceed to call LLM when all tools have completed
-                if remaining_tool_calls > 0:
-                    logger.info(
-                        f"Waiting for {remaining_tool_calls} more tool results for run_id={run_id}"
-                    )
-                    return
+        # All tools completed, proceed with LLM call
+        logger.debug("All tools completed for run_id=%s, calling LLM", run_id)
 
-            # All tools completed, proceed with LLM call
-            logger.info(f"All tools completed for run_id={run_id}, calling LLM")
+        # Restore dispatch order of tool results for a cache-stable prompt prefix
+        self._order_tool_results(run)
 
-            # Convert run history to messages format for LLM
-            messages = self._convert_history_to_llm_messages(run)
+        # Extend the previous request's messages with this turn
+        messages = self._build_followup_messages(run)
 
-            # Call LLM again with complete history
-            run.status = RunStatus.AWAITING_LLM_DECISION
+        # Call LLM again with complete history
+        run.status = _STATUS_AWAITING_LLM_DECISION
 
-            # When in E2E fake LLM mode (NEXUS_E2E_FAKE_LLM=1), pass empty tool list to avoid loops;
-            # Otherwise, retain available tools in normal environment to support continuous tool calls.
-            tools_for_followup = (
-                [] if os.getenv("NEXUS_E2E_FAKE_LLM", "0") == "1" else run.tools
-            )
-
-            llm_request = Message(
-                run_id=run_id,
-                owner_key=run.owner_key,
-                role=Role.SYSTEM,
-                content={
-                    "messages": messages,
-                    "tools": tools_for_followup,
-                    "user_profile": run.metadata.get(
-                        "user_profile", {}
-                    ),  # Pass user_profile for dynamic config
-                },
-            )
+        # When in E2E fake LLM mode (NEXUS_E2E_FAKE_LLM=1), pass empty tool list to avoid loops;
+        # Otherwise, retain available tools in normal environment to support continuous tool calls.
+        tools_for_followup = (
+            [] if os.getenv("NEXUS_E2E_FAKE_LLM", "0") == "1" else run.tools
+        )
 
-            await self.bus.publish(Topics.LLM_REQUESTS, llm_request)
-            logger.info(f"Published follow-up LLM request for run_id={run_id}")
+        llm_request = Message.trusted(
+            run_id=run_id,
+            owner_key=run.owner_key,
+            role=_ROLE_SYSTEM,
+            content={
+                "messages": messages,
+                "tools": tools_for_followup,
+                "user_profile": run.metadata.get(
+                    "user_profile", {}
+                ),  # Pass user_profile for dynamic config
+            },
+        )
 
-        except Exception as e:
-            logger.error(f"Error handling tool result for run_id={message.run_id}: {e}")
+        await self.bus.publish(Topics.LLM_REQUESTS, llm_request, direct=True)
+        logger.debug("Published follow-up LLM request for run_id=%s", run_id)
@@ -20,15 +20,43 @@ Key classes:
 - PersistenceService: Main service handling message persistence
 """
 
+import asyncio
 import logging
-from typing import Any
+import time
+from typing import Any, Final
 
 from nexus.core.models import Message, Role
+from nexus.core.tasks import BackgroundTasks
 from nexus.core.topics import Topics
 from nexus.services.database.service import DatabaseService
 
 logger = logging.getLogger(__name__)
 
+# Enum members bound once at import for the per-message handlers
+_ROLE_AI: Final = Role.AI
+_ROLE_HUMAN: Final = Role.HUMAN
+_ROLE_SYSTEM: Final = Role.SYSTEM
+_ROLE_TOOL: Final = Role.TOOL
+
+# Stored as tool_calls for LLM results without any; shared since it is immutable
+_NO_TOOL_CALLS: Final = ()
+
+# Batched inserts: messages linger up to system.persistence_linger_ms and are
+# written together, early once PERSIST_BATCH_SIZE are buffered
+DEFAULT_PERSISTENCE_LINGER_MS: Final = 0
+PERSIST_BATCH_SIZE: Final = 64
+
+# Adaptive linger: below ADAPTIVE_LINGER_MIN_RATE messages/s each message is
+# written at once; above it the linger grows with the rate (rate / SCALE
+# seconds) up to the configured maximum
+ADAPTIVE_LINGER_MIN_RATE: Final = 100.0
+ADAPTIVE_LINGER_RATE_SCALE: Final = 200_000.0
+RATE_EWMA_ALPHA: Final = 0.2
+
+
+def _noop_log(*args: Any, **kwargs: Any) -> None:
+    """Stand-in for logger.debug when hot-path logging is silenced."""
+
 
 class PersistenceService:
     """Service responsible for persisting messages for conversation history.
@@ -38,13 +66,35 @@ class PersistenceService:
     the database for future context building and conversation history.
     """
 
-    def __init__(self, database_service: DatabaseService):
+    def __init__(
+        self,
+        database_service: DatabaseService,
+        linger: float = 0.0,
+        hot_path_silent: bool = False,
+    ):
         """Initialize PersistenceService.
 
         Args:
             database_service: The DatabaseService instance for data operations
+            linger: Maximum seconds to buffer messages for a batched insert
+                (0 inserts every message immediately)
+            hot_path_silent: Drop per-message debug logs; errors are still logged
         """
         self.database_service = database_service
+        self.linger = linger
+        # Per-message debug logger, swapped for a no-op when silenced
+        self._debug = _noop_log if hot_path_silent else logger.debug
+        # Messages awaiting a batched insert and the timer that flushes them
+        self._msg_buffer: list[Message] = []
+        self._flush_handle: asyncio.TimerHandle | None = None
+        # Flushes started by the linger timer, held until they finish
+        self._background = BackgroundTasks()
+        # Held by whichever write is awaiting the database, so unbatched
+        # inserts, linger flushes and the shutdown flush never interleave
+        self._write_lock = asyncio.Lock()
+        # EWMA of the message arrival rate (messages/s) driving the linger
+        self._rate_ewma = 0.0
+        self._last_arrival = 0.0
         logger.info("PersistenceService initialized")
 
     def subscribe_to_bus(self) -> None:
@@ -70,17 +120,95 @@ class PersistenceService:
             message: The Message object to persist
             message_type: Type description for logging (e.g., "human", "AI", "tool")
         """
-        success = await self.database_service.insert_message_async(message)
+        linger = self._adaptive_linger()
+        if linger > 0:
+            self._msg_buffer.append(message)
+            if len(self._msg_buffer) >= PERSIST_BATCH_SIZE:
+                await self._flush_buffer()
+            elif self._flush_handle is None:
+                self._flush_handle = asyncio.get_running_loop().call_later(
+                    linger, self._on_linger_elapsed
+                )
+            return
+
+        # Load just dropped: write what the last burst left behind along with it
+        if self._msg_buffer and not self._write_lock.locked():
+            self._msg_buffer.append(message)
+            await self._flush_buffer()
+            return
+
+        # Without a linger window, messages arriving while an insert is in
+        # flight are coalesced into one bulk insert issued once it completes
+        if self._write_lock.locked():
+            self._msg_buffer.append(message)
+            return
+
+        async with self._write_lock:
+            success = await self.database_service.insert_message_async(message)
+            if success:
+                self._debug(
+                    "Successfully persisted %s message: msg_id=%s",
+                    message_type,
+                    message.id,
+                )
+            else:
+                logger.error(
+                    f"Failed to persist {message_type} message: msg_id={message.id}"
+                )
+            await self._drain_buffer()
+
+    def _adaptive_linger(self) -> float:
+        """Record a message arrival and return how long it may linger.
+
+        Idle traffic gets no linger, so single messages keep synchronous
+        latency; bursts get a window proportional to the arrival rate, capped
+        at the configured linger.
+        """
+        now = time.monotonic()
+        interval = max(now - self._last_arrival, 1e-6)
+        self._last_arrival = now
+        self._rate_ewma += RATE_EWMA_ALPHA * (1.0 / interval - self._rate_ewma)
+
+        if self.linger <= 0 or self._rate_ewma < ADAPTIVE_LINGER_MIN_RATE:
+            return 0.0
+        return min(self.linger, self._rate_ewma / ADAPTIVE_LINGER_RATE_SCALE)
+
+    def _on_linger_elapsed(self) -> None:
+        """Timer callback: write the messages buffered during the linger window."""
+        self._flush_handle = None
+        self._background.spawn(self._flush_buffer(), "persist buffered messages")
+
+    async def flush(self) -> None:
+        """Wait for timer-started flushes, then write all buffered messages."""
+        await self._background.drain()
+        await self._flush_buffer()
+
+    async def _flush_buffer(self) -> None:
+        """Write all buffered messages, waiting for any write in flight."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        if not self._msg_buffer and not self._write_lock.locked():
+            return
+
+        async with self._write_lock:
+            await self._drain_buffer()
+
+    async def _drain_buffer(self) -> None:
+        """Bulk-insert buffered messages until none remain; caller holds the lock."""
+        while self._msg_buffer:
+            batch, self._msg_buffer = self._msg_buffer, []
+            await self._write_batch(batch)
+
+    async def _write_batch(self, batch: list[Message]) -> None:
+        """Write a batch of buffered messages with a single bulk insert."""
+        success = await self.database_service.insert_messages_async(batch)
         if success:
-            logger.info(
-                f"Successfully persisted {message_type} message: msg_id={message.id}"
-            )
+            self._debug("Successfully persisted batch of %d messages", len(batch))
         else:
-            logger.error(
-                f"Failed to persist {message_type} message: msg_id={message.id}"
-            )
+            logger.error(f"Failed to persist batch of {len(batch)} messages")
 
-    def _extract_user_input_from_run(self, run_obj) -> tuple[str, str]:
+    def _extract_user_input_from_run(self, run_obj: Any) -> tuple[str, str]:
         """Extract user input and status from Run object or dict.
 
         Args:
@@ -119,37 +247,32 @@ class PersistenceService:
         Args:
             message: Message containing the Run object with user input
         """
-        try:
-            logger.info(
-                f"Persisting human message for validated member: run_id={message.run_id}"
-            )
-
-            # Extract user input and status from run data
-            try:
-                user_input, run_status = self._extract_user_input_from_run(
-                    message.content
-                )
-            except ValueError as e:
-                logger.error(f"Invalid run data format in new run message: {e}")
-                return
-
-            # Trust OrchestratorService gatekeeper - if we received this message, user is a verified member
-            # No identity check needed here as Orchestrator already validated member status
-
-            # Create a message representing the human input
-            human_message = Message(
-                run_id=message.run_id,
-                owner_key=message.owner_key,
-                role=Role.HUMAN,
-                content=user_input,
-                metadata={"source": "new_run", "run_status": run_status},
-            )
+        self._debug(
+            "Persisting human message for validated member: run_id=%s",
+            message.run_id,
+        )
 
-            # Persist the human message
-            await self._persist_message(human_message, "human")
-
-        except Exception as e:
-            logger.error(f"Error handling new run for persistence: {e}")
+        # Extract user input and status from run data
+        try:
+            user_input, run_status = self._extract_user_input_from_run(message.content)
+        except ValueError as e:
+            logger.error(f"Invalid run data format in new run message: {e}")
+            return
+
+        # Trust OrchestratorService gatekeeper - if we received this message, user is a verified member
+        # No identity check needed here as Orchestrator already validated member status
+
+        # Create a message representing the human input
+        human_message = Message.trusted(
+            run_id=message.run_id,
+            owner_key=message.owner_key,
+            role=_ROLE_HUMAN,
+            content=user_input,
+            metadata={"source": "new_run", "run_status": run_status},
+        )
+
+        # Persist the human message
+        await self._persist_message(human_message, "human")
 
     async def handle_llm_result(self, message: Message) -> None:
         """Handle LLM result events and persist AI responses.
@@ -157,49 +280,45 @@ class PersistenceService:
         Args:
             message: Message containing LLM response data
         """
-        try:
-            logger.info(f"Handling LLM result for persistence: run_id={message.run_id}")
-
-            # Skip SYSTEM role messages (these are streaming events, not final results)
-            if message.role == Role.SYSTEM:
-                logger.debug(
-                    f"Skipping SYSTEM role message (streaming event): run_id={message.run_id}"
-                )
-                return
-
-            content = message.content
-            if not isinstance(content, dict):
-                logger.error(f"Invalid LLM result format: {type(content)}")
-                return
-
-            # Create a message representing the AI response
-            ai_content = content.get("content", "")
-            # Handle None content (when LLM only makes tool calls)
-            if ai_content is None:
-                ai_content = ""
-
-            # Skip empty content messages (these are intermediate streaming chunks)
-            if not ai_content and not content.get("tool_calls"):
-                logger.debug(f"Skipping empty content message: run_id={message.run_id}")
-                return
-
-            ai_message = Message(
-                run_id=message.run_id,
-                owner_key=message.owner_key,
-                role=Role.AI,
-                content=ai_content,
-                metadata={
-                    "source": "llm_result",
-                    "tool_calls": content.get("tool_calls", []),
-                    "has_tool_calls": bool(content.get("tool_calls")),
-                },
-            )
-
-            # Persist the AI message
-            await self._persist_message(ai_message, "AI")
-
-        except Exception as e:
-            logger.error(f"Error handling LLM result for persistence: {e}")
+        # Skip SYSTEM role messages (streaming events, not final results) before
+        # any other work; they make up most of the traffic on this topic
+        if message.role is _ROLE_SYSTEM:
+            return
+
+        self._debug("Handling LLM result for persistence: run_id=%s", message.run_id)
+
+        content = message.content
+        if not isinstance(content, dict):
+            logger.error(f"Invalid LLM result format: {type(content)}")
+            return
+
+        # Create a message representing the AI response
+        ai_content = content.get("content", "")
+        # Handle None content (when LLM only makes tool calls)
+        if ai_content is None:
+            ai_content = ""
+        tool_calls = content.get("tool_calls", _NO_TOOL_CALLS)
+        has_tool_calls = bool(tool_calls)
+
+        # Skip empty content messages (these are intermediate streaming chunks)
+        if not ai_content and not has_tool_calls:
+            self._debug("Skipping empty content message: run_id=%s", message.run_id)
+            return
+
+        ai_message = Message.trusted(
+            run_id=message.run_id,
+            owner_key=message.owner_key,
+            role=_ROLE_AI,
+            content=ai_content,
+            metadata={
+                "source": "llm_result",
+                "tool_calls": tool_calls,
+                "has_tool_calls": has_tool_calls,
+            },
+        )
+
+        # Persist the AI message
+        await self._persist_message(ai_message, "AI")
 
     async def handle_tool_result(self, message: Message) -> None:
         """Handle tool result events and persist tool execution outcomes.
@@ -207,44 +326,40 @@ class PersistenceService:
         Args:
             message: Message containing tool execution result
         """
-        try:
-            logger.info(
-                f"Handling tool result for persistence: run_id={message.run_id}"
-            )
-
-            content = message.content
-            if not isinstance(content, dict):
-                logger.error(f"Invalid tool result format: {type(content)}")
-                return
-
-            # Skip empty tool results
-            tool_result = content.get("result", "")
-            if not tool_result:
-                logger.debug(
-                    f"Skipping empty tool result: run_id={message.run_id}, tool={content.get('tool_name', 'unknown')}"
-                )
-                return
-
-            # Create a message representing the tool result
-            tool_message = Message(
-                run_id=message.run_id,
-                owner_key=message.owner_key,
-                role=Role.TOOL,
-                content=tool_result,
-                metadata={
-                    "source": "tool_result",
-                    "tool_name": content.get("tool_name", "unknown"),
-                    "status": content.get("status", "unknown"),
-                    "execution_success": content.get("status") == "success",
-                    "call_id": content.get("call_id", ""),
-                },
+        self._debug("Handling tool result for persistence: run_id=%s", message.run_id)
+
+        content = message.content
+        if not isinstance(content, dict):
+            logger.error(f"Invalid tool result format: {type(content)}")
+            return
+
+        # Skip empty tool results
+        tool_result = content.get("result", "")
+        if not tool_result:
+            self._debug(
+                "Skipping empty tool result: run_id=%s, tool=%s",
+                message.run_id,
+                content.get("tool_name", "unknown"),
             )
-
-            # Persist the tool message
-            await self._persist_message(tool_message, "tool")
-
-        except Exception as e:
-            logger.error(f"Error handling tool result for persistence: {e}")
+            return
+
+        # Create a message representing the tool result
+        tool_message = Message.trusted(
+            run_id=message.run_id,
+            owner_key=message.owner_key,
+            role=_ROLE_TOOL,
+            content=tool_result,
+            metadata={
+                "source": "tool_result",
+                "tool_name": content.get("tool_name", "unknown"),
+                "status": content.get("status", "unknown"),
+                "execution_success": content.get("status") == "success",
+                "call_id": content.get("call_id", ""),
+            },
+        )
+
+        # Persist the tool message
+        await self._persist_message(tool_message, "tool")
 
     async def get_history(
         self, owner_key: str, limit: int = 20
@@ -266,7 +381,9 @@ class PersistenceService:
             messages = await self.database_service.get_history_by_owner_key(
                 owner_key, limit
             )
-            logger.info(f"Retrieved {len(messages)} messages for owner_key={owner_key}")
+            logger.debug(
+                "Retrieved %d messages for owner_key=%s", len(messages), owner_key
+            )
             return messages
 
         except Exception as e:
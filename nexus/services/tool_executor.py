@@ -6,10 +6,13 @@ NexusBus. Handles tool execution asynchronously and publishes results back
 to the bus.
 
 Key features:
-- Async tool execution: Uses asyncio.to_thread to run synchronous tool functions
-  without blocking the event loop
+- Async tool execution: Runs synchronous tool functions through the registry's
+  dispatchers, in worker threads (the dedicated pool main binds to the
+  registry, sized by system.tool_pool_size) without blocking the event loop
 - Timeout control: Configurable execution timeout (system.tool_execution_timeout)
   to prevent hanging tools
+- Concurrency control: Per-tool limit (tools.<name>.max_concurrency) on
+  simultaneous executions
 - Error handling: Comprehensive error handling with detailed error messages
 - Result standardization: Publishes standardized result messages with status
   (success/error/timeout) and result payload
@@ -22,10 +25,15 @@ publish result to TOOLS_RESULTS → OrchestratorService handles result
 """
 
 import asyncio
+import contextlib
 import logging
+import time
+from collections import Counter, defaultdict
+from typing import Any
 
 from nexus.core.bus import NexusBus
 from nexus.core.models import Message, Role
+from nexus.core.tasks import BackgroundTasks
 from nexus.core.topics import Topics
 from nexus.services.config import ConfigService
 from nexus.tools.registry import ToolRegistry
@@ -41,6 +49,21 @@ TOOL_STATUS_TIMEOUT = "timeout"
 # Default timeout for tool execution (in seconds)
 DEFAULT_TOOL_TIMEOUT = 20
 
+# Tool results may be held for up to system.tool_results_flush_ms and published
+# together, early once system.tool_results_batch_size are buffered (0 ms
+# publishes each result immediately)
+DEFAULT_TOOL_RESULTS_FLUSH_MS = 0
+DEFAULT_TOOL_RESULTS_BATCH_SIZE = 32
+
+# Default cap on concurrent executions of one tool (tools.<name>.max_concurrency,
+# 0 for no limit), so a burst of a slow tool cannot take every worker thread
+DEFAULT_TOOL_MAX_CONCURRENCY = 8
+
+# Worker threads dedicated to sync tools (system.tool_pool_size), kept apart
+# from the loop's default executor used by other blocking calls; main owns
+# the pool and binds it to the registry before freezing it
+DEFAULT_TOOL_POOL_SIZE = 32
+
 
 class ToolExecutorService:
     """
@@ -76,13 +99,36 @@ class ToolExecutorService:
 
         # Get tool execution timeout from config, or use default
         self.tool_timeout = DEFAULT_TOOL_TIMEOUT
+        self.results_flush_delay = DEFAULT_TOOL_RESULTS_FLUSH_MS / 1000
+        self.results_batch_size = DEFAULT_TOOL_RESULTS_BATCH_SIZE
         if config_service:
             self.tool_timeout = config_service.get_int(
                 "system.tool_execution_timeout", DEFAULT_TOOL_TIMEOUT
             )
+            self.results_flush_delay = (
+                config_service.get_int(
+                    "system.tool_results_flush_ms", DEFAULT_TOOL_RESULTS_FLUSH_MS
+                )
+                / 1000
+            )
+            self.results_batch_size = config_service.get_int(
+                "system.tool_results_batch_size", DEFAULT_TOOL_RESULTS_BATCH_SIZE
+            )
+
+        # Results awaiting a batched publish and the timer that flushes them
+        self._results_buffer: list[Message] = []
+        self._results_flush_handle: asyncio.TimerHandle | None = None
+        # Publishes started by the flush timer, held until they finish
+        self._background = BackgroundTasks()
+        # Per-tool concurrency limiters, created on first use
+        self._semaphores: dict[str, asyncio.Semaphore | None] = {}
+        # Per-tool call counts by status and cumulative execution time; only
+        # touched from the event loop, so plain dicts need no locking
+        self._call_counts: Counter[tuple[str, str]] = Counter()
+        self._latency_totals: defaultdict[str, float] = defaultdict(float)
 
         logger.info(
-            f"ToolExecutorService initialized with timeout={self.tool_timeout}s"
+            "ToolExecutorService initialized with timeout=%ss", self.tool_timeout
         )
 
     def subscribe_to_bus(self) -> None:
@@ -90,6 +136,83 @@ class ToolExecutorService:
         self.bus.subscribe(Topics.TOOLS_REQUESTS, self.handle_tool_request)
         logger.info("ToolExecutorService subscribed to NexusBus")
 
+    async def aclose(self) -> None:
+        """Publish buffered results and log tool stats."""
+        await self._background.drain()
+        await self.flush_results()
+        for tool_name, stats in self.get_tool_stats().items():
+            latency_total = stats.pop("latency_total", 0.0)
+            logger.info(
+                "Tool stats: tool=%s calls=%s latency_total=%.3fs",
+                tool_name,
+                stats,
+                latency_total,
+            )
+        logger.info("ToolExecutorService closed")
+
+    def _record_call(self, tool_name: str, status: str, elapsed: float) -> None:
+        """Count a finished tool call and add its execution time."""
+        self._call_counts[tool_name, status] += 1
+        self._latency_totals[tool_name] += elapsed
+
+    def get_tool_stats(self) -> dict[str, dict[str, float]]:
+        """
+        Return per-tool call counts by status and total execution seconds.
+
+        Returns:
+            Mapping of tool name to {status: count, ..., "latency_total": seconds}
+        """
+        stats: dict[str, dict[str, float]] = {}
+        for (tool_name, status), count in self._call_counts.items():
+            stats.setdefault(tool_name, {})[status] = count
+        for tool_name, total in self._latency_totals.items():
+            stats.setdefault(tool_name, {})["latency_total"] = total
+        return stats
+
+    def _get_semaphore(self, tool_name: str) -> asyncio.Semaphore | None:
+        """Return the concurrency limiter for a tool, or None if it is unlimited."""
+        if tool_name not in self._semaphores:
+            limit = DEFAULT_TOOL_MAX_CONCURRENCY
+            if self.config_service:
+                limit = self.config_service.get_int(
+                    f"tools.{tool_name}.max_concurrency", DEFAULT_TOOL_MAX_CONCURRENCY
+                )
+            self._semaphores[tool_name] = (
+                asyncio.Semaphore(limit) if limit > 0 else None
+            )
+        return self._semaphores[tool_name]
+
+    async def _publish_result(self, result_message: Message) -> None:
+        """Publish a tool result, buffering it when a flush delay is configured."""
+        if self.results_flush_delay <= 0:
+            await self.bus.publish(Topics.TOOLS_RESULTS, result_message)
+            return
+
+        self._results_buffer.append(result_message)
+        if len(self._results_buffer) >= self.results_batch_size:
+            await self.flush_results()
+        elif self._results_flush_handle is None:
+            self._results_flush_handle = asyncio.get_running_loop().call_later(
+                self.results_flush_delay, self._on_results_flush_elapsed
+            )
+
+    def _on_results_flush_elapsed(self) -> None:
+        """Timer callback: publish the results buffered during the flush delay."""
+        self._results_flush_handle = None
+        self._background.spawn(self.flush_results(), "publish buffered tool results")
+
+    async def flush_results(self) -> None:
+        """Publish all buffered tool results as one batch."""
+        if self._results_flush_handle is not None:
+            self._results_flush_handle.cancel()
+            self._results_flush_handle = None
+        if not self._results_buffer:
+            return
+
+        batch, self._results_buffer = self._results_buffer, []
+        await self.bus.publish_batch(Topics.TOOLS_RESULTS, batch)
+        logger.debug("Published batch of %d tool results", len(batch))
+
     def _create_tool_result_message(
         self,
         run_id: str,
@@ -112,7 +235,7 @@ class ToolExecutorService:
         Returns:
             A Message object containing the tool result
         """
-        return Message(
+        return Message.trusted(
             run_id=run_id,
             owner_key=owner_key,
             role=Role.TOOL,
@@ -135,9 +258,11 @@ class ToolExecutorService:
         owner_key = message.owner_key
         tool_name = None
         call_id = ""
+        # Set once the tool is dispatched (after any queueing); 0.0 before
+        started = 0.0
 
         try:
-            logger.info(f"Handling tool request for run_id={run_id}")
+            logger.debug("Handling tool request for run_id=%s", run_id)
 
             # Parse tool request from message content
             content = message.content
@@ -151,44 +276,60 @@ class ToolExecutorService:
             if not tool_name:
                 raise ValueError("Tool request missing 'name' field")
 
-            logger.info(
-                f"Executing tool '{tool_name}' with args: {tool_args} for run_id={run_id}"
+            logger.debug(
+                "Executing tool '%s' with args: %s for run_id=%s",
+                tool_name,
+                tool_args,
+                run_id,
             )
 
             # Ensure tool_args is a dictionary
             if not isinstance(tool_args, dict):
                 logger.error(
-                    f"Tool args must be a dictionary, got {type(tool_args)}: {tool_args}"
+                    "Tool args must be a dictionary, got %s: %s",
+                    type(tool_args),
+                    tool_args,
                 )
                 raise ValueError(
                     f"Tool args must be a dictionary, got {type(tool_args)}"
                 )
 
-            # Get tool function from registry
-            tool_function = self.tool_registry.get_tool_function(tool_name)
-            if tool_function is None:
+            # Get the tool's dispatcher from registry; it already knows whether
+            # to await the function directly or run it in a worker thread
+            dispatcher = self.tool_registry.get_tool_dispatcher(tool_name)
+            if dispatcher is None:
                 raise ValueError(f"Tool '{tool_name}' not found in registry")
 
+            # Limit concurrent runs of this tool; queued calls wait outside the
+            # timeout so time spent queueing is not charged to the tool
+            semaphore = self._get_semaphore(tool_name)
+            limiter: contextlib.AbstractAsyncContextManager[Any] = (
+                semaphore if semaphore is not None else contextlib.nullcontext()
+            )
+            if semaphore is not None and semaphore.locked():
+                logger.info(
+                    "Tool '%s' at max concurrency; queueing run_id=%s",
+                    tool_name,
+                    run_id,
+                )
+
             # Execute tool function with timeout
-            # Handle both sync and async tool functions
+            # asyncio.timeout scopes the deadline to this task instead of
+            # wrapping the call in an extra one
             try:
-                if asyncio.iscoroutinefunction(tool_function):
-                    # For async functions, call directly
-                    result = await asyncio.wait_for(
-                        tool_function(**tool_args), timeout=self.tool_timeout
-                    )
-                else:
-                    # For sync functions, use asyncio.to_thread to avoid blocking
-                    result = await asyncio.wait_for(
-                        asyncio.to_thread(tool_function, **tool_args),
-                        timeout=self.tool_timeout,
-                    )
+                async with limiter:
+                    started = time.perf_counter()
+                    async with asyncio.timeout(self.tool_timeout):
+                        result = await dispatcher(tool_args)
             except TimeoutError:
+                self._record_call(
+                    tool_name, TOOL_STATUS_TIMEOUT, time.perf_counter() - started
+                )
                 # Handle timeout specifically
                 timeout_msg = (
                     f"Tool '{tool_name}' execution timed out after {self.tool_timeout}s"
                 )
-                logger.error(f"{timeout_msg} for run_id={run_id}")
+                logger.error("%s for run_id=%s", timeout_msg, run_id)
 
                 # Create and publish timeout error result
                 timeout_message = self._create_tool_result_message(
@@ -199,9 +340,13 @@ class ToolExecutorService:
                     tool_name=tool_name,
                     call_id=call_id,
                 )
-                await self.bus.publish(Topics.TOOLS_RESULTS, timeout_message)
+                await self._publish_result(timeout_message)
                 return
 
+            self._record_call(
+                tool_name, TOOL_STATUS_SUCCESS, time.perf_counter() - started
+            )
+
             # Create and publish success result
             result_message = self._create_tool_result_message(
                 run_id=run_id,
@@ -211,13 +356,23 @@ class ToolExecutorService:
                 tool_name=tool_name,
                 call_id=call_id,
             )
-            await self.bus.publish(Topics.TOOLS_RESULTS, result_message)
-            logger.info(f"Tool '{tool_name}' executed successfully for run_id={run_id}")
+            await self._publish_result(result_message)
+            logger.debug(
+                "Tool '%s' executed successfully for run_id=%s", tool_name, run_id
+            )
 
         except Exception as e:
             error_msg = str(e)
+            self._record_call(
+                tool_name or TOOL_STATUS_UNKNOWN,
+                TOOL_STATUS_ERROR,
+                time.perf_counter() - started if started else 0.0,
+            )
             logger.error(
-                f"Tool execution failed for run_id={run_id}, tool='{tool_name}': {error_msg}"
+                "Tool execution failed for run_id=%s, tool='%s': %s",
+                run_id,
+                tool_name,
+                error_msg,
             )
 
             # Create and publish error result
@@ -229,4 +384,4 @@ class ToolExecutorService:
                 tool_name=tool_name or TOOL_STATUS_UNKNOWN,
                 call_id=call_id,
             )
-            await self.bus.publish(Topics.TOOLS_RESULTS, error_message)
+            await self._publish_result(error_message)
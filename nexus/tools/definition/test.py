@@ -5,18 +5,70 @@ Provides a debugging test tool that randomly succeeds or fails with 50% probabil
 This tool is designed for testing the tool execution system and debugging purposes.
 """
 
+import asyncio
 import logging
 import random
+import threading
 import time
 from typing import Any
 
 logger = logging.getLogger(__name__)
 
+# Tool definitions the registry reads from this module
+__tools__ = ("TEST_TOOL",)
+
 # Constants
 SUCCESS_PROBABILITY = 0.5
 MIN_EXECUTION_TIME = 0.5  # Minimum execution time in seconds
 MAX_EXECUTION_TIME = 2.0  # Maximum execution time in seconds
 
+# Per-thread generators, since the sync tool runs in worker threads
+_TLS = threading.local()
+
+
+def _rng() -> random.Random:
+    """Return this thread's random generator, creating it on first use."""
+    rng = getattr(_TLS, "rng", None)
+    if rng is None:
+        _TLS.rng = rng = random.Random()
+    return rng
+
+
+def _build_outcome(message: str, execution_time: float, rng: random.Random) -> str:
+    """
+    Decide the random outcome of a test tool run.
+
+    Returns:
+        str: A formatted success response
+
+    Raises:
+        RuntimeError: When the tool randomly fails (50% probability)
+    """
+    # Generate random success/failure with 50% probability
+    success = rng.random() < SUCCESS_PROBABILITY
+
+    if success:
+        result = (
+            f"✅ Test tool executed successfully!\n"
+            f"Message: {message}\n"
+            f"Execution time: {execution_time:.2f}s\n"
+            f"Status: SUCCESS\n"
+            f"Random value: {rng.random():.4f}"
+        )
+
+        logger.info("Test tool completed successfully in %.2fs", execution_time)
+        return result
+    else:
+        error_msg = (
+            f"Test tool failed randomly (50% probability)\n"
+            f"Message: {message}\n"
+            f"Execution time: {execution_time:.2f}s\n"
+            f"Status: FAILED"
+        )
+
+        logger.warning("Test tool failed randomly after %.2fs", execution_time)
+        raise RuntimeError(error_msg)
+
 
 def test_tool(message: str = "Hello from test tool!") -> str:
     """
@@ -36,39 +88,50 @@ def test_tool(message: str = "Hello from test tool!") -> str:
         RuntimeError: When the tool randomly fails (50% probability)
     """
     try:
-        logger.info(f"Test tool started with message: '{message}'")
+        logger.info("Test tool started with message: '%s'", message)
 
         # Simulate realistic execution time
-        execution_time = random.uniform(MIN_EXECUTION_TIME, MAX_EXECUTION_TIME)
-        time.sleep(execution_time)
-
-        # Generate random success/failure with 50% probability
-        success = random.random() < SUCCESS_PROBABILITY
-
-        if success:
-            result = (
-                f"✅ Test tool executed successfully!\n"
-                f"Message: {message}\n"
-                f"Execution time: {execution_time:.2f}s\n"
-                f"Status: SUCCESS\n"
-                f"Random value: {random.random():.4f}"
-            )
-
-            logger.info(f"Test tool completed successfully in {execution_time:.2f}s")
-            return result
-        else:
-            error_msg = (
-                f"Test tool failed randomly (50% probability)\n"
-                f"Message: {message}\n"
-                f"Execution time: {execution_time:.2f}s\n"
-                f"Status: FAILED"
-            )
-
-            logger.warning(f"Test tool failed randomly after {execution_time:.2f}s")
-            raise RuntimeError(error_msg)
+        rng = _rng()
+        execution_time = rng.uniform(MIN_EXECUTION_TIME, MAX_EXECUTION_TIME)
+        if execution_time:
+            time.sleep(execution_time)
+
+        return _build_outcome(message, execution_time, rng)
+
+    except Exception as e:
+        logger.error("Test tool execution error: %s", e)
+        raise
+
+
+async def test_tool_async(message: str = "Hello from test tool!") -> str:
+    """
+    Coroutine variant of test_tool, registered in its place.
+
+    Simulates execution time with asyncio.sleep, so concurrent runs wait on
+    the event loop instead of each holding a worker thread.
+
+    Args:
+        message: A custom message to include in the response (default: "Hello from test tool!")
+
+    Returns:
+        str: A formatted response indicating success or failure
+
+    Raises:
+        RuntimeError: When the tool randomly fails (50% probability)
+    """
+    try:
+        logger.info("Test tool started with message: '%s'", message)
+
+        # Simulate realistic execution time
+        rng = _rng()
+        execution_time = rng.uniform(MIN_EXECUTION_TIME, MAX_EXECUTION_TIME)
+        if execution_time:
+            await asyncio.sleep(execution_time)
+
+        return _build_outcome(message, execution_time, rng)
 
     except Exception as e:
-        logger.error(f"Test tool execution error: {str(e)}")
+        logger.error("Test tool execution error: %s", e)
         raise
 
 
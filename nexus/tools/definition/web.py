@@ -5,14 +5,20 @@ Provides web search functionality using the Tavily API. This module defines
 the web_search function and its corresponding tool metadata for LLM integration.
 """
 
+import asyncio
 import logging
 import os
+import threading
+from itertools import islice
 from typing import Any
 
-from tavily import TavilyClient
+from tavily import AsyncTavilyClient, TavilyClient
 
 logger = logging.getLogger(__name__)
 
+# Tool definitions the registry reads from this module
+__tools__ = ("WEB_SEARCH_TOOL", "WEB_EXTRACT_TOOL")
+
 # Constants
 MAX_SEARCH_RESULTS = 5
 CONTENT_PREVIEW_LENGTH = 200
@@ -20,6 +26,96 @@ DEFAULT_TITLE = "No title"
 DEFAULT_URL = "No URL"
 DEFAULT_CONTENT = "No content available"
 ENV_VAR_API_KEY = "TAVILY_API_KEY"
+# Extracted content (characters) above which formatting moves to a worker thread
+EXTRACT_FORMAT_OFFLOAD_THRESHOLD = 256 * 1024
+
+# Shared Tavily client (and its HTTP session) keyed by the API key it was built
+# with; tools run in worker threads, so creation is guarded by a lock
+_client: tuple[str, TavilyClient] | None = None
+_client_lock = threading.Lock()
+
+
+def _get_client(api_key: str) -> TavilyClient:
+    """
+    Return the shared TavilyClient for api_key, creating it on first use.
+
+    Reusing the client keeps its HTTPS connections alive across calls; a
+    changed API key replaces the cached client.
+    """
+    global _client
+    cached = _client
+    if cached is not None and cached[0] == api_key:
+        return cached[1]
+    with _client_lock:
+        if _client is None or _client[0] != api_key:
+            _client = (api_key, TavilyClient(api_key=api_key))
+        return _client[1]
+
+
+# Shared async client for the coroutine variants; it is only touched from the
+# event loop thread, so no lock is needed
+_async_client: tuple[str, AsyncTavilyClient] | None = None
+
+
+def _get_async_client(api_key: str) -> AsyncTavilyClient:
+    """Return the shared AsyncTavilyClient for api_key, creating it on first use."""
+    global _async_client
+    if _async_client is None or _async_client[0] != api_key:
+        _async_client = (api_key, AsyncTavilyClient(api_key=api_key))
+    return _async_client[1]
+
+
+# Upstream searches in flight, keyed by (query, max_results); concurrent
+# identical searches await the same task instead of each calling Tavily
+_inflight_searches: dict[tuple[str, int], asyncio.Task[dict[str, Any]]] = {}
+
+
+async def _search_single_flight(
+    client: AsyncTavilyClient, query: str, max_results: int
+) -> dict[str, Any]:
+    """
+    Run a Tavily search, sharing the request with identical concurrent calls.
+
+    The upstream call runs in its own task and every caller awaits it through
+    asyncio.shield, so one caller timing out does not cancel it for the rest.
+    """
+    key = (query, max_results)
+    task = _inflight_searches.get(key)
+    if task is None:
+        task = asyncio.ensure_future(client.search(query, max_results=max_results))
+        _inflight_searches[key] = task
+        task.add_done_callback(lambda _: _inflight_searches.pop(key, None))
+    else:
+        logger.debug("Joining in-flight web search for query: %s", query)
+    return await asyncio.shield(task)
+
+
+# API key resolved once when the tool module is loaded (at tool discovery,
+# after the environment has been set up); reload_api_key re-reads it
+_api_key: str | None = os.getenv(ENV_VAR_API_KEY)
+if not _api_key:
+    logger.warning("%s not set; web tools will fail until it is", ENV_VAR_API_KEY)
+
+
+def reload_api_key() -> None:
+    """Re-read the Tavily API key from the environment."""
+    global _api_key
+    _api_key = os.getenv(ENV_VAR_API_KEY)
+
+
+def _get_api_key() -> str:
+    """
+    Return the Tavily API key resolved from the environment.
+
+    Raises:
+        ValueError: If TAVILY_API_KEY environment variable is not set
+    """
+    api_key = _api_key
+    if not api_key:
+        error_msg = f"{ENV_VAR_API_KEY} environment variable not set"
+        logger.error(error_msg)
+        raise ValueError(error_msg)
+    return api_key
 
 
 def _format_search_results(
@@ -43,27 +139,27 @@ def _format_search_results(
     if not results:
         return f"No search results found for query: {query}"
 
+    parts: list[str] = []
+
     # Start with AI answer if requested and available
-    formatted_results = ""
     if include_answer and "answer" in response and response["answer"]:
-        formatted_results += f"**AI Summary:**\n{response['answer']}\n\n"
+        parts.append(f"**AI Summary:**\n{response['answer']}\n\n")
 
     # Format the search results
-    formatted_results += f"**Search results for '{query}':**\n\n"
+    parts.append(f"**Search results for '{query}':**\n\n")
 
-    for i, result in enumerate(results[:MAX_SEARCH_RESULTS], 1):
+    # islice avoids copying the result list; content is only sliced when it
+    # actually needs truncating
+    for i, result in enumerate(islice(results, MAX_SEARCH_RESULTS), 1):
         title = result.get("title", DEFAULT_TITLE)
         url = result.get("url", DEFAULT_URL)
         content = result.get("content", DEFAULT_CONTENT)
 
-        formatted_results += f"{i}. **{title}**\n"
-        formatted_results += f"   URL: {url}\n"
-        content_preview = content[:CONTENT_PREVIEW_LENGTH]
         if len(content) > CONTENT_PREVIEW_LENGTH:
-            content_preview += "..."
-        formatted_results += f"   Content: {content_preview}\n\n"
+            content = content[:CONTENT_PREVIEW_LENGTH] + "..."
+        parts.append(f"{i}. **{title}**\n   URL: {url}\n   Content: {content}\n\n")
 
-    return formatted_results
+    return "".join(parts)
 
 
 def web_search(query: str, max_results: int = 5, include_answer: bool = False) -> str:
@@ -87,26 +183,25 @@ def web_search(query: str, max_results: int = 5, include_answer: bool = False) -
         raise ValueError("max_results must be between 0 and 20")
 
     logger.info(
-        f"Executing web search for query: {query}, max_results: {max_results}, include_answer: {include_answer}"
+        "Executing web search for query: %s, max_results: %s, include_answer: %s",
+        query,
+        max_results,
+        include_answer,
     )
 
     # Get API key from environment
-    api_key = os.getenv(ENV_VAR_API_KEY)
-    if not api_key:
-        error_msg = f"{ENV_VAR_API_KEY} environment variable not set"
-        logger.error(error_msg)
-        raise ValueError(error_msg)
+    api_key = _get_api_key()
 
     try:
-        # Initialize Tavily client
-        client = TavilyClient(api_key=api_key)
+        # Reuse the shared Tavily client
+        client = _get_client(api_key)
 
         # Perform search with max_results parameter
         response = client.search(query, max_results=max_results)
 
         # Format results
         formatted_results = _format_search_results(query, response, include_answer)
-        logger.info(f"Web search completed successfully for query: {query}")
+        logger.info("Web search completed successfully for query: %s", query)
         return formatted_results
 
     except Exception as e:
@@ -129,14 +224,10 @@ def web_extract(urls: str | list[str]) -> str:
         ValueError: If TAVILY_API_KEY environment variable is not set
         Exception: If the extraction request fails
     """
-    logger.info(f"Executing web extract for URLs: {urls}")
+    logger.info("Executing web extract for URLs: %s", urls)
 
     # Get API key from environment
-    api_key = os.getenv(ENV_VAR_API_KEY)
-    if not api_key:
-        error_msg = f"{ENV_VAR_API_KEY} environment variable not set"
-        logger.error(error_msg)
-        raise ValueError(error_msg)
+    api_key = _get_api_key()
 
     # Convert single URL to list
     if isinstance(urls, str):
@@ -145,8 +236,8 @@ def web_extract(urls: str | list[str]) -> str:
         urls_list = urls
 
     try:
-        # Initialize Tavily client
-        client = TavilyClient(api_key=api_key)
+        # Reuse the shared Tavily client
+        client = _get_client(api_key)
 
         # Perform extraction
         response = client.extract(
@@ -155,7 +246,96 @@ def web_extract(urls: str | list[str]) -> str:
 
         # Format results
         formatted_results = _format_extract_results(urls_list, response)
-        logger.info(f"Web extract completed successfully for URLs: {urls}")
+        logger.info("Web extract completed successfully for URLs: %s", urls)
+        return formatted_results
+
+    except Exception as e:
+        error_msg = f"Web extract failed for URLs {urls}: {str(e)}"
+        logger.error(error_msg)
+        raise Exception(error_msg) from e
+
+
+async def web_search_async(
+    query: str, max_results: int = 5, include_answer: bool = False
+) -> str:
+    """
+    Perform a web search using the Tavily API without blocking a thread.
+
+    Coroutine counterpart of web_search, registered in its place so the tool
+    executor awaits it directly instead of using a worker thread.
+
+    Args:
+        query: The search query string
+        max_results: Maximum number of results to return (0-20, default: 5)
+        include_answer: Whether to include AI-generated answer summary (default: False)
+
+    Returns:
+        A formatted string containing search results and optionally AI answer
+
+    Raises:
+        ValueError: If TAVILY_API_KEY environment variable is not set or max_results is invalid
+        Exception: If the search request fails
+    """
+    if not 0 <= max_results <= 20:
+        raise ValueError("max_results must be between 0 and 20")
+
+    logger.info(
+        "Executing web search for query: %s, max_results: %s, include_answer: %s",
+        query,
+        max_results,
+        include_answer,
+    )
+    api_key = _get_api_key()
+
+    try:
+        client = _get_async_client(api_key)
+        response = await _search_single_flight(client, query, max_results)
+
+        formatted_results = _format_search_results(query, response, include_answer)
+        logger.info("Web search completed successfully for query: %s", query)
+        return formatted_results
+
+    except Exception as e:
+        error_msg = f"Web search failed for query '{query}': {str(e)}"
+        logger.error(error_msg)
+        raise Exception(error_msg) from e
+
+
+async def web_extract_async(urls: str | list[str]) -> str:
+    """
+    Extract raw content from web pages without blocking a thread.
+
+    Coroutine counterpart of web_extract, registered in its place.
+
+    Args:
+        urls: A single URL string or list of URLs to extract content from
+
+    Returns:
+        A formatted string containing extracted raw content from the URLs
+
+    Raises:
+        ValueError: If TAVILY_API_KEY environment variable is not set
+        Exception: If the extraction request fails
+    """
+    logger.info("Executing web extract for URLs: %s", urls)
+    api_key = _get_api_key()
+
+    urls_list = [urls] if isinstance(urls, str) else urls
+
+    try:
+        client = _get_async_client(api_key)
+        response = await client.extract(
+            urls_list, extract_depth="basic", include_images=False
+        )
+
+        # Large pages are formatted in a worker thread to keep the loop responsive
+        if _extract_content_size(response) > EXTRACT_FORMAT_OFFLOAD_THRESHOLD:
+            formatted_results = await asyncio.to_thread(
+                _format_extract_results, urls_list, response
+            )
+        else:
+            formatted_results = _format_extract_results(urls_list, response)
+        logger.info("Web extract completed successfully for URLs: %s", urls)
         return formatted_results
 
     except Exception as e:
@@ -164,6 +344,15 @@ def web_extract(urls: str | list[str]) -> str:
         raise Exception(error_msg) from e
 
 
+def _extract_content_size(response: dict[str, Any]) -> int:
+    """Return the total length of raw_content across extraction results."""
+    if not response:
+        return 0
+    return sum(
+        len(result.get("raw_content") or "") for result in response.get("results") or ()
+    )
+
+
 def _format_extract_results(urls: list[str], response: dict[str, Any]) -> str:
     """
     Format extraction results into a readable string.
@@ -178,7 +367,7 @@ def _format_extract_results(urls: list[str], response: dict[str, Any]) -> str:
     if not response:
         return f"No extraction results found for URLs: {urls}"
 
-    formatted_results = ""
+    parts: list[str] = []
 
     # Process successful results
     if "results" in response and response["results"]:
@@ -186,23 +375,24 @@ def _format_extract_results(urls: list[str], response: dict[str, Any]) -> str:
             url = result.get("url", "Unknown URL")
             raw_content = result.get("raw_content", "No content available")
 
-            formatted_results += f"**Extracted content from {url}:**\n"
-            formatted_results += f"{raw_content}\n\n"
+            parts.append(f"**Extracted content from {url}:**\n{raw_content}\n\n")
 
     # Process failed results
     if "failed_results" in response and response["failed_results"]:
-        formatted_results += "**Failed extractions:**\n"
+        parts.append("**Failed extractions:**\n")
         for failed in response["failed_results"]:
             url = failed.get("url", "Unknown URL")
             error = failed.get("error", "Unknown error")
-            formatted_results += f"- Failed to extract: {url} (Error: {error})\n"
-        formatted_results += "\n"
+            parts.append(f"- Failed to extract: {url} (Error: {error})\n")
+        parts.append("\n")
+
+    formatted_results = "".join(parts).strip()
 
     # If no results at all
-    if not formatted_results.strip():
+    if not formatted_results:
         return f"No content could be extracted from URLs: {urls}"
 
-    return formatted_results.strip()
+    return formatted_results
 
 
 # Tool definition in OpenAI/Google format for LLM integration
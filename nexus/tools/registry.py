@@ -7,14 +7,89 @@ function implementations. Features automatic tool discovery and registration
 from specified module paths.
 """
 
+import asyncio
+import contextvars
+import functools
 import importlib
+import inspect
 import logging
 import pkgutil
-from collections.abc import Callable
-from typing import Any
+import sys
+import threading
+from collections.abc import Awaitable, Callable
+from concurrent.futures import Executor, ThreadPoolExecutor
+from types import ModuleType
+from typing import Any, NamedTuple
 
 logger = logging.getLogger(__name__)
 
+# Tool discovery imports this many modules or fewer serially, more in a
+# thread pool of at most MAX_IMPORT_WORKERS
+SERIAL_IMPORT_MAX_MODULES = 2
+MAX_IMPORT_WORKERS = 8
+
+# Starts a tool with its keyword arguments and returns the awaitable result
+ToolDispatcher = Callable[[dict[str, Any]], Awaitable[Any]]
+
+
+def make_tool_dispatcher(
+    tool_function: Callable, executor: Executor | None = None
+) -> ToolDispatcher:
+    """
+    Build the dispatcher for a tool function, choosing the call strategy once.
+
+    Coroutine functions (including decorated ones exposing __wrapped__) are
+    called directly; sync functions run in a worker thread so they do not block
+    the event loop, on the given executor or else via asyncio.to_thread.
+    """
+    if asyncio.iscoroutinefunction(tool_function) or asyncio.iscoroutinefunction(
+        getattr(tool_function, "__wrapped__", None)
+    ):
+
+        def dispatch_async(args: dict[str, Any]) -> Awaitable[Any]:
+            awaitable: Awaitable[Any] = tool_function(**args)
+            return awaitable
+
+        return dispatch_async
+
+    if executor is not None:
+
+        def dispatch_in_executor(args: dict[str, Any]) -> Awaitable[Any]:
+            # Carry context variables into the worker, as asyncio.to_thread does
+            call = functools.partial(
+                contextvars.copy_context().run, tool_function, **args
+            )
+            return asyncio.get_running_loop().run_in_executor(executor, call)
+
+        return dispatch_in_executor
+
+    def dispatch_in_thread(args: dict[str, Any]) -> Awaitable[Any]:
+        return asyncio.to_thread(tool_function, **args)
+
+    return dispatch_in_thread
+
+
+def _extract_tool_name(tool_definition: dict[str, Any]) -> str | None:
+    """
+    Return the interned function.name of a tool definition, or None if invalid.
+
+    Interning lets lookups with interned names (string constants, other
+    registry keys) match by identity.
+    """
+    function_spec = tool_definition.get("function")
+    name = function_spec.get("name") if isinstance(function_spec, dict) else None
+    if not isinstance(name, str) or not name:
+        return None
+    return sys.intern(name)
+
+
+class ToolEntry(NamedTuple):
+    """A registered tool: its definition, implementation and dispatcher."""
+
+    definition: dict[str, Any]
+    function: Callable
+    dispatcher: ToolDispatcher
+
 
 class ToolRegistry:
     """
@@ -25,14 +100,66 @@ class ToolRegistry:
     (for execution).
     """
 
+    # No per-instance __dict__; patch methods on the class, not an instance
+    __slots__ = (
+        "_entries",
+        "_executor",
+        "_defs_cache",
+        "_names_cache",
+        "_frozen",
+    )
+
     def __init__(self) -> None:
         """Initialize an empty tool registry."""
-        # Store tool metadata (OpenAI/Google format)
-        self._tools: dict[str, dict[str, Any]] = {}
-        # Store actual function implementations
-        self._functions: dict[str, Callable] = {}
+        # Tool metadata (OpenAI/Google format), implementation and the
+        # dispatcher precomputed for the tool executor, found with one lookup
+        self._entries: dict[str, ToolEntry] = {}
+        # Executor for sync tools; None uses the loop's default executor
+        self._executor: Executor | None = None
+        # Snapshots of definitions and names, rebuilt after (un)registration
+        self._defs_cache: tuple[dict[str, Any], ...] | None = None
+        self._names_cache: tuple[str, ...] | None = None
+        # Set by freeze(); registration changes are refused afterwards
+        self._frozen = False
         logger.info("ToolRegistry initialized")
 
+    def freeze(self) -> None:
+        """
+        Make the registry read-only once tools are registered and configured.
+
+        Builds the definition and name snapshots up front so later calls only
+        copy them. register, unregister and set_executor raise RuntimeError
+        afterwards.
+        """
+        self._defs_cache = tuple(e.definition for e in self._entries.values())
+        self._names_cache = tuple(self._entries)
+        self._frozen = True
+        logger.info("ToolRegistry frozen with %d tools", len(self._entries))
+
+    def _ensure_mutable(self) -> None:
+        """Raise RuntimeError if the registry has been frozen."""
+        if self._frozen:
+            raise RuntimeError("ToolRegistry is frozen; tools cannot be changed")
+
+    def set_executor(self, executor: Executor | None) -> None:
+        """
+        Run sync tools on the given executor instead of the default one.
+
+        Rebuilds the dispatchers of already registered tools.
+
+        Args:
+            executor: Executor for sync tool functions, or None for the default
+
+        Raises:
+            RuntimeError: If the registry has been frozen
+        """
+        self._ensure_mutable()
+        self._executor = executor
+        for name, entry in self._entries.items():
+            self._entries[name] = entry._replace(
+                dispatcher=make_tool_dispatcher(entry.function, executor)
+            )
+
     def register(
         self, tool_definition: dict[str, Any], tool_function: Callable
     ) -> None:
@@ -44,32 +171,37 @@ class ToolRegistry:
             tool_function: The actual function implementation
 
         Raises:
-            ValueError: If tool_definition is invalid or tool already exists
+            ValueError: If tool_definition is missing function.name
+            RuntimeError: If the registry has been frozen
         """
-        try:
-            # Extract tool name from definition
-            if (
-                "function" not in tool_definition
-                or "name" not in tool_definition["function"]
-            ):
-                raise ValueError("Invalid tool definition: missing function.name")
+        # Validate up front so the happy path runs without a try block
+        tool_name = _extract_tool_name(tool_definition)
+        if tool_name is None:
+            error_msg = "Invalid tool definition: missing function.name"
+            logger.error("Failed to register tool: %s", error_msg)
+            raise ValueError(error_msg)
 
-            tool_name = tool_definition["function"]["name"]
+        self._register_validated(tool_name, tool_definition, tool_function)
 
-            # Check if tool already exists
-            if tool_name in self._tools:
-                logger.warning(f"Tool '{tool_name}' already registered, overwriting")
+    def _register_validated(
+        self, tool_name: str, tool_definition: dict[str, Any], tool_function: Callable
+    ) -> None:
+        """Register a tool whose name was already taken from its definition."""
+        self._ensure_mutable()
 
-            # Register the tool
-            self._tools[tool_name] = tool_definition
-            self._functions[tool_name] = tool_function
+        # Check if tool already exists
+        if tool_name in self._entries:
+            logger.warning("Tool '%s' already registered, overwriting", tool_name)
 
-            logger.info(f"Tool '{tool_name}' registered successfully")
+        # Register the tool
+        self._entries[tool_name] = ToolEntry(
+            tool_definition,
+            tool_function,
+            make_tool_dispatcher(tool_function, self._executor),
+        )
+        self._defs_cache = self._names_cache = None
 
-        except Exception as e:
-            error_msg = f"Failed to register tool: {str(e)}"
-            logger.error(error_msg)
-            raise ValueError(error_msg) from e
+        logger.info("Tool '%s' registered successfully", tool_name)
 
     def get_tool_definition(self, name: str) -> dict[str, Any] | None:
         """
@@ -81,10 +213,11 @@ class ToolRegistry:
         Returns:
             Tool definition dict or None if not found
         """
-        definition = self._tools.get(name)
-        if definition is None:
-            logger.warning(f"Tool definition not found for: {name}")
-        return definition
+        entry = self._entries.get(name)
+        if entry is None:
+            logger.warning("Tool definition not found for: %s", name)
+            return None
+        return entry.definition
 
     def get_tool_function(self, name: str) -> Callable | None:
         """
@@ -96,10 +229,27 @@ class ToolRegistry:
         Returns:
             Tool function or None if not found
         """
-        function = self._functions.get(name)
-        if function is None:
-            logger.warning(f"Tool function not found for: {name}")
-        return function
+        entry = self._entries.get(name)
+        if entry is None:
+            logger.warning("Tool function not found for: %s", name)
+            return None
+        return entry.function
+
+    def get_tool_dispatcher(self, name: str) -> ToolDispatcher | None:
+        """
+        Get the dispatcher that executes a tool by name.
+
+        Args:
+            name: The tool name
+
+        Returns:
+            Dispatcher taking the tool's keyword arguments, or None if not found
+        """
+        entry = self._entries.get(name)
+        if entry is None:
+            logger.warning("Tool function not found for: %s", name)
+            return None
+        return entry.dispatcher
 
     def get_all_tool_definitions(self) -> list[dict[str, Any]]:
         """
@@ -108,8 +258,10 @@ class ToolRegistry:
         Returns:
             List of all tool definitions for LLM integration
         """
-        definitions = list(self._tools.values())
-        logger.debug(f"Returning {len(definitions)} tool definitions")
+        if self._defs_cache is None:
+            self._defs_cache = tuple(e.definition for e in self._entries.values())
+        definitions = list(self._defs_cache)
+        logger.debug("Returning %d tool definitions", len(definitions))
         return definitions
 
     def list_tool_names(self) -> list[str]:
@@ -119,8 +271,10 @@ class ToolRegistry:
         Returns:
             List of tool names
         """
-        names = list(self._tools.keys())
-        logger.debug(f"Available tools: {names}")
+        if self._names_cache is None:
+            self._names_cache = tuple(self._entries)
+        names = list(self._names_cache)
+        logger.debug("Available tools: %s", names)
         return names
 
     def is_tool_registered(self, name: str) -> bool:
@@ -133,7 +287,7 @@ class ToolRegistry:
         Returns:
             True if tool is registered, False otherwise
         """
-        return name in self._tools
+        return name in self._entries
 
     def unregister(self, name: str) -> bool:
         """
@@ -144,13 +298,17 @@ class ToolRegistry:
 
         Returns:
             True if tool was unregistered, False if not found
+
+        Raises:
+            RuntimeError: If the registry has been frozen
         """
-        if name not in self._tools:
+        self._ensure_mutable()
+        if name not in self._entries:
             logger.warning(f"Cannot unregister tool '{name}': not found")
             return False
 
-        del self._tools[name]
-        del self._functions[name]
+        del self._entries[name]
+        self._defs_cache = self._names_cache = None
         logger.info(f"Tool '{name}' unregistered successfully")
         return True
 
@@ -171,36 +329,65 @@ class ToolRegistry:
                 logger.warning(
                     f"Package {discovery_path} has no __path__ attribute; attempting direct module processing"
                 )
-                self._process_module_for_tools(discovery_path)
+                self._register_module_tools(package, discovery_path)
                 return
 
-            # Discover and register tools from each module
-            for _, modname, ispkg in pkgutil.iter_modules(package.__path__):
-                if not ispkg:  # Skip sub-packages
-                    full_module_name = f"{discovery_path}.{modname}"
-                    self._process_module_for_tools(full_module_name)
-
-            # Additionally, process the root module itself in case tools are defined there
+            # Import every tool module first (overlapping the imports when
+            # there are several), then register on this thread
+            module_names = [
+                f"{discovery_path}.{modname}"
+                for _, modname, ispkg in pkgutil.iter_modules(package.__path__)
+                if not ispkg  # Skip sub-packages
+            ]
+            modules = self._import_modules(module_names)
+            for module_name, module in zip(module_names, modules, strict=True):
+                if module is not None:
+                    self._register_module_tools(module, module_name)
+
+            # Additionally, process the root module itself in case tools are
+            # defined there, reusing the package imported above
             try:
-                self._process_module_for_tools(discovery_path)
+                self._register_module_tools(package, discovery_path)
             except Exception:
                 # Do not fail discovery if root processing has issues
                 pass
 
             logger.info(
-                f"Tool discovery completed. Total registered tools: {len(self._tools)}"
+                f"Tool discovery completed. Total registered tools: {len(self._entries)}"
             )
 
         except Exception as e:
             logger.error(f"Error during tool discovery in {discovery_path}: {e}")
             raise
 
-    def _process_module_for_tools(self, module_name: str) -> None:
-        """Process a single module to discover and register tools."""
+    def _import_modules(self, module_names: list[str]) -> list[ModuleType | None]:
+        """
+        Import modules, in a small thread pool when there are several.
+
+        Imports spend much of their time reading and unmarshalling files with
+        the GIL released, so they overlap well. Failed imports are logged and
+        returned as None.
+        """
+
+        def import_or_none(module_name: str) -> ModuleType | None:
+            try:
+                return importlib.import_module(module_name)
+            except Exception as e:
+                logger.error(f"Error importing module {module_name}: {e}")
+                return None
+
+        if len(module_names) <= SERIAL_IMPORT_MAX_MODULES:
+            return [import_or_none(name) for name in module_names]
+
+        workers = min(MAX_IMPORT_WORKERS, len(module_names))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(import_or_none, module_names))
+
+    def _register_module_tools(self, module: ModuleType, module_name: str) -> None:
+        """Register the tools defined in an imported module."""
         logger.debug(f"Examining module: {module_name}")
 
         try:
-            module = importlib.import_module(module_name)
             tool_definitions = self._extract_tool_definitions(module)
 
             for tool_def_name, tool_definition in tool_definitions.items():
@@ -209,17 +396,29 @@ class ToolRegistry:
                 )
 
         except Exception as e:
-            logger.error(f"Error importing module {module_name}: {e}")
+            logger.error(f"Error registering tools from module {module_name}: {e}")
 
     def _extract_tool_definitions(self, module) -> dict[str, dict]:
-        """Extract tool definitions from a module."""
+        """
+        Extract tool definitions from a module.
+
+        Reads the names listed in the module's __tools__ manifest; modules
+        without one are scanned for public *_TOOL attributes.
+        """
+        names = getattr(module, "__tools__", None)
+        if names is None:
+            names = [
+                attr_name
+                for attr_name in vars(module)
+                if attr_name.endswith("_TOOL") and not attr_name.startswith("_")
+            ]
+
         tool_definitions = {}
-        for attr_name in dir(module):
-            if attr_name.endswith("_TOOL") and not attr_name.startswith("_"):
-                attr_value = getattr(module, attr_name)
-                if isinstance(attr_value, dict):
-                    tool_definitions[attr_name] = attr_value
-                    logger.debug(f"Found tool definition: {attr_name}")
+        for attr_name in names:
+            attr_value = getattr(module, attr_name, None)
+            if isinstance(attr_value, dict):
+                tool_definitions[attr_name] = attr_value
+                logger.debug("Found tool definition: %s", attr_name)
         return tool_definitions
 
     def _register_tool_from_definition(
@@ -227,36 +426,76 @@ class ToolRegistry:
     ) -> None:
         """Register a tool from its definition and corresponding function."""
         try:
-            # Validate tool definition structure
-            if (
-                "function" not in tool_definition
-                or "name" not in tool_definition["function"]
-            ):
+            # Validate the definition once; registration below reuses the name
+            function_name = _extract_tool_name(tool_definition)
+            if function_name is None:
                 logger.warning(
                     f"Invalid tool definition {tool_def_name}: missing function.name"
                 )
                 return
 
-            function_name = tool_definition["function"]["name"]
-
-            # Find and validate the function
-            if hasattr(module, function_name):
-                tool_function = getattr(module, function_name)
-                if callable(tool_function):
-                    self.register(tool_definition, tool_function)
-                    logger.info(
-                        f"Auto-registered tool: {function_name} from {module_name}"
-                    )
-                else:
-                    logger.warning(
-                        f"Found {function_name} in {module_name} but it's not callable"
-                    )
-            else:
+            # A package re-exporting a submodule's definition hands us the
+            # same object again once the root is processed; skip it quietly
+            existing = self._entries.get(function_name)
+            if existing is not None and existing.definition is tool_definition:
+                logger.debug(
+                    "Tool %s from %s already registered", function_name, module_name
+                )
+                return
+
+            # Find and validate the function, preferring a native coroutine
+            # variant (<name>_async) so the executor awaits it without a thread;
+            # both are read straight from the module namespace
+            namespace = vars(module)
+            async_variant = namespace.get(f"{function_name}_async")
+            if inspect.iscoroutinefunction(async_variant):
+                self._register_validated(function_name, tool_definition, async_variant)
+                logger.info(
+                    f"Auto-registered tool: {function_name} (async) from {module_name}"
+                )
+                return
+
+            tool_function = namespace.get(function_name)
+            if tool_function is None:
                 logger.warning(
                     f"Tool function {function_name} not found in {module_name}"
                 )
+            elif not callable(tool_function):
+                logger.warning(
+                    f"Found {function_name} in {module_name} but it's not callable"
+                )
+            else:
+                self._register_validated(function_name, tool_definition, tool_function)
+                logger.info(f"Auto-registered tool: {function_name} from {module_name}")
 
         except Exception as e:
             logger.error(
                 f"Error processing tool definition {tool_def_name} in {module_name}: {e}"
             )
+
+
+# Process-wide registry of the built-in tools for read-only consumers
+DEFAULT_DISCOVERY_PATH = "nexus.tools.definition"
+_default_registry: ToolRegistry | None = None
+_default_registry_lock = threading.Lock()
+
+
+def get_default_registry() -> ToolRegistry:
+    """
+    Return the shared, frozen registry of tools under nexus.tools.definition.
+
+    Discovery runs once, on first use. The registry is frozen, so callers
+    that need to register tools or set an executor (such as main) build
+    their own ToolRegistry.
+    """
+    global _default_registry
+    registry = _default_registry
+    if registry is not None:
+        return registry
+    with _default_registry_lock:
+        if _default_registry is None:
+            registry = ToolRegistry()
+            registry.discover_and_register(DEFAULT_DISCOVERY_PATH)
+            registry.freeze()
+            _default_registry = registry
+        return _default_registry
@@ -29,7 +29,7 @@ from nexus.services.context.formatters import (
     MomentFormatter,
 )
 from nexus.services.context.prompts import PromptManager
-from nexus.tools.registry import ToolRegistry
+from nexus.tools.registry import get_default_registry
 
 # =============================================================================
 # Simulated Data
@@ -40,30 +40,39 @@ def _utc_now() -> datetime:
     return datetime.now(timezone.utc)
 
 
+# All simulated timestamps are offsets from one clock read
+_NOW = _utc_now()
+
+
+def _utc_iso(ago: timedelta = timedelta()) -> str:
+    """Format the UTC time `ago` before _NOW as ISO 8601 with a Z suffix."""
+    return (_NOW - ago).isoformat().removesuffix("+00:00") + "Z"
+
+
 # Simulated conversation history (newest first, as returned from database)
 MOCK_HISTORY = [
     {
         "role": "ai",
         "content": "当然可以！Python的列表推导式是一种简洁创建列表的方式。基本语法是 `[expression for item in iterable if condition]`。比如 `[x**2 for x in range(10) if x % 2 == 0]` 会返回偶数的平方。",
-        "timestamp": (_utc_now() - timedelta(minutes=5)).isoformat().replace("+00:00", "Z"),
+        "timestamp": _utc_iso(timedelta(minutes=5)),
         "run_id": "run_002",
     },
     {
         "role": "human",
         "content": "能解释一下Python的列表推导式吗？",
-        "timestamp": (_utc_now() - timedelta(minutes=6)).isoformat().replace("+00:00", "Z"),
+        "timestamp": _utc_iso(timedelta(minutes=6)),
         "run_id": "run_002",
     },
     {
         "role": "ai",
         "content": "你好！很高兴认识你。有什么我可以帮助你的吗？",
-        "timestamp": (_utc_now() - timedelta(hours=1)).isoformat().replace("+00:00", "Z"),
+        "timestamp": _utc_iso(timedelta(hours=1)),
         "run_id": "run_001",
     },
     {
         "role": "human",
         "content": "你好，我是新用户",
-        "timestamp": (_utc_now() - timedelta(hours=1, minutes=1)).isoformat().replace("+00:00", "Z"),
+        "timestamp": _utc_iso(timedelta(hours=1, minutes=1)),
         "run_id": "run_001",
     },
 ]
@@ -84,14 +93,12 @@ MOCK_USER_PROFILE = {
 MOCK_CURRENT_INPUT = "帮我写一个简单的Python装饰器示例"
 
 # Simulated timestamp (UTC) and timezone offset
-MOCK_TIMESTAMP_UTC = _utc_now().isoformat().replace("+00:00", "Z")
+MOCK_TIMESTAMP_UTC = _utc_iso()
 MOCK_TIMEZONE_OFFSET = -480  # UTC+8 (Beijing/Shanghai), JS getTimezoneOffset returns -480
 
 def get_actual_tool_definitions() -> list[dict]:
-    """Get actual tool definitions from ToolRegistry."""
-    registry = ToolRegistry()
-    registry.discover_and_register("nexus.tools.definition")
-    return registry.get_all_tool_definitions()
+    """Get actual tool definitions from the shared ToolRegistry."""
+    return get_default_registry().get_all_tool_definitions()
 
 
 def build_context_preview() -> list[dict[str, str]]:
@@ -160,9 +167,9 @@ def format_output(messages: list[dict[str, str]]) -> str:
     return "\n".join(output_lines)
 
 
-def format_raw_output(messages: list[dict[str, str]]) -> str:
-    """Format messages as raw API JSON list."""
-    return json.dumps(messages, ensure_ascii=False, indent=2)
+def format_raw_output(messages: list[dict[str, str]]) -> bytes:
+    """Format messages as raw API JSON list, encoded as UTF-8."""
+    return json.dumps(messages, ensure_ascii=False, indent=2).encode("utf-8")
 
 
 def main():
@@ -182,16 +189,16 @@ def main():
 
     # Format output based on mode
     if args.raw:
-        output_text = format_raw_output(messages)
+        output_bytes = format_raw_output(messages)
     else:
-        output_text = format_output(messages)
+        output_bytes = format_output(messages).encode("utf-8")
 
     # Write to file (same directory as script)
     script_dir = Path(__file__).parent
     output_path = script_dir / "context_output.txt"
 
-    with open(output_path, "w", encoding="utf-8") as f:
-        f.write(output_text)
+    with open(output_path, "wb") as f:
+        f.write(output_bytes)
 
     print(f"Context preview written to: {output_path}")
     print(f"Total messages: {len(messages)}")
@@ -18,6 +18,7 @@ Commands:
     stats             Show database statistics
     interactive       Interactive mode (default)
     cleanup           Clean up data
+    ensure-indexes    Create the indexes used by cleanup filters
     export            Export data to file
     analyze           Analyze data patterns
 
@@ -38,16 +39,35 @@ import os
 import argparse
 import logging
 import json
+import re
 import yaml
+import copy
 from typing import List, Dict, Any, Optional, Union
 from datetime import datetime, timezone, timedelta
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, replace
 from enum import Enum
-import asyncio
+import itertools
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+# libyaml's C parser when PyYAML was built with it, else the pure-Python one
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeLoader as YamlLoader
+
+# orjson is optional; NDJSON export falls back to the stdlib encoder
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Resolved once at import; every manager instance shares it
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
 # Add project root to Python path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, str(PROJECT_ROOT))
 
 try:
     from nexus.services.database.providers.mongo import MongoProvider
@@ -66,6 +86,68 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+# Document IDs per DeleteMany operation in a bulk delete
+DELETE_BATCH_SIZE = 1000
+# Documents listed before a cleanup asks for confirmation
+CLEANUP_PREVIEW_SIZE = 5
+# Documents fetched per cursor batch while exporting
+EXPORT_BATCH_SIZE = 1000
+# Connection pool for the CLI's client: room for the stats thread pool plus an
+# export, and a fast failure of the startup ping when the server is unreachable
+MONGO_CLIENT_OPTIONS = {
+    'maxPoolSize': 50,
+    'serverSelectionTimeoutMS': 5000,
+    'socketTimeoutMS': 60000,
+}
+# Wire compressors tried in order; only those with an installed codec are used
+MONGO_COMPRESSORS = (('zstd', 'zstandard'), ('snappy', 'snappy'))
+# Concurrent per-collection stats lookups; stays well under maxPoolSize so
+# workers never queue on the connection pool
+STATS_MAX_WORKERS = 16
+# Server-side time limit for cleanup scans, so a runaway query fails instead of hanging
+CLEANUP_MAX_TIME_MS = 600_000
+# Seconds a cached listing or stats lookup stays fresh
+CACHE_TTL_SECONDS = 15.0
+# Indexes on stored message fields matching build_filter_query's shapes (role
+# equality, then the timestamp range/sort). Every index slows production
+# writes, so they are only created on request with --ensure-indexes
+CLEANUP_INDEXES = [
+    ("role_timestamp_idx", [("role", 1), ("timestamp", 1)]),
+    ("timestamp_idx", [("timestamp", 1)]),
+]
+# Filter fields -> the cleanup index pinned for exactly that filter shape
+CLEANUP_HINTS = {
+    frozenset({'role', 'timestamp'}): 'role_timestamp_idx',
+    frozenset({'timestamp'}): 'timestamp_idx',
+}
+
+
+def _ndjson_default(obj: Any) -> str:
+    """Encode non-JSON values the way orjson does under OPT_NAIVE_UTC, else str()."""
+    if isinstance(obj, datetime):
+        if obj.tzinfo is None:
+            obj = obj.replace(tzinfo=timezone.utc)
+        return obj.isoformat()
+    return str(obj)
+
+
+def encode_ndjson_line(doc: Dict[str, Any]) -> bytes:
+    """Encode one document as a newline-terminated compact JSON line."""
+    if orjson is not None:
+        return orjson.dumps(
+            doc, default=str, option=orjson.OPT_NAIVE_UTC | orjson.OPT_APPEND_NEWLINE
+        )
+    line = json.dumps(doc, default=_ndjson_default, ensure_ascii=False, separators=(',', ':'))
+    return (line + '\n').encode('utf-8')
+
+
+def _available_compressors() -> List[str]:
+    """Return the wire compressors whose Python codec is installed."""
+    from importlib.util import find_spec
+
+    return [name for name, module in MONGO_COMPRESSORS if find_spec(module) is not None]
+
+
 class OperationMode(Enum):
     """Operation modes for the database manager."""
     INTERACTIVE = "interactive"
@@ -102,6 +184,7 @@ class CleanupOptions:
     role: Optional[str] = None  # Use string instead of Role enum for flexibility
     session_id: Optional[str] = None
     content_filter: Optional[str] = None
+    content_match: str = "contains"  # contains, prefix
     newest_first: bool = False
     dry_run: bool = False
     force: bool = False
@@ -112,7 +195,7 @@ class ExportOptions:
     """Options for export operations."""
     collection: str
     output_file: str
-    format: str = "json"  # json, csv
+    format: str = "json"  # json, ndjson, csv, bson
     filter_query: Optional[Dict[str, Any]] = None
     limit: Optional[int] = None
 
@@ -133,9 +216,34 @@ class DatabaseManager:
         self.provider: Optional[MongoProvider] = None
         self.client = None
         self.current_db = config.database_name
-        self.project_root = Path(__file__).parent.parent
+        self.project_root = PROJECT_ROOT
+        # (method, db, *args) -> (fetched_at, value); see _cached
+        self._cache: Dict[tuple, tuple] = {}
+        # Collection name -> provider collection; see _build_collection_map
+        self._collection_map: Dict[str, Any] = {}
+        # (template mtime, parsed template); see load_config_template
+        self._config_template_cache: Optional[tuple] = None
         self._initialize_connection()
 
+    def _cached(self, key: tuple, fetch, ttl: float = CACHE_TTL_SECONDS) -> Any:
+        """Return a cached value for key, calling fetch once it is older than ttl.
+
+        Interactive menus re-list databases and collections on every render;
+        a short TTL spares those admin round-trips. Exceptions from fetch
+        propagate and are never cached.
+        """
+        entry = self._cache.get(key)
+        now = time.monotonic()
+        if entry is not None and now - entry[0] < ttl:
+            return entry[1]
+        value = fetch()
+        self._cache[key] = (now, value)
+        return value
+
+    def _invalidate_cache(self) -> None:
+        """Drop cached listings and stats after a write or database switch."""
+        self._cache.clear()
+
     def _initialize_connection(self) -> None:
         """Initialize database connection."""
         global DEPENDENCIES_AVAILABLE
@@ -149,11 +257,17 @@ class DatabaseManager:
         try:
             from pymongo import MongoClient
 
-            self.client = MongoClient(self.config.mongo_uri)
+            client_options = dict(MONGO_CLIENT_OPTIONS)
+            compressors = _available_compressors()
+            if compressors:
+                # Shrinks large export and stats payloads on the wire
+                client_options['compressors'] = ','.join(compressors)
+            self.client = MongoClient(self.config.mongo_uri, **client_options)
             self.client.admin.command('ping')
 
             self.provider = MongoProvider(self.config.mongo_uri, self.current_db)
             self.provider.connect()
+            self._build_collection_map()
 
             logger.info(f"Connected to database: {self.current_db}")
 
@@ -163,6 +277,41 @@ class DatabaseManager:
             self.client = None
             self.provider = None
 
+    def _build_collection_map(self) -> None:
+        """Index the provider's collections by the names the CLI accepts."""
+        self._collection_map = {
+            'messages': self.provider.messages_collection,
+            'identities': self.provider.identities_collection,
+            'configurations': self.provider.config_collection,
+        }
+
+    def _get_collection(self, collection_name: str):
+        """Return the provider collection for a name, or None if unknown."""
+        return self._collection_map.get(collection_name)
+
+    def ensure_cleanup_indexes(self) -> bool:
+        """Create the message indexes used by cleanup filters, if missing."""
+        if not self.provider:
+            logger.info("Mock mode: no indexes created")
+            return True
+
+        from pymongo.errors import OperationFailure
+
+        collection = self._get_collection('messages')
+        if collection is None:
+            logger.error("Collection 'messages' not found")
+            return False
+
+        for index_name, keys in CLEANUP_INDEXES:
+            try:
+                collection.create_index(keys, name=index_name)
+                print(f"Ensured index {index_name}")
+            except OperationFailure as e:
+                # Usually an equivalent index already exists under another name
+                print(f"Skipped index {index_name}: {e}")
+        self._invalidate_cache()
+        return True
+
     def list_databases(self) -> List[str]:
         """List all available databases."""
         if not self.client:
@@ -170,7 +319,7 @@ class DatabaseManager:
             return ["NEXUS_DB_DEV", "NEXUS_DB_PROD", "NEXUS_DB_TEST"]
 
         try:
-            databases = self.client.list_database_names()
+            databases = self._cached(('databases',), self.client.list_database_names)
             return [db for db in databases if not db.startswith(('admin', 'config', 'local'))]
         except Exception as e:
             logger.error(f"Error listing databases: {e}")
@@ -185,13 +334,18 @@ class DatabaseManager:
         try:
             target_db = db_name or self.current_db
             database = self.client[target_db]
-            return database.list_collection_names()
+            return list(self._cached(('collections', target_db), database.list_collection_names))
         except Exception as e:
             logger.error(f"Error listing collections: {e}")
             return []
 
     def get_collection_stats(self, collection_name: str) -> Dict[str, Any]:
-        """Get statistics for a collection."""
+        """Get statistics for a collection.
+
+        document_count comes from collection metadata ($collStats or
+        estimated_document_count) rather than a full count, so it can lag
+        briefly behind in-flight writes or after an unclean shutdown.
+        """
         if not self.client:
             # Mock stats for testing
             mock_stats = {
@@ -202,30 +356,97 @@ class DatabaseManager:
             return mock_stats.get(collection_name, {"document_count": 0, "storage_size": 0})
 
         try:
-            database = self.client[self.current_db]
-            collection = database[collection_name]
+            return dict(self._cached(
+                ('collection_stats', self.current_db, collection_name),
+                lambda: self._fetch_collection_stats(collection_name)
+            ))
+        except Exception as e:
+            logger.error(f"Error getting collection stats: {e}")
+            return {}
 
-            stats = {
-                'document_count': collection.count_documents({}),
-                'storage_size': 0,
-                'index_size': 0
-            }
+    def _fetch_collection_stats(self, collection_name: str) -> Dict[str, Any]:
+        """Read collection statistics from the server."""
+        database = self.client[self.current_db]
+        collection = database[collection_name]
 
-            try:
-                coll_stats = database.command('collstats', collection_name)
+        stats = {
+            'document_count': None,
+            'storage_size': 0,
+            'index_size': 0
+        }
+
+        try:
+            # $collStats returns one document per shard (just one when
+            # unsharded) carrying count and sizes together
+            shard_stats = [
+                doc.get('storageStats', {})
+                for doc in collection.aggregate([{"$collStats": {"storageStats": {}}}])
+            ]
+            if shard_stats:
+                count = sum(s.get('count', 0) for s in shard_stats)
+                size = sum(s.get('size', 0) for s in shard_stats)
                 stats.update({
-                    'storage_size': coll_stats.get('size', 0),
-                    'index_size': coll_stats.get('totalIndexSize', 0),
-                    'avg_obj_size': coll_stats.get('avgObjSize', 0),
-                    'count': coll_stats.get('count', 0)
+                    'document_count': count,
+                    'storage_size': size,
+                    'index_size': sum(s.get('totalIndexSize', 0) for s in shard_stats),
+                    'avg_obj_size': size // count if count else 0,
+                    'count': count
                 })
-            except Exception:
-                pass
+        except Exception:
+            pass
 
-            return stats
+        # $collStats already carries the count; otherwise read it from metadata
+        if stats['document_count'] is None:
+            stats['document_count'] = collection.estimated_document_count()
+
+        return stats
+
+    def get_all_collection_counts(self) -> Dict[str, int]:
+        """Get document counts for every collection in the current database.
+
+        Counts come from metadata, like get_collection_stats. With a live
+        client they are read in one aggregation that chains each
+        collection's $collStats through $unionWith.
+        """
+        collections = self.list_collections()
+        if not self.client or not collections:
+            return {
+                name: self.get_collection_stats(name).get('document_count', 0)
+                for name in collections
+            }
+
+        try:
+            return dict(self._cached(
+                ('collection_counts', self.current_db, tuple(collections)),
+                lambda: self._fetch_collection_counts(collections)
+            ))
         except Exception as e:
-            logger.error(f"Error getting collection stats: {e}")
-            return {}
+            # e.g. views, which reject $collStats count; fall back per collection
+            logger.warning(f"Batched collection counts failed, counting individually: {e}")
+            stats = self.get_database_stats()
+            return {
+                name: coll_stats.get('document_count', 0)
+                for name, coll_stats in stats['collection_stats'].items()
+            }
+
+    def _fetch_collection_counts(self, collections: List[str]) -> Dict[str, int]:
+        """Read every collection's count in a single $unionWith aggregation."""
+        database = self.client[self.current_db]
+        count_stage = {"$collStats": {"count": {}}}
+        pipeline: List[Dict[str, Any]] = [count_stage]
+        pipeline.extend(
+            {"$unionWith": {"coll": name, "pipeline": [count_stage]}}
+            for name in collections[1:]
+        )
+        pipeline.append({"$project": {"ns": 1, "count": 1}})
+
+        prefix_len = len(self.current_db) + 1
+        counts = dict.fromkeys(collections, 0)
+        # Sharded collections report one document per shard, so sum by namespace
+        for doc in database[collections[0]].aggregate(pipeline):
+            name = doc['ns'][prefix_len:]
+            counts[name] = counts.get(name, 0) + doc.get('count', 0)
+        return counts
 
     def get_database_stats(self) -> Dict[str, Any]:
         """Get comprehensive database statistics."""
@@ -239,8 +460,15 @@ class DatabaseManager:
             'total_storage': 0
         }
 
-        for collection_name in collections:
-            coll_stats = self.get_collection_stats(collection_name)
+        if not collections:
+            return stats
+
+        # PyMongo clients are thread-safe, so the per-collection round-trips
+        # can overlap instead of running one after another
+        with ThreadPoolExecutor(max_workers=min(STATS_MAX_WORKERS, len(collections))) as executor:
+            results = dict(zip(collections, executor.map(self.get_collection_stats, collections)))
+
+        for collection_name, coll_stats in results.items():
             stats['collection_stats'][collection_name] = coll_stats
             stats['total_documents'] += coll_stats.get('document_count', 0)
             stats['total_storage'] += coll_stats.get('storage_size', 0)
@@ -255,8 +483,10 @@ class DatabaseManager:
                 return False
 
             self.current_db = db_name
+            self._invalidate_cache()
             self.provider = MongoProvider(self.config.mongo_uri, db_name)
             self.provider.connect()
+            self._build_collection_map()
 
             logger.info(f"Switched to database: {db_name}")
             return True
@@ -289,12 +519,21 @@ class DatabaseManager:
 
         # Content filtering (only for messages collection)
         if options.content_filter and options.collection not in ['identities', 'configurations']:
-            query['content'] = {'$regex': options.content_filter, '$options': 'i'}
+            from bson.regex import Regex
+
+            if options.content_match == 'prefix':
+                # Anchored, case-sensitive literal: the regex engine can stop at
+                # the first mismatching character
+                query['content'] = Regex(f'^{re.escape(options.content_filter)}')
+            else:
+                query['content'] = Regex(options.content_filter, 'i')
 
         return query
 
-    def get_documents_to_delete(self, options: CleanupOptions) -> List[Dict[str, Any]]:
-        """Get documents that match deletion criteria."""
+    def get_documents_to_delete(
+        self, options: CleanupOptions, query: Optional[Dict[str, Any]] = None
+    ) -> List[Dict[str, Any]]:
+        """Get documents that match deletion criteria (or a prebuilt filter query)."""
         if not self.provider:
             # Mock documents for testing
             mock_docs = [
@@ -305,60 +544,150 @@ class DatabaseManager:
                     'content': f'This is a sample message {i}',
                     'session_id': 'session_123'
                 }
-                for i in range(min(options.count, 10))
+                for i in range(min(options.count, 10) if options.count > 0 else 10)
             ]
             return mock_docs
 
         try:
-            # Map collection names to provider attributes
-            if options.collection == 'configurations':
-                collection = self.provider.config_collection
-            else:
-                collection = getattr(self.provider, f'{options.collection}_collection')
+            collection = self._get_collection(options.collection)
             if collection is None:
                 logger.error(f"Collection '{options.collection}' not found")
                 return []
 
-            query = self.build_filter_query(options)
+            if query is None:
+                query = self.build_filter_query(options)
 
             # Sort direction: -1 for descending (newest first), 1 for ascending (oldest first)
             sort_direction = -1 if options.newest_first else 1
 
-            # Determine sort field based on collection type
-            if options.collection == 'identities':
-                sort_field = 'created_at'
-            elif options.collection == 'configurations':
-                sort_field = '_id'  # configurations may not have timestamp
-            else:
-                sort_field = 'timestamp'
-
-            cursor = collection.find(query).sort(sort_field, sort_direction).limit(options.count)
-            documents = list(cursor)
-
-            # Convert ObjectId to string for display
-            for doc in documents:
-                if '_id' in doc:
-                    doc['_id'] = str(doc['_id'])
-                # Ensure document has an 'id' field for deletion logic
-                if 'id' not in doc:
-                    # For identities collection, use public_key as id
-                    if options.collection == 'identities' and 'public_key' in doc:
-                        doc['id'] = doc['public_key']
-                    # For configurations collection, use environment as id
-                    elif options.collection == 'configurations' and 'environment' in doc:
-                        doc['id'] = doc['environment']
-                    # Fallback to _id
-                    elif '_id' in doc:
-                        doc['id'] = str(doc['_id'])
-                    else:
-                        # Generate a placeholder (should not happen)
-                        doc['id'] = 'unknown'
+            # Determine sort and ID fields based on collection type
+            id_field, sort_field = self._cleanup_fields(options.collection)
+
+            pipeline: List[Dict[str, Any]] = [
+                {"$match": query},
+                {"$sort": {sort_field: sort_direction}},
+            ]
+            if options.count > 0:
+                pipeline.append({"$limit": options.count})
 
-            return documents
+            # A dry run only counts matches, so fetch just the fields that
+            # identify each document
+            if options.dry_run:
+                pipeline.append({"$project": {'id': 1, 'public_key': 1, 'environment': 1, sort_field: 1}})
+
+            # Stringify _id and fill in the 'id' used by deletion logic on the
+            # server, falling back to the collection's ID field and then _id
+            id_string = {"$toString": "$_id"}
+            fallback_id = id_string if id_field == 'id' else {"$ifNull": [f"${id_field}", id_string]}
+            pipeline.append({"$addFields": {
+                "_id": id_string,
+                "id": {"$ifNull": ["$id", fallback_id]},
+            }})
+
+            aggregate_options: Dict[str, Any] = {'allowDiskUse': True, 'maxTimeMS': CLEANUP_MAX_TIME_MS}
+            hint = self._cleanup_hint(options, query, collection)
+            if hint:
+                aggregate_options['hint'] = hint
+            return list(collection.aggregate(pipeline, **aggregate_options))
         except Exception as e:
             logger.error(f"Error getting documents to delete: {e}")
             return []
 
+    def _cleanup_fields(self, collection_name: str) -> tuple:
+        """Return the (id field, sort field) used to clean up a collection."""
+        if collection_name == 'identities':
+            return 'public_key', 'created_at'
+        if collection_name == 'configurations':
+            # configurations may not have a timestamp
+            return 'environment', '_id'
+        return 'id', 'timestamp'
+
+    def _cleanup_hint(self, options: CleanupOptions, query: Dict[str, Any], collection) -> Optional[str]:
+        """Pick the cleanup index that exactly matches the filter shape, if it exists.
+
+        Pinning the plan keeps repeated cleanups from flipping between a
+        range scan and a collection scan as the plan cache is rebuilt. Any
+        other filter (session, content, no age cutoff) is left to the planner,
+        since a hint would stop it from choosing a better index.
+        """
+        if options.collection != 'messages':
+            return None
+
+        index_name = CLEANUP_HINTS.get(frozenset(query))
+        if index_name is None:
+            return None
+
+        try:
+            indexes = self._cached(
+                ('indexes', self.current_db, options.collection), collection.index_information
+            )
+        except Exception as e:
+            logger.warning(f"Could not read indexes for {options.collection}: {e}")
+            return None
+        return index_name if index_name in indexes else None
+
+    def count_documents_to_delete(
+        self, options: CleanupOptions, query: Optional[Dict[str, Any]] = None
+    ) -> int:
+        """Count documents matching deletion criteria, capped at options.count (0 for no cap)."""
+        if not self.provider:
+            return len(self.get_documents_to_delete(options))
+
+        collection = self._get_collection(options.collection)
+        if collection is None:
+            logger.error(f"Collection '{options.collection}' not found")
+            return 0
+        if query is None:
+            query = self.build_filter_query(options)
+        if options.count > 0:
+            return collection.count_documents(query, limit=options.count)
+        return collection.count_documents(query)
+
+    def iter_deletion_id_batches(
+        self, options: CleanupOptions, query: Optional[Dict[str, Any]] = None
+    ):
+        """Yield IDs of documents matching deletion criteria in DELETE_BATCH_SIZE lists.
+
+        The cursor only carries the ID field and is consumed one batch at a
+        time, so memory stays flat however many documents a cleanup touches.
+        """
+        if not self.provider:
+            ids = [doc['id'] for doc in self.get_documents_to_delete(options)]
+            for i in range(0, len(ids), DELETE_BATCH_SIZE):
+                yield ids[i:i + DELETE_BATCH_SIZE]
+            return
+
+        collection = self._get_collection(options.collection)
+        if collection is None:
+            logger.error(f"Collection '{options.collection}' not found")
+            return
+
+        if query is None:
+            query = self.build_filter_query(options)
+        id_field, sort_field = self._cleanup_fields(options.collection)
+        sort_direction = -1 if options.newest_first else 1
+
+        # An explicit session keeps the cursor's server session alive across a
+        # multi-minute scan; disk use lets an unindexed sort spill past the
+        # in-memory sort limit
+        with collection.database.client.start_session() as session:
+            cursor = (
+                collection.find(query, {id_field: 1, '_id': 0}, session=session)
+                .sort(sort_field, sort_direction)
+                .batch_size(DELETE_BATCH_SIZE)
+                .allow_disk_use(True)
+                .max_time_ms(CLEANUP_MAX_TIME_MS)
+            )
+            # A count of 0 deletes every match
+            if options.count > 0:
+                cursor = cursor.limit(options.count)
+            hint = self._cleanup_hint(options, query, collection)
+            if hint:
+                cursor = cursor.hint(hint)
+            ids = (doc[id_field] for doc in cursor if id_field in doc)
+            while batch := list(itertools.islice(ids, DELETE_BATCH_SIZE)):
+                yield batch
+
     def delete_documents(self, collection_name: str, document_ids: List[str]) -> int:
         """Delete documents by their IDs."""
         if not self.provider:
@@ -367,26 +696,48 @@ class DatabaseManager:
             return len(document_ids)
 
         try:
-            # Map collection names to provider attributes
-            if collection_name == 'configurations':
-                collection = self.provider.config_collection
-            else:
-                collection = getattr(self.provider, f'{collection_name}_collection')
+            collection = self._get_collection(collection_name)
             if collection is None:
                 logger.error(f"Collection '{collection_name}' not found")
                 return 0
 
             # Determine field to use for deletion based on collection type
-            if collection_name == 'identities':
-                field_name = 'public_key'
-            elif collection_name == 'configurations':
-                field_name = 'environment'
-            else:
-                field_name = 'id'
+            field_name, _ = self._cleanup_fields(collection_name)
+
+            # One unordered bulk write of DeleteMany ops over ID chunks keeps
+            # each $in filter small and lets the driver batch the round trips
+            from pymongo import DeleteMany
 
-            result = collection.delete_many({
-                field_name: {"$in": document_ids}
-            })
+            operations = [
+                DeleteMany({field_name: {"$in": document_ids[i:i + DELETE_BATCH_SIZE]}})
+                for i in range(0, len(document_ids), DELETE_BATCH_SIZE)
+            ]
+            if not operations:
+                return 0
+            result = collection.bulk_write(operations, ordered=False)
+            self._invalidate_cache()
+
+            deleted_count = result.deleted_count
+            logger.info(f"Successfully deleted {deleted_count} documents")
+            return deleted_count
+        except Exception as e:
+            logger.error(f"Error deleting documents: {e}")
+            return 0
+
+    def delete_by_filter(self, options: CleanupOptions, query: Dict[str, Any]) -> int:
+        """Delete every document matching a prebuilt cleanup filter in one delete_many.
+
+        The caller passes the query it counted with, so the age cutoff is the
+        one the user confirmed rather than one recomputed at delete time.
+        """
+        try:
+            collection = self._get_collection(options.collection)
+            if collection is None:
+                logger.error(f"Collection '{options.collection}' not found")
+                return 0
+
+            result = collection.delete_many(query)
+            self._invalidate_cache()
 
             deleted_count = result.deleted_count
             logger.info(f"Successfully deleted {deleted_count} documents")
@@ -402,26 +753,30 @@ class DatabaseManager:
             stats = self.get_collection_stats(options.collection)
             total_docs = stats.get('document_count', 0)
 
-            # Get documents to delete
-            documents_to_delete = self.get_documents_to_delete(options)
+            # Build the filter once, so the count, preview and deletion all use
+            # the same age cutoff; documents are only streamed once deletion starts
+            query = self.build_filter_query(options) if self.provider else None
+            delete_total = self.count_documents_to_delete(options, query)
 
-            if not documents_to_delete:
+            if not delete_total:
                 print("No documents found matching the criteria.")
                 return True
 
             print(f"\n=== Cleanup Report ===")
             print(f"Collection: {options.collection}")
             print(f"Total documents: {total_docs}")
-            print(f"Documents to delete: {len(documents_to_delete)}")
+            print(f"Documents to delete: {delete_total}")
             print(f"Strategy: {'NEWEST' if options.newest_first else 'OLDEST'}")
 
             if options.dry_run:
-                print(f"\n[DRY RUN] Would delete {len(documents_to_delete)} documents")
+                print(f"\n[DRY RUN] Would delete {delete_total} documents")
                 return True
 
             # Show preview
             print(f"\n=== Documents to be deleted ===")
-            for i, doc in enumerate(documents_to_delete[:5]):
+            preview_count = min(options.count, CLEANUP_PREVIEW_SIZE) if options.count > 0 else CLEANUP_PREVIEW_SIZE
+            preview = self.get_documents_to_delete(replace(options, count=preview_count), query)
+            for i, doc in enumerate(preview):
                 if options.collection == 'identities':
                     timestamp = doc.get('created_at', 'Unknown')
                     doc_id = doc.get('public_key', 'Unknown')
@@ -439,19 +794,29 @@ class DatabaseManager:
                     content = str(doc.get('content', ''))[:50] + '...' if len(str(doc.get('content', ''))) > 50 else str(doc.get('content', ''))
                 print(f"{i+1}. {timestamp} | {role} | {doc_id} | {content}")
 
-            if len(documents_to_delete) > 5:
-                print(f"... and {len(documents_to_delete) - 5} more documents")
+            if delete_total > CLEANUP_PREVIEW_SIZE:
+                print(f"... and {delete_total - CLEANUP_PREVIEW_SIZE} more documents")
 
             # Confirmation
             if not options.force:
-                response = input(f"\nDelete {len(documents_to_delete)} documents? (yes/no): ").lower().strip()
+                response = input(f"\nDelete {delete_total} documents? (yes/no): ").lower().strip()
                 if response not in ['yes', 'y']:
                     print("Cleanup cancelled.")
                     return False
 
-            # Perform deletion
-            document_ids = [doc['id'] for doc in documents_to_delete]
-            deleted_count = self.delete_documents(options.collection, document_ids)
+            # A pure age cleanup whose count cap does not bind deletes every
+            # match anyway, so let the server delete by range; the fixed cutoff
+            # keeps the match set to the documents counted above. Otherwise
+            # delete one ID batch at a time
+            age_only = options.days and not (options.role or options.session_id or options.content_filter)
+            cap_binds = 0 < options.count <= delete_total
+            if query is not None and age_only and not cap_binds:
+                deleted_count = self.delete_by_filter(options, query)
+            else:
+                deleted_count = sum(
+                    self.delete_documents(options.collection, batch)
+                    for batch in self.iter_deletion_id_batches(options, query)
+                )
 
             print(f"\n=== Cleanup Complete ===")
             print(f"Successfully deleted {deleted_count} documents")
@@ -464,44 +829,75 @@ class DatabaseManager:
     def export_collection(self, options: ExportOptions) -> bool:
         """Export collection data to file."""
         try:
-            # Map collection names to provider attributes
-            if options.collection == 'configurations':
-                collection = self.provider.config_collection
-            else:
-                collection = getattr(self.provider, f'{options.collection}_collection')
+            collection = self._get_collection(options.collection)
             if collection is None:
                 logger.error(f"Collection '{options.collection}' not found")
                 return False
 
+            if options.format == 'bson':
+                # Raw passthrough: documents stay undecoded BSON bytes
+                from bson.codec_options import CodecOptions
+                from bson.raw_bson import RawBSONDocument
+
+                collection = collection.with_options(
+                    codec_options=CodecOptions(document_class=RawBSONDocument)
+                )
+
             query = options.filter_query or {}
             cursor = collection.find(query)
 
             if options.limit:
                 cursor = cursor.limit(options.limit)
+            cursor = cursor.batch_size(EXPORT_BATCH_SIZE)
 
-            documents = list(cursor)
-
-            # Convert ObjectId to string
-            for doc in documents:
-                if '_id' in doc:
-                    doc['_id'] = str(doc['_id'])
-
-            # Save to file
+            # Save to file, streaming documents from the cursor so memory use
+            # does not grow with the collection
             output_path = Path(options.output_file)
             output_path.parent.mkdir(parents=True, exist_ok=True)
 
+            count = 0
             if options.format == 'json':
                 with open(output_path, 'w', encoding='utf-8') as f:
-                    json.dump(documents, f, indent=2, default=str)
+                    # Same layout as json.dump(documents, f, indent=2)
+                    f.write('[')
+                    for doc in cursor:
+                        if '_id' in doc:
+                            doc['_id'] = str(doc['_id'])
+                        encoded = json.dumps(doc, indent=2, default=str)
+                        f.write(',\n  ' if count else '\n  ')
+                        f.write(encoded.replace('\n', '\n  '))
+                        count += 1
+                    f.write('\n]' if count else ']')
+            elif options.format == 'ndjson':
+                # One compact document per line, written as bytes
+                with open(output_path, 'wb') as f:
+                    for doc in cursor:
+                        if '_id' in doc:
+                            doc['_id'] = str(doc['_id'])
+                        f.write(encode_ndjson_line(doc))
+                        count += 1
+            elif options.format == 'bson':
+                # Concatenated BSON documents, the same layout mongodump writes,
+                # readable by mongorestore and bsondump
+                with open(output_path, 'wb') as f:
+                    for doc in cursor:
+                        f.write(doc.raw)
+                        count += 1
             elif options.format == 'csv':
                 import csv
-                if documents:
+                documents = iter(cursor)
+                first = next(documents, None)
+                if first is not None:
                     with open(output_path, 'w', newline='', encoding='utf-8') as f:
-                        writer = csv.DictWriter(f, fieldnames=documents[0].keys())
+                        writer = csv.DictWriter(f, fieldnames=first.keys())
                         writer.writeheader()
-                        writer.writerows(documents)
+                        for doc in itertools.chain((first,), documents):
+                            if '_id' in doc:
+                                doc['_id'] = str(doc['_id'])
+                            writer.writerow(doc)
+                            count += 1
 
-            print(f"Exported {len(documents)} documents to {output_path}")
+            print(f"Exported {count} documents to {output_path}")
             return True
         except Exception as e:
             logger.error(f"Error during export: {e}")
@@ -510,38 +906,39 @@ class DatabaseManager:
     def analyze_collection(self, collection_name: str) -> Dict[str, Any]:
         """Analyze collection data patterns."""
         try:
-            # Map collection names to provider attributes
-            if collection_name == 'configurations':
-                collection = self.provider.config_collection
-            else:
-                collection = getattr(self.provider, f'{collection_name}_collection')
+            collection = self._get_collection(collection_name)
             if collection is None:
                 return {}
 
-            # Basic stats
-            total_docs = collection.count_documents({})
+            # Basic stats (metadata count; may lag briefly behind writes)
+            total_docs = collection.estimated_document_count()
 
-            # Role distribution
+            # Role distribution and top sessions in one round-trip; $facet
+            # feeds both sub-pipelines from a single projected scan
             pipeline = [
-                {"$group": {"_id": "$role", "count": {"$sum": 1}}},
-                {"$sort": {"count": -1}}
+                {"$project": {"role": 1, "session_id": 1, "_id": 0}},
+                {"$facet": {
+                    "role_distribution": [
+                        {"$group": {"_id": "$role", "count": {"$sum": 1}}},
+                        {"$sort": {"count": -1}}
+                    ],
+                    "top_sessions": [
+                        {"$group": {"_id": "$session_id", "count": {"$sum": 1}}},
+                        {"$sort": {"count": -1}},
+                        {"$limit": 10}
+                    ]
+                }}
             ]
-            role_distribution = list(collection.aggregate(pipeline))
-
-            # Time range
-            oldest = collection.find().sort("timestamp", 1).limit(1)
-            newest = collection.find().sort("timestamp", -1).limit(1)
+            facets = next(collection.aggregate(pipeline), {})
 
-            oldest_doc = list(oldest)[0] if oldest else None
-            newest_doc = list(newest)[0] if newest else None
+            role_distribution = facets.get('role_distribution', [])
+            top_sessions = facets.get('top_sessions', [])
 
-            # Session analysis
-            pipeline = [
-                {"$group": {"_id": "$session_id", "count": {"$sum": 1}}},
-                {"$sort": {"count": -1}},
-                {"$limit": 10}
-            ]
-            top_sessions = list(collection.aggregate(pipeline))
+            # Time range; sorts inside $facet cannot use an index, whereas
+            # these walk the timestamp index from either end
+            time_projection = {"timestamp": 1, "_id": 0}
+            oldest_doc = collection.find_one({}, time_projection, sort=[("timestamp", 1)])
+            newest_doc = collection.find_one({}, time_projection, sort=[("timestamp", -1)])
 
             return {
                 'collection_name': collection_name,
@@ -568,11 +965,18 @@ class DatabaseManager:
             raise FileNotFoundError(f"Configuration template not found: {config_file}")
         
         try:
-            with open(config_file, 'r', encoding='utf-8') as f:
-                config = yaml.safe_load(f)
+            mtime = config_file.stat().st_mtime_ns
+            cached = self._config_template_cache
+            if cached is not None and cached[0] == mtime:
+                config = cached[1]
+            else:
+                with open(config_file, 'r', encoding='utf-8') as f:
+                    config = yaml.load(f, Loader=YamlLoader)
+                self._config_template_cache = (mtime, config)
             logger.info(f"Successfully loaded configuration template from: {config_file}")
             print(f"✓ Successfully loaded configuration template: {config_file}")
-            return config
+            # Callers fill in the document, so hand out a copy of the cached parse
+            return copy.deepcopy(config)
         except Exception as e:
             logger.error(f"Error loading configuration template: {e}")
             print(f"✗ Failed to load configuration template: {e}")
@@ -679,17 +1083,16 @@ class DatabaseManager:
             
             elif isinstance(section_data, dict):
                 # Generic handling for other dictionary sections
-                print(f"  ✓ {section_name}: {len(section_data)} items")
+                item_count = len(section_data)
+                print(f"  ✓ {section_name}: {item_count} items")
                 # Show first few keys as examples
-                keys = list(section_data.keys())[:3]
-                for key in keys:
-                    value = section_data[key]
+                for key, value in itertools.islice(section_data.items(), 3):
                     if isinstance(value, (str, int, float, bool)):
                         print(f"    • {key}: {value}")
                     else:
                         print(f"    • {key}: {type(value).__name__}")
-                if len(section_data) > 3:
-                    print(f"    ... and {len(section_data) - 3} more items")
+                if item_count > 3:
+                    print(f"    ... and {item_count - 3} more items")
             
             else:
                 # Simple values
@@ -756,6 +1159,7 @@ class DatabaseManager:
                 config_doc,
                 upsert=True
             )
+            self._invalidate_cache()
             
             if result.upserted_id:
                 print(f"✓ Created new configuration document")
@@ -825,11 +1229,9 @@ class InteractiveInterface:
 
     def list_collections_interactive(self) -> None:
         """List collections interactively."""
-        collections = self.manager.list_collections()
-        print(f"\nCollections in '{self.manager.current_db}' ({len(collections)}):")
-        for i, collection in enumerate(collections, 1):
-            stats = self.manager.get_collection_stats(collection)
-            count = stats.get('document_count', 0)
+        counts = self.manager.get_all_collection_counts()
+        print(f"\nCollections in '{self.manager.current_db}' ({len(counts)}):")
+        for i, (collection, count) in enumerate(counts.items(), 1):
             print(f"{i}. {collection} ({count} documents)")
 
     def show_stats_interactive(self) -> None:
@@ -865,11 +1267,10 @@ class InteractiveInterface:
 
     def cleanup_interactive(self) -> None:
         """Interactive cleanup."""
-        collections = self.manager.list_collections()
+        counts = self.manager.get_all_collection_counts()
+        collections = list(counts)
         print(f"\nAvailable collections:")
-        for i, collection in enumerate(collections, 1):
-            stats = self.manager.get_collection_stats(collection)
-            count = stats.get('document_count', 0)
+        for i, (collection, count) in enumerate(counts.items(), 1):
             print(f"{i}. {collection} ({count} documents)")
 
         try:
@@ -972,7 +1373,7 @@ def load_config() -> DatabaseConfig:
     """Load database configuration from .env file."""
     try:
         # Load .env file if it exists
-        env_file = os.path.join(os.path.dirname(__file__), '..', '.env')
+        env_file = PROJECT_ROOT / '.env'
         if os.path.exists(env_file):
             try:
                 from dotenv import load_dotenv
@@ -1013,6 +1414,7 @@ Examples:
   python scripts/database_manager.py --list-dbs
   python scripts/database_manager.py --stats
   python scripts/database_manager.py --cleanup --collection messages --days 30
+  python scripts/database_manager.py --ensure-indexes
   python scripts/database_manager.py --export --collection messages --output data.json
   python scripts/database_manager.py --init-config --environment development
         """
@@ -1060,7 +1462,7 @@ Examples:
         '--count',
         type=int,
         default=100,
-        help='Number of documents to delete'
+        help='Number of documents to delete (0 deletes every match)'
     )
 
     parser.add_argument(
@@ -1082,6 +1484,20 @@ Examples:
         help='Filter by session ID'
     )
 
+    parser.add_argument(
+        '--content',
+        type=str,
+        help='Filter by message content'
+    )
+
+    parser.add_argument(
+        '--content-match',
+        type=str,
+        choices=['contains', 'prefix'],
+        default='contains',
+        help='How --content matches: case-insensitive regex or literal prefix'
+    )
+
     parser.add_argument(
         '--newest',
         action='store_true',
@@ -1116,11 +1532,17 @@ Examples:
     parser.add_argument(
         '--format',
         type=str,
-        choices=['json', 'csv'],
+        choices=['json', 'ndjson', 'csv', 'bson'],
         default='json',
         help='Export format'
     )
 
+    parser.add_argument(
+        '--ensure-indexes',
+        action='store_true',
+        help='Create the messages indexes used by cleanup filters'
+    )
+
     # Configuration initialization options
     parser.add_argument(
         '--init-config',
@@ -1169,11 +1591,9 @@ Examples:
                 print(f"  {db}")
 
         elif args.list_collections:
-            collections = manager.list_collections()
+            counts = manager.get_all_collection_counts()
             print(f"Collections in '{config.database_name}':")
-            for collection in collections:
-                stats = manager.get_collection_stats(collection)
-                count = stats.get('document_count', 0)
+            for collection, count in counts.items():
                 print(f"  {collection} ({count} documents)")
 
         elif args.stats:
@@ -1196,6 +1616,8 @@ Examples:
                 days=args.days,
                 role=args.role,
                 session_id=args.session_id,
+                content_filter=args.content,
+                content_match=args.content_match,
                 newest_first=args.newest,
                 dry_run=args.dry_run,
                 force=args.force
@@ -1204,6 +1626,10 @@ Examples:
             success = manager.cleanup_collection(options)
             sys.exit(0 if success else 1)
 
+        elif args.ensure_indexes:
+            success = manager.ensure_cleanup_indexes()
+            sys.exit(0 if success else 1)
+
         elif args.export:
             if not args.collection or not args.output:
                 print("Error: --collection and --output are required for export")
@@ -7,7 +7,10 @@ and multi-tool synchronization. All external dependencies are mocked to ensure i
 while testing the service's integration with the event bus system.
 """
 
-from unittest.mock import AsyncMock, Mock
+import asyncio
+import json
+import logging
+from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 
@@ -31,7 +34,10 @@ class TestOrchestratorFlows:
     def mock_config_service(self):
         """Create a mock ConfigService for testing."""
         mock_service = Mock()
-        mock_service.get_int.return_value = 5  # Default max_tool_iterations
+        # max_tool_iterations is 5; other integer settings keep their defaults
+        mock_service.get_int.side_effect = lambda key, default=0: (
+            5 if key == "system.max_tool_iterations" else default
+        )
         return mock_service
 
     @pytest.fixture
@@ -326,7 +332,8 @@ class TestOrchestratorFlows:
         run = orchestrator_service.active_runs[sample_run.id]
         assert run.status == RunStatus.AWAITING_TOOL_RESULT
         assert run.iteration_count == 1
-        assert run.metadata["pending_tool_calls"] == 1
+        assert orchestrator_service._pending_tool_calls[sample_run.id] == 1
+        assert "pending_tool_calls" not in run.metadata
         assert len(run.history) == 2  # Original human + AI with tool calls
 
         mock_bus.publish.reset_mock()
@@ -369,7 +376,7 @@ class TestOrchestratorFlows:
         # Verify run state
         run = orchestrator_service.active_runs[sample_run.id]
         assert run.status == RunStatus.AWAITING_LLM_DECISION
-        assert run.metadata["pending_tool_calls"] == 0
+        assert sample_run.id not in orchestrator_service._pending_tool_calls
         assert (
             len(run.history) == 3
         )  # Original human + AI with tool calls + tool result
@@ -422,7 +429,7 @@ class TestOrchestratorFlows:
 
         # Verify run state
         run = orchestrator_service.active_runs[sample_run.id]
-        assert run.metadata["pending_tool_calls"] == 2
+        assert orchestrator_service._pending_tool_calls[sample_run.id] == 2
 
         mock_bus.publish.reset_mock()
 
@@ -448,7 +455,7 @@ class TestOrchestratorFlows:
 
         # Verify pending count decremented but still waiting
         run = orchestrator_service.active_runs[sample_run.id]
-        assert run.metadata["pending_tool_calls"] == 1
+        assert orchestrator_service._pending_tool_calls[sample_run.id] == 1
 
         mock_bus.publish.reset_mock()
 
@@ -476,9 +483,258 @@ class TestOrchestratorFlows:
 
         # Verify run state
         run = orchestrator_service.active_runs[sample_run.id]
-        assert run.metadata["pending_tool_calls"] == 0
+        assert sample_run.id not in orchestrator_service._pending_tool_calls
         assert run.status == RunStatus.AWAITING_LLM_DECISION
 
+    @pytest.mark.asyncio
+    async def test_multi_tool_results_follow_dispatch_order(
+        self, orchestrator_service, mock_bus, sample_run
+    ):
+        """
+        Test that tool results arriving out of order are replayed to the LLM in the
+        order the calls were issued, keeping the follow-up prompt deterministic.
+        """
+        orchestrator_service.active_runs[sample_run.id] = sample_run
+        sample_run.status = RunStatus.AWAITING_LLM_DECISION
+
+        llm_result_message = Message(
+            run_id="test-run-123",
+            owner_key="test-session-456",
+            role=Role.AI,
+            content={
+                "content": "",
+                "tool_calls": [
+                    {
+                        "id": "call_a",
+                        "type": "function",
+                        "function": {"name": "web_search", "arguments": "{}"},
+                    },
+                    {
+                        "id": "call_b",
+                        "type": "function",
+                        "function": {"name": "web_extract", "arguments": "{}"},
+                    },
+                ],
+            },
+        )
+        await orchestrator_service.handle_llm_result(llm_result_message)
+        assert sample_run.metadata["tool_call_order"] == ["call_a", "call_b"]
+        mock_bus.publish.reset_mock()
+
+        # Deliver results in reverse completion order
+        for call_id, tool_name in (("call_b", "web_extract"), ("call_a", "web_search")):
+            await orchestrator_service.handle_tool_result(
+                Message(
+                    run_id="test-run-123",
+                    owner_key="test-session-456",
+                    role=Role.TOOL,
+                    content={
+                        "tool_name": tool_name,
+                        "result": f"result for {call_id}",
+                        "status": "success",
+                        "call_id": call_id,
+                    },
+                )
+            )
+
+        llm_call = mock_bus.publish.call_args_list[-1]
+        assert llm_call[0][0] == Topics.LLM_REQUESTS
+        tool_messages = [
+            m for m in llm_call[0][1].content["messages"] if m["role"] == "tool"
+        ]
+        assert [m["tool_call_id"] for m in tool_messages] == ["call_a", "call_b"]
+
+    @pytest.mark.asyncio
+    async def test_tool_calls_normalized_at_ingest(
+        self, orchestrator_service, mock_bus, sample_run
+    ):
+        """
+        Test that tool_calls are normalized once when the AI message is recorded
+        and that the follow-up LLM request reuses the normalized form.
+        """
+        orchestrator_service.active_runs[sample_run.id] = sample_run
+        sample_run.status = RunStatus.AWAITING_LLM_DECISION
+
+        llm_result_message = Message(
+            run_id="test-run-123",
+            owner_key="test-session-456",
+            role=Role.AI,
+            content={
+                "content": None,
+                "tool_calls": [
+                    {
+                        "id": "call_123",
+                        "function": {
+                            "name": "web_search",
+                            "arguments": {"query": "AI"},
+                        },
+                    }
+                ],
+            },
+        )
+        await orchestrator_service.handle_llm_result(llm_result_message)
+
+        ai_message = sample_run.history[-1]
+        assert ai_message.metadata["tool_calls_normalized"] == [
+            {
+                "id": "call_123",
+                "type": "function",
+                "function": {"name": "web_search", "arguments": '{"query": "AI"}'},
+            }
+        ]
+
+        messages = orchestrator_service._convert_history_to_llm_messages(sample_run)
+        assert messages[1]["tool_calls"] is ai_message.metadata["tool_calls_normalized"]
+        assert messages[1]["content"] == ""
+
+    @pytest.mark.asyncio
+    async def test_followup_extends_previous_llm_messages(
+        self, orchestrator_service, mock_bus, sample_run
+    ):
+        """
+        Test that the follow-up LLM request appends the tool turn to the messages
+        of the previous request instead of re-converting the run history.
+        """
+        orchestrator_service.active_runs[sample_run.id] = sample_run
+        context_messages = [
+            {"role": "system", "content": "You are Xi."},
+            {"role": "user", "content": "What is AI?"},
+        ]
+        await orchestrator_service.handle_context_ready(
+            Message(
+                run_id="test-run-123",
+                owner_key="test-session-456",
+                role=Role.SYSTEM,
+                content={"status": "success", "messages": context_messages},
+            )
+        )
+
+        await orchestrator_service.handle_llm_result(
+            Message(
+                run_id="test-run-123",
+                owner_key="test-session-456",
+                role=Role.AI,
+                content={
+                    "content": "",
+                    "tool_calls": [
+                        {
+                            "id": "call_123",
+                            "function": {
+                                "name": "web_search",
+                                "arguments": '{"query": "AI"}',
+                            },
+                        }
+                    ],
+                },
+            )
+        )
+        mock_bus.publish.reset_mock()
+
+        with patch.object(
+            orchestrator_service, "_convert_history_to_llm_messages"
+        ) as convert:
+            await orchestrator_service.handle_tool_result(
+                Message(
+                    run_id="test-run-123",
+                    owner_key="test-session-456",
+                    role=Role.TOOL,
+                    content={
+                        "tool_name": "web_search",
+                        "result": "AI is artificial intelligence.",
+                        "status": "success",
+                        "call_id": "call_123",
+                    },
+                )
+            )
+        convert.assert_not_called()
+
+        llm_message = next(
+            call.args[1]
+            for call in mock_bus.publish.call_args_list
+            if call.args[0] == Topics.LLM_REQUESTS
+        )
+        messages = llm_message.content["messages"]
+        assert messages[:2] == context_messages
+        assert messages[2]["role"] == "assistant"
+        assert messages[2]["tool_calls"][0]["id"] == "call_123"
+        assert messages[3] == {
+            "role": "tool",
+            "content": "AI is artificial intelligence.",
+            "tool_call_id": "call_123",
+            "name": "web_search",
+        }
+        assert len(messages) == 4
+
+    @pytest.mark.asyncio
+    async def test_followups_keep_full_context_across_iterations(
+        self, orchestrator_service, mock_bus, sample_run
+    ):
+        """
+        Test that every follow-up of a multi-iteration run starts with the
+        system message and still carries the tool results of earlier turns.
+        """
+        orchestrator_service.active_runs[sample_run.id] = sample_run
+        await orchestrator_service.handle_context_ready(
+            Message(
+                run_id="test-run-123",
+                owner_key="test-session-456",
+                role=Role.SYSTEM,
+                content={
+                    "status": "success",
+                    "messages": [
+                        {"role": "system", "content": "You are Xi."},
+                        {"role": "user", "content": "What is AI?"},
+                    ],
+                },
+            )
+        )
+
+        for turn in range(4):
+            call_ids = [f"call_{turn}_{i}" for i in range(3)]
+            await orchestrator_service.handle_llm_result(
+                Message(
+                    run_id="test-run-123",
+                    owner_key="test-session-456",
+                    role=Role.AI,
+                    content={
+                        "content": "",
+                        "tool_calls": [
+                            {
+                                "id": call_id,
+                                "function": {"name": "web_search", "arguments": "{}"},
+                            }
+                            for call_id in call_ids
+                        ],
+                    },
+                )
+            )
+            mock_bus.publish.reset_mock()
+            for call_id in call_ids:
+                await orchestrator_service.handle_tool_result(
+                    Message(
+                        run_id="test-run-123",
+                        owner_key="test-session-456",
+                        role=Role.TOOL,
+                        content={
+                            "tool_name": "web_search",
+                            "result": call_id,
+                            "status": "success",
+                            "call_id": call_id,
+                        },
+                    )
+                )
+
+            messages = next(
+                call.args[1].content["messages"]
+                for call in mock_bus.publish.call_args_list
+                if call.args[0] == Topics.LLM_REQUESTS
+            )
+            assert messages[0] == {"role": "system", "content": "You are Xi."}
+            tool_call_ids = [m["tool_call_id"] for m in messages if m["role"] == "tool"]
+            assert tool_call_ids == [
+                f"call_{t}_{i}" for t in range(turn + 1) for i in range(3)
+            ]
+
     @pytest.mark.asyncio
     async def test_max_iterations_safety_valve(
         self, orchestrator_service, mock_bus, sample_run
@@ -592,6 +848,288 @@ class TestOrchestratorFlows:
         assert ui_message.content["event"] == "tool_call_started"
         assert ui_message.content["payload"]["tool_name"] == "web_search"
 
+    @pytest.mark.asyncio
+    async def test_text_chunk_bursts_are_coalesced(
+        self, orchestrator_service, mock_bus, sample_run
+    ):
+        """
+        Test that a burst of text_chunk events is forwarded as the first chunk
+        immediately plus coalesced batches, and that a following non-chunk event
+        flushes pending chunks before it is published.
+        """
+        orchestrator_service.active_runs[sample_run.id] = sample_run
+
+        def chunk_message(text):
+            return Message(
+                run_id="test-run-123",
+                owner_key="test-session-456",
+                role=Role.SYSTEM,
+                content={
+                    "event": "text_chunk",
+                    "run_id": "test-run-123",
+                    "payload": {"chunk": text},
+                },
+            )
+
+        for i in range(10):
+            await orchestrator_service.handle_llm_result(chunk_message(str(i)))
+
+        # First chunk immediately, then one batch of 8 chunks; 1 chunk still buffered
+        chunks = [
+            call[0][1].content["payload"]["chunk"]
+            for call in mock_bus.publish.call_args_list
+        ]
+        assert chunks == ["0", "12345678"]
+
+        await orchestrator_service.handle_llm_result(
+            Message(
+                run_id="test-run-123",
+                owner_key="test-session-456",
+                role=Role.SYSTEM,
+                content={
+                    "event": "tool_call_started",
+                    "run_id": "test-run-123",
+                    "payload": {"tool_name": "web_search"},
+                },
+            )
+        )
+
+        events = [
+            (call[0][1].content["event"], call[0][1].content["payload"])
+            for call in mock_bus.publish.call_args_list[2:]
+        ]
+        assert events == [
+            ("text_chunk", {"chunk": "9"}),
+            ("tool_call_started", {"tool_name": "web_search"}),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_timer_chunk_publish_failure_is_logged(
+        self, orchestrator_service, mock_bus, caplog
+    ):
+        """
+        Test that a chunk batch published from the window timer is tracked:
+        a failed publish is logged and aclose waits for the task.
+        """
+        orchestrator_service._chunk_buffers["test-run-123"] = ["a", "b"]
+        mock_bus.publish.side_effect = RuntimeError("bus down")
+
+        with caplog.at_level(logging.ERROR, logger="nexus.core.tasks"):
+            orchestrator_service._on_chunk_window_elapsed(
+                "test-run-123", "test-session-456"
+            )
+            await orchestrator_service.aclose()
+
+        assert "publish text chunks for run_id=test-run-123" in caplog.text
+        assert "bus down" in caplog.text
+        orchestrator_service._chunk_flush_handles.pop("test-run-123").cancel()
+
+    @pytest.mark.asyncio
+    async def test_timer_ui_flush_failure_is_logged_and_aclose_flushes(
+        self, orchestrator_service, mock_bus, caplog
+    ):
+        """
+        Test that a failed UI batch publish from the linger timer is logged,
+        and that aclose publishes events still waiting in the buffer.
+        """
+        orchestrator_service.ui_event_linger = 60.0
+        event = orchestrator_service._create_ui_event(
+            run_id="test-run-123",
+            owner_key="test-session-456",
+            event_type="text_chunk",
+            payload={"chunk": "a"},
+        )
+        await orchestrator_service._publish_ui_event(event)
+        mock_bus.publish.side_effect = RuntimeError("bus down")
+
+        with caplog.at_level(logging.ERROR, logger="nexus.core.tasks"):
+            orchestrator_service._on_ui_linger_elapsed()
+            await orchestrator_service.aclose()
+        assert "publish UI event batch: bus down" in caplog.text
+
+        mock_bus.publish.side_effect = None
+        mock_bus.publish.reset_mock()
+        await orchestrator_service._publish_ui_event(event)
+        await orchestrator_service.aclose()
+
+        mock_bus.publish.assert_called_once()
+        assert mock_bus.publish.call_args[0][0] == Topics.UI_EVENTS_BATCH
+        assert orchestrator_service._ui_flush_handle is None
+
+    @pytest.mark.asyncio
+    async def test_large_structured_tool_result_serialized_once(
+        self, orchestrator_service, mock_bus, sample_run
+    ):
+        """
+        Test that a large non-string tool result is serialized when it arrives
+        and that the follow-up LLM request carries that serialization.
+        """
+        orchestrator_service.active_runs[sample_run.id] = sample_run
+        orchestrator_service._pending_tool_calls[sample_run.id] = 1
+        large_result = {"items": [{"text": "x" * 1024} for _ in range(32)]}
+
+        await orchestrator_service.handle_tool_result(
+            Message(
+                run_id="test-run-123",
+                owner_key="test-session-456",
+                role=Role.TOOL,
+                content={
+                    "tool_name": "web_search",
+                    "result": large_result,
+                    "status": "success",
+                    "call_id": "call_123",
+                },
+            )
+        )
+
+        serialized = sample_run.history[-1].metadata["content_serialized"]
+        assert json.loads(serialized) == large_result
+
+        llm_message = mock_bus.publish.call_args_list[-1][0][1]
+        assert llm_message.content["messages"][-1]["content"] == serialized
+
+    @pytest.mark.asyncio
+    async def test_ui_events_batched_within_linger_window(
+        self, orchestrator_service, mock_bus
+    ):
+        """
+        Test that with a linger window UI events are buffered and published
+        together on UI_EVENTS_BATCH, early once the batch is full.
+        """
+        orchestrator_service.ui_event_linger = 0.001
+
+        def make_event(index):
+            return orchestrator_service._create_ui_event(
+                run_id="test-run-123",
+                owner_key="test-session-456",
+                event_type="text_chunk",
+                payload={"chunk": str(index)},
+            )
+
+        await orchestrator_service._publish_ui_event(make_event(0))
+        await orchestrator_service._publish_ui_event(make_event(1))
+        mock_bus.publish.assert_not_called()
+
+        await asyncio.sleep(0.01)
+        mock_bus.publish.assert_called_once()
+        topic, batch = mock_bus.publish.call_args[0]
+        assert topic == Topics.UI_EVENTS_BATCH
+        assert [event.content["payload"]["chunk"] for event in batch.content] == [
+            "0",
+            "1",
+        ]
+
+        mock_bus.publish.reset_mock()
+        for index in range(64):
+            await orchestrator_service._publish_ui_event(make_event(index))
+        mock_bus.publish.assert_called_once()
+        assert len(mock_bus.publish.call_args[0][1].content) == 64
+        assert orchestrator_service._ui_flush_handle is None
+
+    @pytest.mark.asyncio
+    async def test_active_runs_bounded_by_admission_order(
+        self, orchestrator_service, mock_bus
+    ):
+        """
+        Test that runs beyond max_active_runs are evicted oldest first and that
+        a failed context build releases its run.
+        """
+        orchestrator_service.max_active_runs = 2
+
+        async def start_run(run_id):
+            run = Run(
+                id=run_id,
+                owner_key="test-session-456",
+                history=[
+                    Message(
+                        run_id=run_id,
+                        owner_key="test-session-456",
+                        role=Role.HUMAN,
+                        content="hello",
+                    )
+                ],
+            )
+            await orchestrator_service.handle_new_run(
+                Message(
+                    run_id=run_id,
+                    owner_key="test-session-456",
+                    role=Role.SYSTEM,
+                    content=run,
+                )
+            )
+
+        await start_run("run-1")
+        await start_run("run-2")
+        orchestrator_service._pending_tool_calls["run-1"] = 1
+        await start_run("run-3")
+
+        assert set(orchestrator_service.active_runs) == {"run-2", "run-3"}
+        assert "run-1" not in orchestrator_service._pending_tool_calls
+
+        await orchestrator_service.handle_context_ready(
+            Message(
+                run_id="run-2",
+                owner_key="test-session-456",
+                role=Role.SYSTEM,
+                content={"status": "error"},
+            )
+        )
+        assert set(orchestrator_service.active_runs) == {"run-3"}
+
+    @pytest.mark.asyncio
+    async def test_malformed_inputs_are_dropped(
+        self, orchestrator_service, mock_bus, mock_identity_service, sample_run
+    ):
+        """
+        Test that malformed results and identity lookup failures are logged and
+        dropped without publishing anything.
+        """
+        orchestrator_service.active_runs[sample_run.id] = sample_run
+        # handle_context_ready last: a failed context build releases the run
+        for handler in (
+            orchestrator_service.handle_llm_result,
+            orchestrator_service.handle_tool_result,
+            orchestrator_service.handle_context_ready,
+        ):
+            await handler(
+                Message(
+                    run_id="test-run-123",
+                    owner_key="test-session-456",
+                    role=Role.SYSTEM,
+                    content="not-a-dict",
+                )
+            )
+        mock_bus.publish.assert_not_called()
+        assert sample_run.id not in orchestrator_service.active_runs
+
+        mock_identity_service.get_identity.side_effect = ConnectionError("db down")
+        new_run = Run(
+            id="test-run-789",
+            owner_key="test-session-456",
+            history=sample_run.history,
+        )
+        await orchestrator_service.handle_new_run(
+            Message(
+                run_id="test-run-789",
+                owner_key="test-session-456",
+                role=Role.SYSTEM,
+                content=new_run,
+            )
+        )
+        mock_bus.publish.assert_not_called()
+        assert "test-run-789" not in orchestrator_service.active_runs
+
+    def test_parse_tool_arguments(self, orchestrator_service):
+        """
+        Test tool argument parsing for JSON strings, dicts and malformed input.
+        """
+        parse = orchestrator_service._parse_tool_arguments
+        assert parse('{"query": "AI"}') == {"query": "AI"}
+        assert parse({"query": "AI"}) == {"query": "AI"}
+        assert parse("[1, 2]") == {}
+        assert parse("{not json") == {}
+        assert parse(None) == {}
+
     def test_subscribe_to_bus(self, orchestrator_service, mock_bus):
         """
         Test that OrchestratorService correctly subscribes to all required topics.
@@ -7,6 +7,8 @@ All external dependencies are mocked to ensure isolation while testing the servi
 integration with the event bus system and database operations.
 """
 
+import asyncio
+import logging
 from unittest.mock import AsyncMock, Mock
 
 import pytest
@@ -24,6 +26,7 @@ class TestPersistenceServiceIntegration:
         """Create a mock DatabaseService for testing."""
         mock_service = Mock()
         mock_service.insert_message_async = AsyncMock(return_value=True)
+        mock_service.insert_messages_async = AsyncMock(return_value=True)
         mock_service.get_history_by_owner_key = AsyncMock(return_value=[])
         mock_service.bus = Mock()  # Mock bus for subscription
         return mock_service
@@ -425,6 +428,228 @@ class TestPersistenceServiceIntegration:
         # Assert: Verify no message was persisted due to invalid format
         mock_database_service.insert_message_async.assert_not_called()
 
+    @pytest.mark.asyncio
+    async def test_messages_batched_within_linger_window(
+        self, mock_database_service, sample_run
+    ):
+        """
+        Test that under a burst messages are buffered and written with one bulk
+        insert once the window elapses, while the first, idle-rate message is
+        written at once.
+        """
+        persistence_service = PersistenceService(
+            database_service=mock_database_service, linger=0.001
+        )
+
+        await persistence_service.handle_context_build_request(
+            Message(
+                run_id="test-run-123",
+                owner_key="test-session-456",
+                role=Role.SYSTEM,
+                content=sample_run,
+            )
+        )
+        await persistence_service.handle_llm_result(
+            Message(
+                run_id="test-run-123",
+                owner_key="test-session-456",
+                role=Role.AI,
+                content={"content": "AI is a field of computer science."},
+            )
+        )
+        await persistence_service.handle_tool_result(
+            Message(
+                run_id="test-run-123",
+                owner_key="test-session-456",
+                role=Role.TOOL,
+                content={"result": "search results", "tool_name": "web_search"},
+            )
+        )
+        mock_database_service.insert_message_async.assert_called_once()
+        mock_database_service.insert_messages_async.assert_not_called()
+
+        await asyncio.sleep(0.01)
+
+        mock_database_service.insert_messages_async.assert_called_once()
+        batch = mock_database_service.insert_messages_async.call_args[0][0]
+        assert [message.role for message in batch] == [Role.AI, Role.TOOL]
+
+    @pytest.mark.asyncio
+    async def test_messages_written_immediately_at_low_rate(
+        self, mock_database_service
+    ):
+        """
+        Test that spaced-out messages are written one by one even with a
+        linger window configured.
+        """
+        persistence_service = PersistenceService(
+            database_service=mock_database_service, linger=0.005
+        )
+
+        for i in range(3):
+            await persistence_service.handle_llm_result(
+                Message(
+                    run_id=f"run-{i}",
+                    owner_key="test-session-456",
+                    role=Role.AI,
+                    content={"content": f"response {i}"},
+                )
+            )
+            await asyncio.sleep(0.02)
+
+        assert mock_database_service.insert_message_async.call_count == 3
+        mock_database_service.insert_messages_async.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_human_messages_coalesced_while_insert_in_flight(
+        self, persistence_service, mock_database_service
+    ):
+        """
+        Test that without a linger window, human messages arriving while an
+        insert is in flight are written together by one bulk insert.
+        """
+        release = asyncio.Event()
+
+        async def slow_insert(message):
+            await release.wait()
+            return True
+
+        mock_database_service.insert_message_async = AsyncMock(side_effect=slow_insert)
+
+        def build_request(i):
+            human = Message(
+                run_id=f"run-{i}",
+                owner_key=f"owner-{i}",
+                role=Role.HUMAN,
+                content=f"input {i}",
+            )
+            run = Run(id=f"run-{i}", owner_key=f"owner-{i}", history=[human])
+            return Message(
+                run_id=run.id, owner_key=run.owner_key, role=Role.SYSTEM, content=run
+            )
+
+        tasks = [
+            asyncio.create_task(
+                persistence_service.handle_context_build_request(build_request(i))
+            )
+            for i in range(4)
+        ]
+        await asyncio.sleep(0)
+        release.set()
+        await asyncio.gather(*tasks)
+
+        mock_database_service.insert_message_async.assert_called_once()
+        mock_database_service.insert_messages_async.assert_called_once()
+        batch = mock_database_service.insert_messages_async.call_args[0][0]
+        assert [message.content for message in batch] == [
+            "input 1",
+            "input 2",
+            "input 3",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_flush_waits_for_insert_in_flight(
+        self, persistence_service, mock_database_service
+    ):
+        """
+        Test that flush does not return while an insert is in flight, and
+        writes the messages coalesced behind it exactly once.
+        """
+        release = asyncio.Event()
+
+        async def slow_insert(message):
+            await release.wait()
+            return True
+
+        mock_database_service.insert_message_async = AsyncMock(side_effect=slow_insert)
+
+        tasks = [
+            asyncio.create_task(
+                persistence_service.handle_llm_result(
+                    Message(
+                        run_id=f"run-{i}",
+                        owner_key="test-session-456",
+                        role=Role.AI,
+                        content={"content": f"response {i}"},
+                    )
+                )
+            )
+            for i in range(2)
+        ]
+        await asyncio.sleep(0)
+        flush_task = asyncio.create_task(persistence_service.flush())
+        await asyncio.sleep(0)
+        assert not flush_task.done()
+
+        release.set()
+        await asyncio.gather(flush_task, *tasks)
+
+        mock_database_service.insert_message_async.assert_called_once()
+        mock_database_service.insert_messages_async.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_timer_flush_failure_is_logged_and_awaited_by_flush(
+        self, persistence_service, mock_database_service, caplog
+    ):
+        """
+        Test that a batched insert started by the linger timer is tracked:
+        flush waits for it and its failure is logged.
+        """
+        release = asyncio.Event()
+
+        async def failing_insert(batch):
+            await release.wait()
+            raise RuntimeError("database down")
+
+        mock_database_service.insert_messages_async = AsyncMock(
+            side_effect=failing_insert
+        )
+        persistence_service._msg_buffer.append(
+            Message(
+                run_id="run-1",
+                owner_key="test-session-456",
+                role=Role.AI,
+                content={"content": "response"},
+            )
+        )
+
+        with caplog.at_level(logging.ERROR, logger="nexus.core.tasks"):
+            persistence_service._on_linger_elapsed()
+            flush_task = asyncio.create_task(persistence_service.flush())
+            await asyncio.sleep(0)
+            assert not flush_task.done()
+
+            release.set()
+            await flush_task
+
+        mock_database_service.insert_messages_async.assert_called_once()
+        assert "persist buffered messages: database down" in caplog.text
+
+    @pytest.mark.asyncio
+    async def test_hot_path_silent_drops_debug_logs(
+        self, mock_database_service, caplog
+    ):
+        """
+        Test that hot_path_silent suppresses per-message debug logs while the
+        message is still persisted.
+        """
+        persistence_service = PersistenceService(
+            database_service=mock_database_service, hot_path_silent=True
+        )
+
+        with caplog.at_level(logging.DEBUG, logger="nexus.services.persistence"):
+            await persistence_service.handle_llm_result(
+                Message(
+                    run_id="test-run-123",
+                    owner_key="test-session-456",
+                    role=Role.AI,
+                    content={"content": "AI is a field of computer science."},
+                )
+            )
+
+        mock_database_service.insert_message_async.assert_called_once()
+        assert not [r for r in caplog.records if r.levelno == logging.DEBUG]
+
     @pytest.mark.asyncio
     async def test_get_history_delegates_to_database_service(
         self, persistence_service, mock_database_service
@@ -8,6 +8,7 @@ with the event bus system.
 """
 
 import asyncio
+import logging
 from unittest.mock import AsyncMock, Mock
 
 import pytest
@@ -15,6 +16,7 @@ import pytest
 from nexus.core.models import Message, Role
 from nexus.core.topics import Topics
 from nexus.services.tool_executor import ToolExecutorService
+from nexus.tools.registry import get_default_registry, make_tool_dispatcher
 
 
 class TestToolExecutorServiceIntegration:
@@ -32,14 +34,24 @@ class TestToolExecutorServiceIntegration:
     def mock_tool_registry(self):
         """Create a mock ToolRegistry for testing."""
         mock_registry = Mock()
+        # Dispatch whatever function a test configures via get_tool_function
+        mock_registry.get_tool_dispatcher.side_effect = lambda name: (
+            make_tool_dispatcher(function)
+            if (function := mock_registry.get_tool_function(name)) is not None
+            else None
+        )
         return mock_registry
 
     @pytest.fixture
     def mock_config_service(self):
         """Create a mock ConfigService for testing."""
         mock_config = Mock()
-        # Return default timeout of 20 seconds
-        mock_config.get_int = Mock(return_value=20)
+        # Return timeout of 20 seconds; other settings keep their defaults
+        mock_config.get_int = Mock(
+            side_effect=lambda key, default=0: (
+                20 if key == "system.tool_execution_timeout" else default
+            )
+        )
         return mock_config
 
     @pytest.fixture
@@ -413,6 +425,192 @@ class TestToolExecutorServiceIntegration:
         assert "timed out after" in content["result"]
         assert content["tool_name"] == "slow_tool"
 
+    @pytest.mark.asyncio
+    async def test_tool_results_batched_within_flush_delay(
+        self, mock_bus, mock_tool_registry
+    ):
+        """
+        Test that with a flush delay configured, results of concurrently
+        finishing tools are published together as one batch.
+        """
+        mock_bus.publish_batch = AsyncMock()
+        mock_config = Mock()
+        mock_config.get_int = Mock(
+            side_effect=lambda key, default=0: (
+                1 if key == "system.tool_results_flush_ms" else default
+            )
+        )
+        service = ToolExecutorService(
+            bus=mock_bus, tool_registry=mock_tool_registry, config_service=mock_config
+        )
+        mock_tool_registry.get_tool_function.return_value = Mock(return_value="ok")
+
+        await asyncio.gather(
+            *(
+                service.handle_tool_request(
+                    Message(
+                        run_id="test-run-batch",
+                        owner_key="test-session-batch",
+                        role=Role.SYSTEM,
+                        content={"name": "echo", "args": {}, "call_id": f"call_{i}"},
+                    )
+                )
+                for i in range(3)
+            )
+        )
+        mock_bus.publish_batch.assert_not_called()
+
+        await asyncio.sleep(0.01)
+
+        mock_bus.publish.assert_not_called()
+        mock_bus.publish_batch.assert_awaited_once()
+        topic, batch = mock_bus.publish_batch.call_args[0]
+        assert topic == Topics.TOOLS_RESULTS
+        assert sorted(m.content["call_id"] for m in batch) == [
+            "call_0",
+            "call_1",
+            "call_2",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_tool_concurrency_limited_per_tool(
+        self, mock_bus, mock_tool_registry
+    ):
+        """
+        Test that tools.<name>.max_concurrency caps simultaneous executions
+        of that tool while queued calls still complete.
+        """
+        mock_config = Mock()
+        mock_config.get_int = Mock(
+            side_effect=lambda key, default=0: (
+                2 if key == "tools.limited_tool.max_concurrency" else default
+            )
+        )
+        service = ToolExecutorService(
+            bus=mock_bus, tool_registry=mock_tool_registry, config_service=mock_config
+        )
+
+        running = 0
+        peak = 0
+
+        async def limited_tool():
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return "done"
+
+        mock_tool_registry.get_tool_function.return_value = limited_tool
+
+        await asyncio.gather(
+            *(
+                service.handle_tool_request(
+                    Message(
+                        run_id="test-run-limit",
+                        owner_key="test-session-limit",
+                        role=Role.SYSTEM,
+                        content={
+                            "name": "limited_tool",
+                            "args": {},
+                            "call_id": f"call_{i}",
+                        },
+                    )
+                )
+                for i in range(5)
+            )
+        )
+
+        assert peak == 2
+        assert mock_bus.publish.await_count == 5
+        statuses = {c[0][1].content["status"] for c in mock_bus.publish.call_args_list}
+        assert statuses == {"success"}
+
+    @pytest.mark.asyncio
+    async def test_tool_stats_count_calls_by_status(
+        self, tool_executor_service, mock_tool_registry, caplog
+    ):
+        """
+        Test that finished tool calls are counted per tool and status, and
+        logged when the service closes.
+        """
+
+        def flaky_tool(fail: bool) -> str:
+            if fail:
+                raise RuntimeError("boom")
+            return "ok"
+
+        mock_tool_registry.get_tool_function.side_effect = lambda name: (
+            flaky_tool if name == "flaky_tool" else None
+        )
+
+        for name, fail in (
+            ("flaky_tool", False),
+            ("flaky_tool", False),
+            ("flaky_tool", True),
+            ("missing_tool", False),
+        ):
+            await tool_executor_service.handle_tool_request(
+                Message(
+                    run_id="test-run-stats",
+                    owner_key="test-session-stats",
+                    role=Role.SYSTEM,
+                    content={"name": name, "args": {"fail": fail}},
+                )
+            )
+
+        stats = tool_executor_service.get_tool_stats()
+        assert stats["flaky_tool"]["success"] == 2
+        assert stats["flaky_tool"]["error"] == 1
+        assert stats["flaky_tool"]["latency_total"] > 0
+        assert stats["missing_tool"] == {"error": 1, "latency_total": 0.0}
+
+        with caplog.at_level(logging.INFO, logger="nexus.services.tool_executor"):
+            await tool_executor_service.aclose()
+        assert (
+            "Tool stats: tool=flaky_tool calls={'success': 2, 'error': 1}"
+            in caplog.text
+        )
+        assert "Tool stats: tool=missing_tool calls={'error': 1}" in caplog.text
+
+    @pytest.mark.asyncio
+    async def test_timer_results_flush_failure_is_logged(
+        self, tool_executor_service, mock_bus, caplog
+    ):
+        """
+        Test that a result batch published from the flush timer is tracked:
+        a failed publish is logged and aclose waits for the task.
+        """
+        mock_bus.publish_batch = AsyncMock(side_effect=RuntimeError("bus down"))
+        tool_executor_service._results_buffer.append(
+            tool_executor_service._create_tool_result_message(
+                run_id="test-run-flush",
+                owner_key="test-session-flush",
+                result="ok",
+                status="success",
+                tool_name="web_search",
+            )
+        )
+
+        with caplog.at_level(logging.ERROR, logger="nexus.core.tasks"):
+            tool_executor_service._on_results_flush_elapsed()
+            await tool_executor_service.aclose()
+
+        mock_bus.publish_batch.assert_awaited_once()
+        assert "publish buffered tool results: bus down" in caplog.text
+
+    def test_construction_leaves_registry_untouched(self, mock_bus):
+        """
+        Test that the service can be built on a frozen registry and does not
+        rebind the registry's executor.
+        """
+        registry = get_default_registry()
+        dispatcher = registry.get_tool_dispatcher("test_tool")
+
+        ToolExecutorService(bus=mock_bus, tool_registry=registry)
+
+        assert registry.get_tool_dispatcher("test_tool") is dispatcher
+
     @pytest.mark.asyncio
     async def test_config_service_timeout_configuration(
         self, mock_bus, mock_tool_registry
@@ -422,7 +620,11 @@ class TestToolExecutorServiceIntegration:
         """
         # Arrange: Create config service that returns custom timeout
         mock_config = Mock()
-        mock_config.get_int = Mock(return_value=30)
+        mock_config.get_int = Mock(
+            side_effect=lambda key, default=0: (
+                30 if key == "system.tool_execution_timeout" else default
+            )
+        )
 
         # Act: Create service with custom config
         service = ToolExecutorService(
@@ -430,7 +632,7 @@ class TestToolExecutorServiceIntegration:
         )
 
         # Assert: Verify timeout was read from config
-        mock_config.get_int.assert_called_once_with("system.tool_execution_timeout", 20)
+        mock_config.get_int.assert_any_call("system.tool_execution_timeout", 20)
         assert service.tool_timeout == 30
 
     @pytest.mark.asyncio
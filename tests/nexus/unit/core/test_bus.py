@@ -81,7 +81,7 @@ class TestNexusBusInternalState:
 
         # Publishing to a topic with no subscribers should not raise an exception
         # This test passes if no exception is raised
-        with patch("asyncio.Queue.put", new_callable=AsyncMock) as mock_put:
+        with patch("asyncio.Queue.put_nowait") as mock_put:
             asyncio.run(bus.publish(topic, message))
 
             # Since the topic doesn't exist, put should not be called
@@ -107,14 +107,38 @@ class TestNexusBusInternalState:
         )
 
         # Publish to the topic
-        with patch.object(
-            bus._queues[topic], "put", new_callable=AsyncMock
-        ) as mock_put:
+        with patch.object(bus._queues[topic], "put_nowait") as mock_put:
             asyncio.run(bus.publish(topic, message))
 
             # Verify the message was enqueued
             mock_put.assert_called_once_with(message)
 
+    def test_publish_batch_enqueues_messages_in_order(self):
+        """Test that publish_batch enqueues every message in order."""
+        bus = NexusBus()
+        topic = "test.topic"
+
+        async def mock_handler(message: Message) -> None:
+            pass
+
+        bus.subscribe(topic, mock_handler)
+        messages = [
+            Message(
+                run_id="test_run",
+                owner_key="test_session",
+                role=Role.TOOL,
+                content=f"result {i}",
+            )
+            for i in range(3)
+        ]
+
+        asyncio.run(bus.publish_batch(topic, messages))
+        asyncio.run(bus.publish_batch("unknown.topic", messages))
+
+        queue = bus._queues[topic]
+        assert [queue.get_nowait() for _ in range(queue.qsize())] == messages
+        assert "unknown.topic" not in bus._queues
+
     def test_bus_initialization_state(self):
         """Test that NexusBus initializes with empty internal structures."""
         bus = NexusBus()
@@ -370,3 +394,78 @@ class TestNexusBusListener:
 
             # Verify task_done was called
             mock_task_done.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_listener_drains_queued_burst_in_order(self):
+        """Test that _listener dispatches an already-queued burst in order."""
+        bus = NexusBus()
+        topic = "test.topic"
+        received: list[str] = []
+
+        async def handler(message: Message) -> None:
+            received.append(message.content)
+
+        bus.subscribe(topic, handler)
+
+        queue = bus._queues[topic]
+        for index in range(100):
+            queue.put_nowait(
+                Message(
+                    run_id="test_run",
+                    owner_key="test_session",
+                    role=Role.HUMAN,
+                    content=str(index),
+                )
+            )
+
+        listener_task = asyncio.create_task(bus._listener(topic, queue))
+        await asyncio.sleep(0.01)
+        listener_task.cancel()
+        try:
+            await listener_task
+        except asyncio.CancelledError:
+            pass
+
+        assert received == [str(index) for index in range(100)]
+        assert queue.empty()
+        await asyncio.wait_for(queue.join(), timeout=1)
+
+    @pytest.mark.asyncio
+    async def test_direct_publish_schedules_handlers_without_queue(self):
+        """Test that direct publishes bypass the topic queue and its listener."""
+        bus = NexusBus()
+        topic = "test.topic"
+        received: list[str] = []
+
+        async def handler(message: Message) -> None:
+            received.append(message.content)
+
+        bus.subscribe(topic, handler)
+
+        for index in range(3):
+            await bus.publish(
+                topic,
+                Message(
+                    run_id="test_run",
+                    owner_key="test_session",
+                    role=Role.HUMAN,
+                    content=str(index),
+                ),
+                direct=True,
+            )
+        await asyncio.sleep(0)
+
+        assert received == ["0", "1", "2"]
+        assert bus._queues[topic].empty()
+
+        # Topics without subscribers are dropped silently
+        await bus.publish(
+            "unsubscribed.topic",
+            Message(
+                run_id="test_run",
+                owner_key="test_session",
+                role=Role.HUMAN,
+                content="dropped",
+            ),
+            direct=True,
+        )
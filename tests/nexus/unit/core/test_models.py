@@ -39,6 +39,37 @@ class TestMessageDefaults:
         uuid_part = message.id[4:]
         uuid.UUID(uuid_part)  # Will raise ValueError if invalid
 
+    def test_trusted_matches_validating_constructor(self):
+        """Test that Message.trusted builds the same message as the constructor."""
+        message = Message.trusted("run_1", "owner_1", Role.AI, {"a": 1}, {"k": "v"})
+        validated = Message(**message.model_dump())
+
+        assert message == validated
+        assert message.id.startswith("msg_")
+        assert message.timestamp.tzinfo == UTC
+        assert message.model_fields_set == {
+            "run_id",
+            "owner_key",
+            "role",
+            "content",
+            "metadata",
+        }
+        assert Message.trusted("run_1", "owner_1", Role.AI, "x").metadata == {}
+
+    def test_forward_keeps_run_and_owner(self):
+        """Test that Message.forward derives a new message for the same run."""
+        inbound = Message(
+            run_id="run_1", owner_key="owner_1", role=Role.AI, content="hi"
+        )
+
+        forwarded = inbound.forward({"event": "x"}, role=Role.SYSTEM)
+
+        assert (forwarded.run_id, forwarded.owner_key) == ("run_1", "owner_1")
+        assert forwarded.role == Role.SYSTEM
+        assert forwarded.content == {"event": "x"}
+        assert forwarded.id != inbound.id
+        assert inbound.forward("again").role == Role.AI
+
 
 class TestRunDefaults:
     """Test that Run model has correct default values."""
@@ -0,0 +1,54 @@
+"""
+Unit tests for BackgroundTasks.
+
+These tests verify that tracked tasks are held until they finish, that their
+failures are logged, and that drain waits for tasks started while draining.
+"""
+
+import asyncio
+import logging
+
+import pytest
+
+from nexus.core.tasks import BackgroundTasks
+
+
+class TestBackgroundTasks:
+    """Test tracked background task lifecycle."""
+
+    @pytest.mark.asyncio
+    async def test_failed_task_is_logged_and_released(self, caplog):
+        """Test that a failing task is logged with its description and dropped."""
+        tasks = BackgroundTasks()
+
+        async def fail():
+            raise RuntimeError("boom")
+
+        with caplog.at_level(logging.ERROR, logger="nexus.core.tasks"):
+            tasks.spawn(fail(), "publish batch")
+            assert len(tasks) == 1
+            await tasks.drain()
+
+        assert len(tasks) == 0
+        assert "Background task failed: publish batch: boom" in caplog.text
+
+    @pytest.mark.asyncio
+    async def test_drain_waits_for_tasks_started_while_draining(self):
+        """Test that drain also waits for tasks spawned by a draining task."""
+        tasks = BackgroundTasks()
+        finished = []
+
+        async def second():
+            await asyncio.sleep(0)
+            finished.append("second")
+
+        async def first():
+            await asyncio.sleep(0)
+            tasks.spawn(second(), "second")
+            finished.append("first")
+
+        tasks.spawn(first(), "first")
+        await tasks.drain()
+
+        assert finished == ["first", "second"]
+        assert len(tasks) == 0
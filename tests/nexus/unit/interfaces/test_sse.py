@@ -55,11 +55,12 @@ class TestSSEInterface:
         """Test bus subscription."""
         sse_interface.subscribe_to_bus()
         
-        # Should subscribe to UI_EVENTS and COMMAND_RESULT
-        assert mock_bus.subscribe.call_count == 2
+        # Should subscribe to UI_EVENTS, UI_EVENTS_BATCH and COMMAND_RESULT
+        assert mock_bus.subscribe.call_count == 3
         calls = mock_bus.subscribe.call_args_list
         topics = [call[0][0] for call in calls]
         assert Topics.UI_EVENTS in topics
+        assert Topics.UI_EVENTS_BATCH in topics
         assert Topics.COMMAND_RESULT in topics
 
     def test_register_chat_stream(self, sse_interface):
@@ -129,6 +130,35 @@ class TestSSEInterface:
         received = await queue.get()
         assert received == ui_event
 
+    @pytest.mark.asyncio
+    async def test_handle_ui_event_batch_routes_each_event(self, sse_interface):
+        """Test that batched UI events are routed to their streams in order."""
+        queue_a = sse_interface.register_chat_stream("run_a")
+        queue_b = sse_interface.register_chat_stream("run_b")
+        events = [
+            Message(
+                run_id=run_id,
+                owner_key="0xABC",
+                role=Role.SYSTEM,
+                content={"event": event, "run_id": run_id, "payload": {}},
+            )
+            for run_id, event in [
+                ("run_a", "run_started"),
+                ("run_b", "run_started"),
+                ("run_a", "run_finished"),
+            ]
+        ]
+        batch = Message(
+            run_id="run_a", owner_key="0xABC", role=Role.SYSTEM, content=events
+        )
+
+        await sse_interface.handle_ui_event_batch(batch)
+
+        assert (await queue_a.get())["event"] == "run_started"
+        assert (await queue_a.get())["event"] == "run_finished"
+        assert (await queue_b.get())["event"] == "run_started"
+        assert queue_b.empty()
+
     @pytest.mark.asyncio
     async def test_handle_ui_event_no_active_stream(self, sse_interface):
         """Test UI event handling when no active stream exists."""
@@ -214,6 +244,18 @@ class TestSSEInterface:
         parsed_data = json.loads(data_line[6:])
         assert parsed_data == data
 
+    def test_format_sse_event_text_chunk_matches_generic_format(self):
+        """Test that the text_chunk fast path produces the generic encoding."""
+        data = {
+            "event": "text_chunk",
+            "run_id": "run-123",
+            "payload": {"chunk": 'He said "hi"\n你好'},
+        }
+
+        formatted = SSEInterface.format_sse_event("text_chunk", data)
+
+        assert formatted == f"event: text_chunk\ndata: {json.dumps(data)}\n\n"
+
     def test_format_sse_event_with_string_data(self):
         """Test SSE event formatting with string data."""
         event_type = "message"
@@ -0,0 +1,125 @@
+"""
+Unit tests for the database management script's cleanup paths.
+
+The script is loaded from scripts/ by path; the MongoDB collection is mocked
+so no server is needed.
+"""
+
+import importlib.util
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+SCRIPT_PATH = Path(__file__).resolve().parents[4] / "scripts" / "database_manager.py"
+
+
+@pytest.fixture(scope="module")
+def database_manager():
+    """Import scripts/database_manager.py as a module."""
+    spec = importlib.util.spec_from_file_location("database_manager", SCRIPT_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture
+def collection():
+    """Mock messages collection whose cursor methods chain."""
+    collection = MagicMock()
+    cursor = collection.find.return_value
+    for method in ("sort", "limit", "batch_size", "allow_disk_use", "max_time_ms"):
+        getattr(cursor, method).return_value = cursor
+    cursor.__iter__.return_value = iter([{"id": "msg_1"}, {"id": "msg_2"}])
+    collection.count_documents.return_value = 2
+    collection.index_information.return_value = {}
+    return collection
+
+
+@pytest.fixture
+def manager(database_manager, collection):
+    """DatabaseManager connected to the mocked collection."""
+    manager = database_manager.DatabaseManager.__new__(database_manager.DatabaseManager)
+    manager.provider = MagicMock()
+    manager.current_db = "test"
+    manager._cache = {}
+    manager._collection_map = {"messages": collection}
+    return manager
+
+
+class TestCleanupCount:
+    """--count caps a cleanup; 0 removes the cap."""
+
+    def test_count_zero_counts_and_deletes_every_match(
+        self, database_manager, manager, collection
+    ):
+        """Test that count 0 counts without a limit and leaves the cursor unlimited."""
+        options = database_manager.CleanupOptions(collection="messages", count=0)
+
+        assert manager.count_documents_to_delete(options) == 2
+        assert list(manager.iter_deletion_id_batches(options)) == [["msg_1", "msg_2"]]
+
+        assert "limit" not in collection.count_documents.call_args.kwargs
+        collection.find.return_value.limit.assert_not_called()
+
+    def test_positive_count_limits_count_and_cursor(
+        self, database_manager, manager, collection
+    ):
+        """Test that a positive count limits both the count and the cursor."""
+        options = database_manager.CleanupOptions(collection="messages", count=2)
+
+        manager.count_documents_to_delete(options)
+        list(manager.iter_deletion_id_batches(options))
+
+        assert collection.count_documents.call_args.kwargs["limit"] == 2
+        collection.find.return_value.limit.assert_called_once_with(2)
+
+    def test_count_zero_preview_is_capped(self, database_manager, manager, mocker):
+        """Test that the cleanup preview lists a few documents even with count 0."""
+        get_documents = mocker.patch.object(
+            manager, "get_documents_to_delete", return_value=[]
+        )
+        mocker.patch.object(manager, "get_collection_stats", return_value={})
+        mocker.patch.object(manager, "count_documents_to_delete", return_value=10)
+        mocker.patch.object(manager, "iter_deletion_id_batches", return_value=iter([]))
+        options = database_manager.CleanupOptions(
+            collection="messages", count=0, force=True
+        )
+
+        manager.cleanup_collection(options)
+
+        preview_options = get_documents.call_args.args[0]
+        assert preview_options.count == database_manager.CLEANUP_PREVIEW_SIZE
+
+
+class TestCleanupHint:
+    """Cleanup indexes are pinned only for the filter shapes they match."""
+
+    @pytest.fixture(autouse=True)
+    def cleanup_indexes(self, collection):
+        """Report both cleanup indexes as present."""
+        collection.index_information.return_value = {
+            "_id_": {},
+            "role_timestamp_idx": {},
+            "timestamp_idx": {},
+        }
+
+    @pytest.mark.parametrize(
+        ("filters", "expected"),
+        [
+            ({"days": 30}, "timestamp_idx"),
+            ({"days": 30, "role": "HUMAN"}, "role_timestamp_idx"),
+            ({"days": 30, "session_id": "session-1"}, None),
+            ({"days": 30, "content_filter": "hello"}, None),
+            ({"role": "HUMAN"}, None),
+            ({}, None),
+        ],
+    )
+    def test_hint_matches_exact_filter_shape(
+        self, database_manager, manager, collection, filters, expected
+    ):
+        """Test that only {timestamp} and {role, timestamp} filters get a hint."""
+        options = database_manager.CleanupOptions(collection="messages", **filters)
+        query = manager.build_filter_query(options)
+
+        assert manager._cleanup_hint(options, query, collection) == expected
@@ -5,6 +5,7 @@ from unittest.mock import AsyncMock, MagicMock
 import pytest
 
 from nexus.core.models import Message, Role, Run
+from nexus.core.topics import Topics
 from nexus.services.context.builder import ContextBuilder
 
 
@@ -198,6 +199,64 @@ class TestContextBuilder:
         assert len(messages) == 5
         assert "[SHARED_MEMORY count=0]" in messages[2]["content"]
 
+    @pytest.mark.asyncio
+    async def test_build_context_reuses_capabilities_across_turns(
+        self, builder, mock_persistence_service
+    ):
+        """[CAPABILITIES] is reused across consecutive turns while history grows."""
+        turn_one = [{"id": "msg-1", "role": "human", "content": "Hi", "timestamp": ""}]
+        turn_two = [
+            {"id": "msg-2", "role": "ai", "content": "Hello", "timestamp": ""},
+            *turn_one,
+        ]
+        mock_persistence_service.get_history = AsyncMock(
+            side_effect=[turn_one, turn_two]
+        )
+        format_capabilities = MagicMock(
+            wraps=builder.prompt_manager.get_capabilities_prompt
+        )
+        builder.prompt_manager.get_capabilities_prompt = format_capabilities
+
+        first = await builder.build_context(
+            owner_key="0xABC123", user_profile={}, current_input="One"
+        )
+        second = await builder.build_context(
+            owner_key="0xABC123", user_profile={}, current_input="Two"
+        )
+
+        format_capabilities.assert_called_once()
+        assert second[1] == first[1]
+        assert "Hello" in second[2]["content"]
+        assert "Hello" not in first[2]["content"]
+
+    @pytest.mark.asyncio
+    async def test_handle_build_request_publishes_response_directly(
+        self, builder, mock_bus
+    ):
+        """Context responses skip the topic queue."""
+        run = Run(
+            id="run-123",
+            owner_key="0xABC",
+            history=[
+                Message(
+                    run_id="run-123",
+                    owner_key="0xABC",
+                    role=Role.HUMAN,
+                    content="Hello!",
+                )
+            ],
+        )
+
+        await builder.handle_build_request(
+            Message(run_id=run.id, owner_key="0xABC", role=Role.SYSTEM, content=run)
+        )
+
+        mock_bus.publish.assert_awaited_once()
+        topic, response = mock_bus.publish.call_args[0]
+        assert topic == Topics.CONTEXT_BUILD_RESPONSE
+        assert response.content["status"] == "success"
+        assert mock_bus.publish.call_args.kwargs == {"direct": True}
+
     def test_subscribe_to_bus(self, builder, mock_bus):
         """subscribe_to_bus registers handler."""
         builder.subscribe_to_bus()
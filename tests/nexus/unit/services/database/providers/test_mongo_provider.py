@@ -171,6 +171,32 @@ class TestMongoProvider:
 
         assert result is False
 
+    def test_insert_messages_uses_single_bulk_insert(self):
+        """Test that several messages are written with one insert_many call."""
+        mock_collection = Mock()
+        mock_collection.insert_many.return_value.inserted_ids = ["id_1", "id_2"]
+
+        provider = MongoProvider("mongodb://localhost:27017", "test_db")
+        provider.messages_collection = mock_collection
+
+        messages = [
+            Message(
+                run_id="test_run",
+                owner_key="test_public_key_123",
+                role=role,
+                content=content,
+            )
+            for role, content in [(Role.HUMAN, "Question"), (Role.AI, "Answer")]
+        ]
+
+        result = provider.insert_messages(messages)
+
+        assert result is True
+        mock_collection.insert_one.assert_not_called()
+        documents = mock_collection.insert_many.call_args[0][0]
+        assert [doc["content"] for doc in documents] == ["Question", "Answer"]
+        assert mock_collection.insert_many.call_args[1] == {"ordered": False}
+
     def test_get_messages_success(self, mocker):
         """Test successful message retrieval."""
         # Mock MongoDB collection and cursor
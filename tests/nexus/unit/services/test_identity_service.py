@@ -69,6 +69,76 @@ class TestIdentityService:
             "test_public_key_123"
         )
 
+    @pytest.mark.asyncio
+    async def test_get_identity_served_from_cache(self):
+        """Test repeated get_identity calls within the TTL hit the database once."""
+        mock_provider = Mock()
+        mock_provider.find_identity_by_public_key = Mock(
+            return_value={"public_key": "test_public_key_123", "config_overrides": {}}
+        )
+
+        mock_db_service = Mock()
+        mock_db_service.provider = mock_provider
+
+        service = IdentityService(db_service=mock_db_service)
+
+        first = await service.get_identity("test_public_key_123")
+        first["_just_created"] = True
+        first["config_overrides"]["model"] = "leaked"
+        second = await service.get_identity("test_public_key_123")
+
+        assert second == {"public_key": "test_public_key_123", "config_overrides": {}}
+        mock_provider.find_identity_by_public_key.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_identity_cache_is_bounded_and_skips_misses(self, monkeypatch):
+        """Test that unknown keys are not cached and the cache evicts LRU entries."""
+        monkeypatch.setattr("nexus.services.identity.IDENTITY_CACHE_SIZE", 2)
+        mock_provider = Mock()
+        mock_provider.find_identity_by_public_key = Mock(
+            side_effect=lambda key: None if key == "visitor" else {"public_key": key}
+        )
+
+        mock_db_service = Mock()
+        mock_db_service.provider = mock_provider
+
+        service = IdentityService(db_service=mock_db_service)
+
+        assert await service.get_identity("visitor") is None
+        for key in ("a", "b", "a", "c"):
+            await service.get_identity(key)
+
+        assert list(service._identity_cache) == ["a", "c"]
+
+    @pytest.mark.asyncio
+    async def test_identity_cache_invalidated_on_update(self):
+        """Test that writing overrides forces the next lookup to hit the database."""
+        mock_provider = Mock()
+        mock_provider.find_identity_by_public_key = Mock(
+            side_effect=[
+                {"public_key": "test_public_key_123", "config_overrides": {}},
+                {
+                    "public_key": "test_public_key_123",
+                    "config_overrides": {"model": "deepseek-chat"},
+                },
+            ]
+        )
+        mock_provider.update_identity_field = Mock(return_value=True)
+
+        mock_db_service = Mock()
+        mock_db_service.provider = mock_provider
+
+        service = IdentityService(db_service=mock_db_service)
+
+        await service.get_identity("test_public_key_123")
+        await service.update_user_config(
+            "test_public_key_123", {"model": "deepseek-chat"}
+        )
+        result = await service.get_identity("test_public_key_123")
+
+        assert result["config_overrides"] == {"model": "deepseek-chat"}
+        assert mock_provider.find_identity_by_public_key.call_count == 2
+
     @pytest.mark.asyncio
     async def test_create_identity_success(self):
         """Test create_identity successfully creates a new identity with overrides fields."""
@@ -275,7 +345,10 @@ class TestIdentityService:
                     "max_tokens": 4096,
                 },
                 "prompts": {
-                    "friends_profile": {"content": "Default profile...", "editable": True},
+                    "friends_profile": {
+                        "content": "Default profile...",
+                        "editable": True,
+                    },
                 },
             }
         )
@@ -0,0 +1,38 @@
+"""
+Unit tests for the debugging test_tool.
+
+The simulated execution time is monkeypatched to zero so the tests run
+without sleeping; the random outcome is pinned through SUCCESS_PROBABILITY.
+"""
+
+import pytest
+
+from nexus.tools.definition import test as tool_module
+
+
+@pytest.fixture(autouse=True)
+def no_execution_time(monkeypatch):
+    """Drop the simulated execution time so the tool returns at once."""
+    monkeypatch.setattr(tool_module, "MIN_EXECUTION_TIME", 0.0)
+    monkeypatch.setattr(tool_module, "MAX_EXECUTION_TIME", 0.0)
+
+
+class TestTestTool:
+    """Test suite for the sync and coroutine test_tool variants."""
+
+    def test_sync_variant_succeeds(self, monkeypatch):
+        """Test that the sync variant reports success with the message."""
+        monkeypatch.setattr(tool_module, "SUCCESS_PROBABILITY", 1.0)
+
+        result = tool_module.test_tool("ping")
+
+        assert "Message: ping" in result
+        assert "Status: SUCCESS" in result
+
+    @pytest.mark.asyncio
+    async def test_async_variant_fails(self, monkeypatch):
+        """Test that the coroutine variant raises when the run fails."""
+        monkeypatch.setattr(tool_module, "SUCCESS_PROBABILITY", 0.0)
+
+        with pytest.raises(RuntimeError, match="Status: FAILED"):
+            await tool_module.test_tool_async("ping")
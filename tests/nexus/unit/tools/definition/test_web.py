@@ -6,20 +6,36 @@ result formatting, and error handling. All external dependencies are mocked
 to ensure isolation.
 """
 
+import asyncio
 import os
-from unittest.mock import Mock
+from unittest.mock import AsyncMock, Mock
 
 import pytest
 
+from nexus.tools.definition import web
 from nexus.tools.definition.web import (
     WEB_EXTRACT_TOOL,
     WEB_SEARCH_TOOL,
     _format_search_results,
     web_extract,
+    web_extract_async,
     web_search,
+    web_search_async,
 )
 
 
+@pytest.fixture(autouse=True)
+def reset_tavily_client():
+    """Drop the shared Tavily client so each test sees its own mock."""
+    web._client = None
+    web._async_client = None
+    yield
+    web._client = None
+    web._async_client = None
+    # Tests patch TAVILY_API_KEY; re-read it once the environment is restored
+    web.reload_api_key()
+
+
 class TestWebSearchTool:
     """Test suite for web_search tool functionality."""
 
@@ -145,6 +161,7 @@ class TestWebSearchTool:
         """Test that web_search raises ValueError when API key is missing."""
         # Remove the environment variable
         monkeypatch.delenv("TAVILY_API_KEY", raising=False)
+        web.reload_api_key()
 
         with pytest.raises(
             ValueError, match="TAVILY_API_KEY environment variable not set"
@@ -155,6 +172,7 @@ class TestWebSearchTool:
         """Test successful web search with valid API key."""
         # Set the environment variable
         monkeypatch.setenv("TAVILY_API_KEY", "test_api_key")
+        web.reload_api_key()
 
         # Mock TavilyClient
         mock_client = Mock()
@@ -190,6 +208,7 @@ class TestWebSearchTool:
         """Test that web_search handles API errors correctly."""
         # Set the environment variable
         monkeypatch.setenv("TAVILY_API_KEY", "test_api_key")
+        web.reload_api_key()
 
         # Mock TavilyClient to raise an exception
         mock_client = Mock()
@@ -305,8 +324,10 @@ class TestWebSearchTool:
         """Test various scenarios where API key is missing or invalid."""
         if api_key_value is None:
             monkeypatch.delenv("TAVILY_API_KEY", raising=False)
+            web.reload_api_key()
         else:
             monkeypatch.setenv("TAVILY_API_KEY", api_key_value)
+            web.reload_api_key()
 
         with pytest.raises(
             ValueError, match="TAVILY_API_KEY environment variable not set"
@@ -317,6 +338,7 @@ class TestWebSearchTool:
         """Test using monkeypatch to temporarily set environment variable."""
         # Mock the environment variable using monkeypatch
         mocker.patch.dict(os.environ, {"TAVILY_API_KEY": "monkeypatch_test_key"})
+        web.reload_api_key()
 
         # Mock TavilyClient
         mock_client = Mock()
@@ -342,6 +364,27 @@ class TestWebSearchTool:
         mock_tavily_client_class.assert_called_once_with(api_key="monkeypatch_test_key")
         assert "Monkeypatch Test" in result
 
+    def test_web_tools_share_client_per_api_key(self, monkeypatch, mocker):
+        """Test that the Tavily client is reused until the API key changes."""
+        monkeypatch.setenv("TAVILY_API_KEY", "key_one")
+        web.reload_api_key()
+        mock_tavily_client_class = mocker.patch(
+            "nexus.tools.definition.web.TavilyClient"
+        )
+        mock_tavily_client_class.return_value.search.return_value = {"results": []}
+        mock_tavily_client_class.return_value.extract.return_value = {}
+
+        web_search("first")
+        web_search("second")
+        web_extract("https://example.com")
+        mock_tavily_client_class.assert_called_once_with(api_key="key_one")
+
+        monkeypatch.setenv("TAVILY_API_KEY", "key_two")
+        web.reload_api_key()
+        web_search("third")
+        assert mock_tavily_client_class.call_count == 2
+        mock_tavily_client_class.assert_called_with(api_key="key_two")
+
 
 class TestWebExtractTool:
     """Test suite for web_extract tool functionality."""
@@ -350,6 +393,7 @@ class TestWebExtractTool:
         """Test that web_extract raises ValueError when API key is missing."""
         # Remove the environment variable
         monkeypatch.delenv("TAVILY_API_KEY", raising=False)
+        web.reload_api_key()
 
         with pytest.raises(
             ValueError, match="TAVILY_API_KEY environment variable not set"
@@ -360,6 +404,7 @@ class TestWebExtractTool:
         """Test successful web extract with valid API key."""
         # Set the environment variable
         monkeypatch.setenv("TAVILY_API_KEY", "test_api_key")
+        web.reload_api_key()
 
         # Mock TavilyClient
         mock_client = Mock()
@@ -400,6 +445,7 @@ class TestWebExtractTool:
         """Test web extract with multiple URLs."""
         # Set the environment variable
         monkeypatch.setenv("TAVILY_API_KEY", "test_api_key")
+        web.reload_api_key()
 
         # Mock TavilyClient
         mock_client = Mock()
@@ -445,6 +491,7 @@ class TestWebExtractTool:
         """Test that web_extract handles API errors correctly."""
         # Set the environment variable
         monkeypatch.setenv("TAVILY_API_KEY", "test_api_key")
+        web.reload_api_key()
 
         # Mock TavilyClient to raise an exception
         mock_client = Mock()
@@ -464,6 +511,7 @@ class TestWebExtractTool:
         """Test web extract when some URLs fail to extract."""
         # Set the environment variable
         monkeypatch.setenv("TAVILY_API_KEY", "test_api_key")
+        web.reload_api_key()
 
         # Mock TavilyClient
         mock_client = Mock()
@@ -525,6 +573,7 @@ class TestEnhancedWebSearchTool:
         """Test web_search with max_results parameter."""
         # Set the environment variable
         monkeypatch.setenv("TAVILY_API_KEY", "test_api_key")
+        web.reload_api_key()
 
         # Mock TavilyClient
         mock_client = Mock()
@@ -554,6 +603,7 @@ class TestEnhancedWebSearchTool:
         """Test web_search with include_answer=True."""
         # Set the environment variable
         monkeypatch.setenv("TAVILY_API_KEY", "test_api_key")
+        web.reload_api_key()
 
         # Mock TavilyClient
         mock_client = Mock()
@@ -587,6 +637,7 @@ class TestEnhancedWebSearchTool:
         """Test web_search with include_answer=False."""
         # Set the environment variable
         monkeypatch.setenv("TAVILY_API_KEY", "test_api_key")
+        web.reload_api_key()
 
         # Mock TavilyClient
         mock_client = Mock()
@@ -617,6 +668,7 @@ class TestEnhancedWebSearchTool:
         """Test web_search when API response doesn't include answer field."""
         # Set the environment variable
         monkeypatch.setenv("TAVILY_API_KEY", "test_api_key")
+        web.reload_api_key()
 
         # Mock TavilyClient
         mock_client = Mock()
@@ -647,6 +699,7 @@ class TestEnhancedWebSearchTool:
         """Test web_search with both max_results and include_answer parameters."""
         # Set the environment variable
         monkeypatch.setenv("TAVILY_API_KEY", "test_api_key")
+        web.reload_api_key()
 
         # Mock TavilyClient
         mock_client = Mock()
@@ -687,6 +740,7 @@ class TestEnhancedWebSearchTool:
         """Test web_search max_results parameter validation."""
         # Set the environment variable
         monkeypatch.setenv("TAVILY_API_KEY", "test_api_key")
+        web.reload_api_key()
 
         mock_tavily_client_class = mocker.patch(
             "nexus.tools.definition.web.TavilyClient"
@@ -704,6 +758,7 @@ class TestEnhancedWebSearchTool:
         """Test web_search with default parameter values."""
         # Set the environment variable
         monkeypatch.setenv("TAVILY_API_KEY", "test_api_key")
+        web.reload_api_key()
 
         # Mock TavilyClient
         mock_client = Mock()
@@ -728,3 +783,121 @@ class TestEnhancedWebSearchTool:
 
         # Verify search was called with default max_results (5)
         mock_client.search.assert_called_once_with("test query", max_results=5)
+
+
+class TestAsyncWebTools:
+    """Test suite for the coroutine variants of the web tools."""
+
+    @pytest.mark.asyncio
+    async def test_web_search_async_uses_shared_async_client(self, monkeypatch, mocker):
+        """Test that web_search_async awaits a reused AsyncTavilyClient."""
+        monkeypatch.setenv("TAVILY_API_KEY", "test_api_key")
+        web.reload_api_key()
+        mock_client_class = mocker.patch("nexus.tools.definition.web.AsyncTavilyClient")
+        mock_client_class.return_value.search = AsyncMock(
+            return_value={
+                "results": [
+                    {
+                        "title": "Async Result",
+                        "url": "https://example.com/async",
+                        "content": "Fetched without a thread",
+                    }
+                ]
+            }
+        )
+
+        first = await web_search_async("async query", max_results=3)
+        await web_search_async("another query")
+
+        assert "Async Result" in first
+        mock_client_class.assert_called_once_with(api_key="test_api_key")
+        mock_client_class.return_value.search.assert_any_await(
+            "async query", max_results=3
+        )
+
+    @pytest.mark.asyncio
+    async def test_web_search_async_coalesces_identical_queries(
+        self, monkeypatch, mocker
+    ):
+        """Test that concurrent identical searches share one upstream request."""
+        monkeypatch.setenv("TAVILY_API_KEY", "test_api_key")
+        web.reload_api_key()
+        mock_client_class = mocker.patch("nexus.tools.definition.web.AsyncTavilyClient")
+
+        async def slow_search(query, max_results):
+            await asyncio.sleep(0.01)
+            return {"results": [{"title": query, "url": "u", "content": "c"}]}
+
+        mock_search = AsyncMock(side_effect=slow_search)
+        mock_client_class.return_value.search = mock_search
+
+        results = await asyncio.gather(
+            web_search_async("same query"),
+            web_search_async("same query", include_answer=True),
+            web_search_async("same query"),
+            web_search_async("other query"),
+        )
+
+        assert mock_search.await_count == 2
+        assert all("same query" in result for result in results[:3])
+        assert "other query" in results[3]
+        assert web._inflight_searches == {}
+
+        # Once the first search completes, a new call goes upstream again
+        await web_search_async("same query")
+        assert mock_search.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_web_extract_async_formats_results(self, monkeypatch, mocker):
+        """Test that web_extract_async wraps a single URL and formats results."""
+        monkeypatch.setenv("TAVILY_API_KEY", "test_api_key")
+        web.reload_api_key()
+        mock_client_class = mocker.patch("nexus.tools.definition.web.AsyncTavilyClient")
+        mock_client_class.return_value.extract = AsyncMock(
+            return_value={
+                "results": [{"url": "https://example.com", "raw_content": "Page text"}]
+            }
+        )
+
+        result = await web_extract_async("https://example.com")
+
+        assert "Page text" in result
+        mock_client_class.return_value.extract.assert_awaited_once_with(
+            ["https://example.com"], extract_depth="basic", include_images=False
+        )
+
+    @pytest.mark.asyncio
+    async def test_web_search_async_raises_error_if_api_key_missing(self, monkeypatch):
+        """Test that web_search_async raises ValueError without an API key."""
+        monkeypatch.delenv("TAVILY_API_KEY", raising=False)
+        web.reload_api_key()
+
+        with pytest.raises(
+            ValueError, match="TAVILY_API_KEY environment variable not set"
+        ):
+            await web_search_async("test query")
+
+    @pytest.mark.asyncio
+    async def test_web_extract_async_offloads_large_formatting(
+        self, monkeypatch, mocker
+    ):
+        """Test that formatting of large extracted pages runs in a worker thread."""
+        monkeypatch.setenv("TAVILY_API_KEY", "test_api_key")
+        web.reload_api_key()
+        monkeypatch.setattr(web, "EXTRACT_FORMAT_OFFLOAD_THRESHOLD", 10)
+        mock_client_class = mocker.patch("nexus.tools.definition.web.AsyncTavilyClient")
+        mock_client_class.return_value.extract = AsyncMock(
+            return_value={
+                "results": [{"url": "https://example.com", "raw_content": "A" * 50}]
+            }
+        )
+        to_thread = mocker.patch(
+            "nexus.tools.definition.web.asyncio.to_thread",
+            AsyncMock(return_value="formatted"),
+        )
+
+        result = await web_extract_async("https://example.com")
+
+        assert result == "formatted"
+        to_thread.assert_awaited_once()
+        assert to_thread.call_args[0][0] is web._format_extract_results
@@ -6,11 +6,16 @@ discovery, and management functionality. All external dependencies are mocked
 to ensure isolation.
 """
 
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from types import ModuleType
 from unittest.mock import Mock, patch
 
 import pytest
 
-from nexus.tools.registry import ToolRegistry
+from nexus.tools import registry as registry_module
+from nexus.tools.registry import ToolRegistry, get_default_registry
 
 
 class TestToolRegistry:
@@ -20,8 +25,7 @@ class TestToolRegistry:
         """Test that ToolRegistry initializes with empty containers."""
         registry = ToolRegistry()
 
-        assert registry._tools == {}
-        assert registry._functions == {}
+        assert registry._entries == {}
 
     def test_register_success(self):
         """Test successful tool registration."""
@@ -47,10 +51,9 @@ class TestToolRegistry:
         registry.register(tool_definition, test_function)
 
         # Verify tool was registered
-        assert "test_tool" in registry._tools
-        assert "test_tool" in registry._functions
-        assert registry._tools["test_tool"] == tool_definition
-        assert registry._functions["test_tool"] == test_function
+        assert "test_tool" in registry._entries
+        assert registry._entries["test_tool"].definition == tool_definition
+        assert registry._entries["test_tool"].function == test_function
 
     def test_register_overwrites_existing_tool(self):
         """Test that registering an existing tool overwrites it."""
@@ -86,8 +89,8 @@ class TestToolRegistry:
         registry.register(tool_definition2, test_function2)
 
         # Verify tool was overwritten
-        assert registry._tools["test_tool"] == tool_definition2
-        assert registry._functions["test_tool"] == test_function2
+        assert registry._entries["test_tool"].definition == tool_definition2
+        assert registry._entries["test_tool"].function == test_function2
 
     def test_register_invalid_tool_definition(self):
         """Test that registering invalid tool definition raises ValueError."""
@@ -110,6 +113,20 @@ class TestToolRegistry:
         ):
             registry.register(invalid_definition, test_function)
 
+    @pytest.mark.parametrize(
+        "invalid_definition",
+        [{}, {"function": "web_search"}, {"function": {"name": ""}}],
+    )
+    def test_register_rejects_malformed_definition(self, invalid_definition):
+        """Test that malformed definitions raise ValueError and register nothing."""
+        registry = ToolRegistry()
+
+        with pytest.raises(
+            ValueError, match="Invalid tool definition: missing function.name"
+        ):
+            registry.register(invalid_definition, Mock())
+        assert registry.list_tool_names() == []
+
     def test_get_tool_definition_found(self):
         """Test getting an existing tool definition."""
         registry = ToolRegistry()
@@ -158,6 +175,89 @@ class TestToolRegistry:
         result = registry.get_tool_function("nonexistent_tool")
         assert result is None
 
+    @pytest.mark.asyncio
+    async def test_get_tool_dispatcher_selects_call_strategy(self):
+        """Test that dispatchers await coroutines and thread sync functions."""
+        registry = ToolRegistry()
+
+        async def async_tool(value: int) -> int:
+            return value + 1
+
+        def sync_tool(value: int) -> int:
+            return value * 2
+
+        for name, function in (("async_tool", async_tool), ("sync_tool", sync_tool)):
+            registry.register(
+                {"type": "function", "function": {"name": name}}, function
+            )
+
+        with patch("asyncio.to_thread", wraps=asyncio.to_thread) as to_thread:
+            assert await registry.get_tool_dispatcher("async_tool")({"value": 1}) == 2
+            to_thread.assert_not_called()
+            assert await registry.get_tool_dispatcher("sync_tool")({"value": 3}) == 6
+            to_thread.assert_called_once()
+
+        registry.unregister("sync_tool")
+        assert registry.get_tool_dispatcher("sync_tool") is None
+
+    @pytest.mark.asyncio
+    async def test_set_executor_routes_sync_tools(self):
+        """Test that sync tools run on the configured executor once set."""
+        registry = ToolRegistry()
+        registry.register(
+            {"type": "function", "function": {"name": "thread_name"}},
+            lambda: threading.current_thread().name,
+        )
+
+        with ThreadPoolExecutor(thread_name_prefix="test-tool-pool") as pool:
+            registry.set_executor(pool)
+            result = await registry.get_tool_dispatcher("thread_name")({})
+
+        assert result.startswith("test-tool-pool")
+
+    def test_tool_listings_refresh_after_registration_changes(self):
+        """Test that cached definitions and names follow register/unregister."""
+        registry = ToolRegistry()
+        first = {"type": "function", "function": {"name": "first"}}
+        second = {"type": "function", "function": {"name": "second"}}
+        registry.register(first, Mock())
+
+        definitions = registry.get_all_tool_definitions()
+        assert definitions == [first]
+        assert registry.list_tool_names() == ["first"]
+
+        # Callers get their own list, so mutating it leaves the cache intact
+        definitions.append(second)
+        assert registry.get_all_tool_definitions() == [first]
+
+        registry.register(second, Mock())
+        assert registry.get_all_tool_definitions() == [first, second]
+        assert registry.list_tool_names() == ["first", "second"]
+
+        registry.unregister("first")
+        assert registry.get_all_tool_definitions() == [second]
+        assert registry.list_tool_names() == ["second"]
+
+    def test_freeze_makes_registry_read_only(self):
+        """Test that a frozen registry serves lookups but refuses changes."""
+        registry = ToolRegistry()
+        definition = {"type": "function", "function": {"name": "frozen_tool"}}
+        registry.register(definition, Mock())
+
+        registry.freeze()
+
+        assert registry.get_all_tool_definitions() == [definition]
+        assert registry.list_tool_names() == ["frozen_tool"]
+        with pytest.raises(RuntimeError, match="frozen"):
+            registry.register(
+                {"type": "function", "function": {"name": "late_tool"}}, Mock()
+            )
+        with pytest.raises(RuntimeError, match="frozen"):
+            registry.unregister("frozen_tool")
+        with pytest.raises(RuntimeError, match="frozen"):
+            registry.set_executor(None)
+        assert registry.is_tool_registered("frozen_tool")
+
     def test_get_all_tool_definitions(self):
         """Test getting all registered tool definitions."""
         registry = ToolRegistry()
@@ -257,8 +357,7 @@ class TestToolRegistry:
 
         assert result is True
         assert not registry.is_tool_registered("test_tool")
-        assert "test_tool" not in registry._tools
-        assert "test_tool" not in registry._functions
+        assert "test_tool" not in registry._entries
 
     def test_unregister_nonexistent_tool(self):
         """Test unregistering a non-existent tool."""
@@ -291,9 +390,10 @@ class TestToolRegistry:
 
         mock_module = MockModule()
 
-        # Mock importlib.import_module and pkgutil.iter_modules
-        mock_import_module = mocker.patch("importlib.import_module")
+        # Mock pkgutil.iter_modules and importlib.import_module; the latter is
+        # patched last because mocker resolves patch targets through it
         mock_iter_modules = mocker.patch("pkgutil.iter_modules")
+        mock_import_module = mocker.patch("importlib.import_module")
 
         # First call returns the package, second call returns the module
         mock_import_module.side_effect = [mock_package, mock_module]
@@ -305,6 +405,90 @@ class TestToolRegistry:
         # Verify tool was discovered and registered
         assert registry.is_tool_registered("discovered_tool")
 
+    def test_discover_and_register_imports_many_modules_in_pool(self, mocker):
+        """Test that discovery with several modules registers every tool."""
+        mock_package = Mock()
+        mock_package.__path__ = ["/test/path"]
+
+        def make_module(name):
+            module = ModuleType(name)
+            module.TOOL_A_TOOL = {"type": "function", "function": {"name": name}}
+            setattr(module, name, Mock(return_value=name))
+            return module
+
+        names = [f"tool_{i}" for i in range(4)]
+        modules = {
+            f"nexus.tools.definition.{name}": make_module(name) for name in names
+        }
+        modules["nexus.tools.definition"] = mock_package
+
+        mocker.patch(
+            "pkgutil.iter_modules",
+            return_value=[(None, name, False) for name in names],
+        )
+        pool_class = mocker.patch(
+            "nexus.tools.registry.ThreadPoolExecutor", wraps=ThreadPoolExecutor
+        )
+        # Patched last: mocker resolves the targets above through import_module
+        mocker.patch("importlib.import_module", side_effect=modules.__getitem__)
+
+        registry = ToolRegistry()
+        registry.discover_and_register("nexus.tools.definition")
+
+        pool_class.assert_called_once_with(max_workers=4)
+        assert registry.list_tool_names() == names
+
+    def test_extract_tool_definitions_uses_manifest(self):
+        """Test that __tools__ limits extraction to the listed definitions."""
+        module = ModuleType("manifest_module")
+        module.LISTED_TOOL = {"type": "function", "function": {"name": "listed"}}
+        module.UNLISTED_TOOL = {"type": "function", "function": {"name": "unlisted"}}
+        module.__tools__ = ("LISTED_TOOL",)
+
+        registry = ToolRegistry()
+
+        assert list(registry._extract_tool_definitions(module)) == ["LISTED_TOOL"]
+        del module.__tools__
+        assert sorted(registry._extract_tool_definitions(module)) == [
+            "LISTED_TOOL",
+            "UNLISTED_TOOL",
+        ]
+
+    def test_discover_skips_definitions_reexported_by_root(self, mocker):
+        """Test that root re-exports of submodule tools do not re-register them."""
+        tool_module = ModuleType("nexus.tools.definition.shared")
+        tool_module.SHARED_TOOL = {"type": "function", "function": {"name": "shared"}}
+        tool_module.shared = Mock(return_value="shared")
+
+        root_package = ModuleType("nexus.tools.definition")
+        root_package.__path__ = ["/test/path"]
+        root_package.SHARED_TOOL = tool_module.SHARED_TOOL
+        root_package.shared = tool_module.shared
+
+        modules = {
+            "nexus.tools.definition": root_package,
+            "nexus.tools.definition.shared": tool_module,
+        }
+        mocker.patch("pkgutil.iter_modules", return_value=[(None, "shared", False)])
+        register = mocker.spy(ToolRegistry, "_register_validated")
+        mocker.patch("importlib.import_module", side_effect=modules.__getitem__)
+
+        registry = ToolRegistry()
+        registry.discover_and_register("nexus.tools.definition")
+
+        assert registry.list_tool_names() == ["shared"]
+        register.assert_called_once()
+
+    def test_discover_prefers_native_async_variant(self):
+        """Test that a <name>_async coroutine is registered under the tool name."""
+        from nexus.tools.definition import web
+
+        registry = ToolRegistry()
+        registry.discover_and_register("nexus.tools.definition.web")
+
+        assert registry.get_tool_function("web_search") is web.web_search_async
+        assert registry.get_tool_function("web_extract") is web.web_extract_async
+
     def test_discover_and_register_handles_import_error(self, mocker):
         """Test that tool discovery handles import errors gracefully."""
         # Mock package discovery
@@ -427,7 +611,7 @@ class TestToolRegistry:
         }
 
         # Mock hasattr to return False for the function
-        mocker.patch.object(registry, "register")
+        mocker.patch.object(ToolRegistry, "_register_validated")
         mocker.patch("builtins.hasattr", return_value=False)
 
         # Should not raise an exception, but should log a warning
@@ -436,7 +620,7 @@ class TestToolRegistry:
         )
 
         # Verify register was not called
-        registry.register.assert_not_called()
+        registry._register_validated.assert_not_called()
 
     def test_register_tool_from_definition_non_callable_function(self, mocker):
         """Test registration when function exists but is not callable."""
@@ -455,7 +639,7 @@ class TestToolRegistry:
         }
 
         # Mock hasattr to return True, but the attribute is not callable
-        mocker.patch.object(registry, "register")
+        mocker.patch.object(ToolRegistry, "_register_validated")
 
         with patch("builtins.hasattr", return_value=True):
             registry._register_tool_from_definition(
@@ -463,4 +647,18 @@ class TestToolRegistry:
             )
 
         # Verify register was not called
-        registry.register.assert_not_called()
+        registry._register_validated.assert_not_called()
+
+    def test_get_default_registry_discovers_once(self, monkeypatch, mocker):
+        """Test that the shared registry is discovered once and frozen."""
+        monkeypatch.setattr(registry_module, "_default_registry", None)
+        discover = mocker.spy(ToolRegistry, "discover_and_register")
+
+        first = get_default_registry()
+        second = get_default_registry()
+
+        assert first is second
+        discover.assert_called_once_with(first, "nexus.tools.definition")
+        assert "web_search" in first.list_tool_names()
+        with pytest.raises(RuntimeError, match="frozen"):
+            first.unregister("web_search")